@@ -17,6 +17,7 @@ import array
 import fcntl
 import struct
 import sys
+import threading
 
 SPICOMM_DEV = '/dev/vision_spicomm'
 
@@ -26,6 +27,7 @@ SPICOMM_IOCTL_TRANSACT = 0xc0100000 + SPICOMM_IOCTL_BASE + 3
 
 HEADER_SIZE = 16
 PAYLOAD_SIZE = 12 * 1024 * 1024  # 12 M
+INITIAL_BUFFER_SIZE = 64 * 1024  # Fits camera inference results.
 
 FLAG_ERROR = 1 << 0
 FLAG_TIMEOUT = 1 << 1
@@ -64,6 +66,44 @@ class SpicommInternalError(SpicommError):
     pass
 
 
+def _grown_size(size):
+    """Returns power of two buffer size >= size, at most max buffer size."""
+    grown = INITIAL_BUFFER_SIZE
+    while grown < size:
+        grown *= 2
+    return min(grown, HEADER_SIZE + PAYLOAD_SIZE)
+
+
+class BufferPool(object):
+    """Transaction buffers shared by Spicomm instances.
+
+    Buffers start at INITIAL_BUFFER_SIZE and only grow when a transaction
+    needs more, up to HEADER_SIZE + PAYLOAD_SIZE. At most max_buffers exist
+    at a time, acquire() waits for a free one, so several Spicomm instances
+    in one process can share a single buffer instead of reserving 12 MB each.
+    """
+
+    def __init__(self, max_buffers=1):
+        self._semaphore = threading.Semaphore(max_buffers)
+        self._lock = threading.Lock()
+        self._free = []
+
+    def acquire(self, size):
+        """Returns buffer of at least size bytes, waits if none is free."""
+        self._semaphore.acquire()
+        with self._lock:
+            buf = self._free.pop() if self._free else None
+        if buf is None or len(buf) < size:
+            buf = bytearray(_grown_size(size))
+        return buf
+
+    def release(self, buf):
+        """Returns buffer obtained from acquire() to the pool."""
+        with self._lock:
+            self._free.append(buf)
+        self._semaphore.release()
+
+
 class Spicomm(object):
     """VisionBonnet Spicomm wrapper.
 
@@ -73,14 +113,19 @@ class Spicomm(object):
     point of view. Multiple threads and processes can access the device
     node concurrently using one Spicomm instance per thread.
     Transactions are serialized in the underlying kernel driver.
+
+    Transaction buffer is taken from a BufferPool for the duration of each
+    transaction. Instances can share a pool to save memory.
     """
 
-    def __init__(self):
+    def __init__(self, pool=None):
         try:
             self._dev = open(SPICOMM_DEV, 'r+b', 0)
         except (IOError, OSError):
             raise SpicommDevNotFoundError
-        self._tbuf = bytearray(HEADER_SIZE + PAYLOAD_SIZE)
+        self._pool = pool or BufferPool()
+        self._tbuf = None
+        self._view = None
 
     def __enter__(self):
         return self
@@ -89,6 +134,7 @@ class Spicomm(object):
         self.close()
 
     def close(self):
+        self.release()
         if self._dev:
             self._dev.close()
 
@@ -111,28 +157,97 @@ class Spicomm(object):
           SpicommTimeoutError : Transaction timed out.
           SpicommInternalError: Unexpected error interacting with kernel driver.
         """
+        payload_len = self._transact(request, timeout)
+        try:
+            return self._tbuf[HEADER_SIZE:HEADER_SIZE + payload_len]
+        finally:
+            self._release_buffer()
+
+    def transact_view(self, request, timeout=15):
+        """Execute a Spicomm transaction without copying the response.
+
+        Same as transact, but the response is returned as a memoryview into
+        the transaction buffer. The view is leased to the caller: it must be
+        given back with release() before the next transaction, which would
+        otherwise overwrite it. Accessing the view after release() raises
+        ValueError.
+
+        Args:
+          request: Request bytes (or any bytes-like object) to send.
+          timeout: How long a response will be waited for, in seconds.
+
+        Returns:
+          memoryview with response data.
+
+        Raises:
+          Same as transact.
+        """
+        payload_len = self._transact(request, timeout)
+        self._view = memoryview(self._tbuf)[HEADER_SIZE:HEADER_SIZE + payload_len]
+        return self._view
+
+    def release(self):
+        """Releases the view returned by transact_view."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._release_buffer()
+
+    def _release_buffer(self):
+        self._pool.release(self._tbuf)
+        self._tbuf = None
+
+    def _transact(self, request, timeout):
+        """Runs transaction, response is left in self._tbuf.
+
+        Transaction buffer is grown and the transaction retried once if the
+        response doesn't fit. Caller must call _release_buffer when done with
+        the response.
+
+        Returns:
+          Response length in bytes.
+        """
+        if self._view is not None:
+            raise SpicommError('Previous response view was not released.')
 
         payload_len = len(request)
         if payload_len > PAYLOAD_SIZE:
             raise SpicommOverflowError(PAYLOAD_SIZE)
 
-        # Fill in transaction buffer.
-        self._tbuf[0:4] = struct.pack('I', 0)  # flags, not currently used.
-        self._tbuf[4:8] = struct.pack('I', int(timeout * 1000))  # timeout, ms.
-        self._tbuf[8:12] = struct.pack('I', len(self._tbuf))  # total buffer size.
-        self._tbuf[12:16] = struct.pack('I', payload_len)  # filled range of buffer.
-        self._tbuf[16:16 + payload_len] = request
+        tbuf = self._pool.acquire(HEADER_SIZE + payload_len)
+        try:
+            try:
+                payload_len = self._ioctl(tbuf, request, timeout)
+            except SpicommOverflowError as e:
+                if e.size > PAYLOAD_SIZE or len(tbuf) >= HEADER_SIZE + e.size:
+                    raise
+                tbuf = bytearray(_grown_size(HEADER_SIZE + e.size))
+                payload_len = self._ioctl(tbuf, request, timeout)
+        except BaseException:
+            self._pool.release(tbuf)
+            raise
+        self._tbuf = tbuf
+        return payload_len
+
+    def _ioctl(self, tbuf, request, timeout):
+        payload_len = len(request)
+
+        # Fill in transaction buffer: flags (not currently used), timeout in
+        # ms, total buffer size and filled range of buffer.
+        struct.pack_into('IIII', tbuf, 0, 0, int(timeout * 1000), len(tbuf),
+                         payload_len)
+        tbuf[HEADER_SIZE:HEADER_SIZE + payload_len] = request
 
         try:
             # Send transaction to kernel driver.
-            fcntl.ioctl(self._dev, SPICOMM_IOCTL_TRANSACT, self._tbuf)
+            fcntl.ioctl(self._dev, SPICOMM_IOCTL_TRANSACT, tbuf)
 
-            # No exception means errno 0 and self._tbuf is now mutated.
-            _, _, _, payload_len = struct.unpack('IIII', self._tbuf[0:16])
-            return self._tbuf[16:16 + payload_len]
+            # No exception means errno 0 and tbuf is now mutated.
+            _, _, _, payload_len = struct.unpack_from('IIII', tbuf, 0)
+            return payload_len
         except (IOError, OSError):
             # FLAG_ERROR is set if we actually talked to the kernel.
-            flags, _, _, payload_len = struct.unpack('IIII', self._tbuf[0:16])
+            flags, _, _, payload_len = struct.unpack_from('IIII', tbuf, 0)
             if flags & FLAG_ERROR:
                 if flags & FLAG_TIMEOUT:
                     raise SpicommTimeoutError
@@ -14,6 +14,7 @@
 
 """Transport to communicate with VisionBonnet board."""
 
+import contextlib
 import logging
 import os
 import socket
@@ -22,59 +23,113 @@ import struct
 from aiy._drivers import _spicomm
 
 
+# Transaction buffers shared by all SPI transports in this process.
+_SPI_BUFFER_POOL = _spicomm.BufferPool(max_buffers=2)
+
+
 class _SpiTransport(object):
     """Communicate with VisionBonnet over SPI bus."""
 
     def __init__(self):
-        self._spicomm = _spicomm.Spicomm()
+        self._spicomm = _spicomm.Spicomm(_SPI_BUFFER_POOL)
 
     # TODO(dkovalev): add timeout when implemented in Spicomm
     def send(self, request):
         return self._spicomm.transact(request)
 
-    def close(self):
-        self._spicomm.close()
+    @contextlib.contextmanager
+    def lease(self, request):
+        """Sends request, response is only valid inside the with block.
 
+        Response is a memoryview into the transaction buffer, no copy is made.
+        """
+        try:
+            yield self._spicomm.transact_view(request)
+        finally:
+            self._spicomm.release()
 
-def _socket_recvall(s, size):
-    buf = b''
-    while size:
-        newbuf = s.recv(size)
-        if not newbuf:
-            return None
-        buf += newbuf
-        size -= len(newbuf)
-    return buf
+    def close(self):
+        self._spicomm.close()
 
 
-def _socket_receive_message(s):
-    buf = _socket_recvall(s, 4)  # 4 bytes
-    if not buf:
-        return None
-    size = struct.unpack('!I', buf)[0]
-    return _socket_recvall(s, size)
+def _socket_recvall_into(s, view):
+    """Fills view with data from socket, returns False if connection closed."""
+    while view:
+        size = s.recv_into(view)
+        if not size:
+            return False
+        view = view[size:]
+    return True
 
 
 def _socket_send_message(s, msg):
-    s.sendall(struct.pack('!I', len(msg)))  # 4 bytes
-    s.sendall(msg)  # len(msg) bytes
+    """Sends 4 bytes size header and msg in one system call when possible."""
+    buffers = [memoryview(struct.pack('!I', len(msg))), memoryview(msg)]
+    if not hasattr(s, 'sendmsg'):
+        s.sendall(b''.join(buffers))
+        return
+    while buffers:
+        size = s.sendmsg(buffers)
+        while buffers and size >= len(buffers[0]):
+            size -= len(buffers[0])
+            buffers.pop(0)
+        if buffers:
+            buffers[0] = buffers[0][size:]
 
 
 class _SocketTransport(object):
-    """Communicate with VisionBonnet over socket."""
+    """Communicate with VisionBonnet over socket.
+
+    Responses are received into a buffer which is reused between requests and
+    only grows when a larger response arrives.
+    """
+
+    def __init__(self, host=None, port=None, timeout=None):
+        """Open connection to the bonnet.
+
+        Args:
+          host: string, defaults to VISION_BONNET_HOST environment variable.
+          port: int, defaults to VISION_BONNET_PORT environment variable.
+          timeout: float, socket timeout in seconds, defaults to
+            VISION_BONNET_TIMEOUT environment variable or no timeout.
+        """
+        host = host or os.environ.get('VISION_BONNET_HOST', '172.28.28.10')
+        port = port or int(os.environ.get('VISION_BONNET_PORT', '35000'))
+        if timeout is None and 'VISION_BONNET_TIMEOUT' in os.environ:
+            timeout = float(os.environ['VISION_BONNET_TIMEOUT'])
+
+        self._client = socket.create_connection((host, port), timeout)
+        self._client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._header = bytearray(4)
+        self._buffer = bytearray(64 * 1024)
+
+    def _receive(self):
+        if not _socket_recvall_into(self._client, memoryview(self._header)):
+            raise IOError('Connection closed by VisionBonnet.')
+        size = struct.unpack('!I', self._header)[0]
+        if size > len(self._buffer):
+            self._buffer = bytearray(size)
+        view = memoryview(self._buffer)[:size]
+        if not _socket_recvall_into(self._client, view):
+            raise IOError('Connection closed by VisionBonnet.')
+        return view
 
-    def __init__(self):
-        """Open connection to the bonnet."""
-        self._client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    def send(self, request):
+        with self.lease(request) as response:
+            return response.tobytes()
 
-        host = os.environ.get('VISION_BONNET_HOST', '172.28.28.10')
-        port = int(os.environ.get('VISION_BONNET_PORT', '35000'))
-        self._client.connect((host, port))
+    @contextlib.contextmanager
+    def lease(self, request):
+        """Sends request, response is only valid inside the with block.
 
-    # TODO(dkovalev,weiranzhao): add timeout parameter
-    def send(self, request):
+        Response is a memoryview into the receive buffer, no copy is made.
+        """
         _socket_send_message(self._client, request)
-        return _socket_receive_message(self._client)
+        response = self._receive()
+        try:
+            yield response
+        finally:
+            response.release()
 
     def close(self):
         self._client.close()
@@ -85,6 +140,10 @@ def _is_arm():
 
 
 def make_transport():
+    if 'VISION_BONNET_REPLAY' in os.environ:
+        from aiy.vision.recording import ReplayTransport
+        return ReplayTransport(os.environ['VISION_BONNET_REPLAY'],
+                               float(os.environ.get('VISION_BONNET_REPLAY_SPEED', '1')))
     if _is_arm():
         return _SpiTransport()
     else:
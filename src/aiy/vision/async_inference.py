@@ -0,0 +1,187 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""asyncio API for VisionBonnet InferenceEngine.
+
+Lets a single event loop drive inference together with buzzer, LEDs, GPIO
+and file I/O instead of running each of them in its own thread. Example:
+
+    async def main():
+        async with AsyncCameraInference(face_detection.model()) as inference:
+            async for result in inference.run():
+                faces = face_detection.get_faces(result)
+                ...
+
+    asyncio.get_event_loop().run_until_complete(main())
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+
+from aiy.vision.inference import InferenceEngine
+
+
+class AsyncInferenceEngine(object):
+    """InferenceEngine with awaitable methods.
+
+    Transport calls (SPI or socket) are blocking, so they run one at a time
+    on a dedicated worker thread, in the order they were requested. Every
+    method below returns an awaitable with the result of the same
+    InferenceEngine method.
+    """
+
+    def __init__(self, loop=None):
+        self._loop = loop
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._engine = InferenceEngine()
+
+    def _run(self, func, *args):
+        loop = self._loop or asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor,
+                                    functools.partial(func, *args))
+
+    def load_model(self, descriptor):
+        return self._run(self._engine.load_model, descriptor)
+
+    def unload_model(self, model_name):
+        return self._run(self._engine.unload_model, model_name)
+
+    def start_camera_inference(self, model_name, params=None, window=None):
+        return self._run(self._engine.start_camera_inference, model_name,
+                         params, window)
+
+    def camera_inference(self):
+        return self._run(self._engine.camera_inference)
+
+    def stop_camera_inference(self):
+        return self._run(self._engine.stop_camera_inference)
+
+    def get_camera_state(self):
+        return self._run(self._engine.get_camera_state)
+
+    def get_firmware_info(self):
+        return self._run(self._engine.get_firmware_info)
+
+    def image_inference(self, model_name, image, params=None, resize=False,
+                        window=None):
+        return self._run(self._engine.image_inference, model_name, image,
+                         params, resize, window)
+
+    async def close(self):
+        await self._run(self._engine.close)
+        self._executor.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.close()
+
+
+class _AsyncResults(object):
+    """Async iterator over camera inference results.
+
+    The next result is requested as soon as the current one is returned, so
+    the transfer overlaps with processing of the current result. The request
+    in flight is kept on the AsyncCameraInference, which waits for it when
+    closed.
+    """
+
+    def __init__(self, inference):
+        self._inference = inference
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        inference = self._inference
+        if inference._pending is None:
+            inference._pending = inference._engine.camera_inference()
+        result = await inference._pending
+        inference._pending = inference._engine.camera_inference()
+        return result
+
+
+class AsyncCameraInference(object):
+    """Helper class to run camera inference from asyncio code.
+
+    Model is loaded and camera inference started in 'async with'.
+    """
+
+    def __init__(self, descriptor, params=None, loop=None, window=None):
+        self._descriptor = descriptor
+        self._params = params
+        self._window = window
+        self._engine = AsyncInferenceEngine(loop)
+        self._key = None
+        self._pending = None  # Prefetched camera_inference result.
+
+    async def start(self):
+        self._key = await self._engine.load_model(self._descriptor)
+        await self._engine.start_camera_inference(self._key, self._params,
+                                                  self._window)
+
+    def camera_state(self):
+        return self._engine.get_camera_state()
+
+    def run(self):
+        """Returns async iterator over inference results."""
+        return _AsyncResults(self)
+
+    async def close(self):
+        pending, self._pending = self._pending, None
+        if pending is not None and not pending.cancelled():
+            try:
+                await pending  # Nobody is waiting for this result anymore.
+            except Exception:
+                pass
+        if self._key is not None:
+            await self._engine.stop_camera_inference()
+            await self._engine.unload_model(self._key)
+        await self._engine.close()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.close()
+
+
+class AsyncImageInference(object):
+    """Helper class to run image inference from asyncio code."""
+
+    def __init__(self, descriptor, loop=None):
+        self._descriptor = descriptor
+        self._engine = AsyncInferenceEngine(loop)
+        self._key = None
+
+    async def start(self):
+        self._key = await self._engine.load_model(self._descriptor)
+
+    def run(self, image, params=None, resize=False, window=None):
+        return self._engine.image_inference(self._key, image, params, resize,
+                                            window)
+
+    async def close(self):
+        if self._key is not None:
+            await self._engine.unload_model(self._key)
+        await self._engine.close()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.close()
@@ -0,0 +1,332 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local VisionBonnet emulator.
+
+Serves the VisionBonnet protocol over the socket transport, so InferenceEngine
+can run on hosts without VisionBonnet hardware, e.g. to benchmark throughput,
+latency and result decoding on a CI machine. Camera inference produces
+synthetic results for the known models (or replays given results) at the
+configured frame rate, every response is delayed by the configured latency.
+See aiy.vision.recording for recording results to replay.
+
+Run the emulator:
+python3 -m aiy.vision.emulator --fps 30 --latency_ms 20
+
+and point InferenceEngine to it (non-ARM hosts always use sockets):
+VISION_BONNET_HOST=127.0.0.1 python3 image_classification_camera.py
+"""
+
+import argparse
+import logging
+import math
+import random
+import socket
+import struct
+import threading
+import time
+
+from aiy._drivers._transport import _socket_recvall_into
+from aiy._drivers._transport import _socket_send_message
+from aiy.vision.models import image_classification
+from aiy.vision.models.object_detection_anchors import NUM_ANCHORS
+from aiy.vision.proto import protocol_pb2
+from aiy.vision.recording import read_results
+
+_CAMERA_SIZE = (1640, 1232)
+
+
+def _set_tensor(result, name, shape, data):
+    tensor = result.tensors[name]
+    (tensor.shape.batch, tensor.shape.height, tensor.shape.width,
+     tensor.shape.depth) = shape
+    tensor.data.extend(data)
+
+
+def _softmax(rnd, depth):
+    logits = [rnd.gauss(0.0, 1.0) for _ in range(depth)]
+    logits[rnd.randrange(depth)] += 8.0
+    exps = [math.exp(logit) for logit in logits]
+    total = sum(exps)
+    return [value / total for value in exps]
+
+
+def _classification_tensors(tensor_name, depth):
+    def fill(result, rnd):
+        _set_tensor(result, tensor_name, (1, 1, 1, depth), _softmax(rnd, depth))
+    return fill
+
+
+def _object_detection_tensors(result, rnd):
+    logits = [4.0, -4.0, -4.0, -4.0] * NUM_ANCHORS
+    for _ in range(rnd.randrange(4)):
+        anchor = rnd.randrange(NUM_ANCHORS)
+        logits[4 * anchor + rnd.randrange(1, 4)] = 8.0
+    boxes = [rnd.gauss(0.0, 0.5) for _ in range(4 * NUM_ANCHORS)]
+    _set_tensor(result, 'concat_1', (1, NUM_ANCHORS, 1, 4), logits)
+    _set_tensor(result, 'concat', (1, NUM_ANCHORS, 1, 4), boxes)
+
+
+def _face_detection_tensors(result, rnd):
+    # Like object detection, boxes are relative to the window.
+    width, height = result.window.width, result.window.height
+    num_faces = rnd.randrange(3)
+    boxes = []
+    for _ in range(num_faces):
+        size = rnd.uniform(0.1, 0.3) * height
+        boxes.extend((rnd.uniform(0, width - size),
+                      rnd.uniform(0, height - size), size, size))
+    _set_tensor(result, 'bounding_boxes', (1, num_faces, 1, 4), boxes)
+    _set_tensor(result, 'face_scores', (1, num_faces, 1, 1),
+                [rnd.uniform(0.5, 1.0) for _ in range(num_faces)])
+    _set_tensor(result, 'joy_scores', (1, num_faces, 1, 1),
+                [rnd.random() for _ in range(num_faces)])
+
+
+# Model name -> function(result, random) filling synthetic output tensors.
+_SYNTHETIC_TENSORS = {
+    image_classification.MOBILENET: _classification_tensors(
+        'MobilenetV1/Predictions/Softmax', 1001),
+    image_classification.SQUEEZENET: _classification_tensors(
+        'Prediction', 1001),
+    'dish_classifier': _classification_tensors(
+        'MobilenetV1/Predictions/Softmax', 2024),
+    'object_detection': _object_detection_tensors,
+    'FaceDetection': _face_detection_tensors,
+}
+
+
+class BonnetEmulator(object):
+    """Serves VisionBonnet protocol on a TCP socket.
+
+    State (loaded models, camera inference) is shared by all connections,
+    like on a real VisionBonnet.
+    """
+
+    def __init__(self, host='127.0.0.1', port=35000, fps=30.0, latency_ms=0,
+                 results=None, seed=0):
+        """Creates a new emulator.
+
+        Args:
+          host: string, address to listen on.
+          port: int, port to listen on, 0 picks a free one.
+          fps: float, camera frame rate.
+          latency_ms: float, delay added to every response.
+          results: list of protocol_pb2.InferenceResult to replay in a loop
+            for camera inference instead of synthetic ones.
+          seed: int, seed for synthetic results.
+        """
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self._server.listen(4)
+        self._fps = fps
+        self._latency = latency_ms / 1000.0
+        self._results = results
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._models = {}  # Model name -> Request.LoadModel.
+        self._camera_model = None
+        self._camera_window = None
+        self._camera_start = None
+        self._last_frame = -1
+        self._thread = None
+
+    @property
+    def address(self):
+        """(host, port) the emulator is listening on."""
+        return self._server.getsockname()
+
+    def start(self):
+        """Serves connections on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def serve_forever(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                break  # Closed.
+            thread = threading.Thread(target=self._serve, args=(conn,))
+            thread.daemon = True
+            thread.start()
+
+    def close(self):
+        self._server.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def _serve(self, conn):
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        header = bytearray(4)
+        with conn:
+            while _socket_recvall_into(conn, memoryview(header)):
+                data = bytearray(struct.unpack('!I', header)[0])
+                if not _socket_recvall_into(conn, memoryview(data)):
+                    break
+                request = protocol_pb2.Request()
+                request.ParseFromString(bytes(data))
+                response = self.handle(request)
+                if self._latency:
+                    time.sleep(self._latency)
+                _socket_send_message(conn, response.SerializeToString())
+
+    def handle(self, request):
+        """Returns protocol_pb2.Response for protocol_pb2.Request."""
+        response = protocol_pb2.Response()
+        name = request.WhichOneof('request')
+        handler = getattr(self, '_' + name, None) if name else None
+        try:
+            if handler is None:
+                raise ValueError('Unsupported request: %s.' % name)
+            with self._lock:
+                # Handlers return how long to wait before responding, which
+                # happens without the lock so other connections aren't blocked.
+                delay = handler(getattr(request, name), response)
+        except ValueError as e:
+            response.Clear()
+            response.status.code = protocol_pb2.Response.Status.ERROR
+            response.status.message = str(e)
+            delay = None
+        if delay:
+            time.sleep(delay)
+        return response
+
+    def _load_model(self, request, response):
+        if request.model_name in self._models:
+            raise ValueError('Model "%s" is already loaded.' % request.model_name)
+        self._models[request.model_name] = request
+        logging.info('Loaded model "%s".', request.model_name)
+
+    def _unload_model(self, request, response):
+        if request.model_name not in self._models:
+            raise ValueError('Model "%s" is not loaded.' % request.model_name)
+        if request.model_name == self._camera_model:
+            raise ValueError('Model "%s" is used by camera inference.' %
+                             request.model_name)
+        del self._models[request.model_name]
+        logging.info('Unloaded model "%s".', request.model_name)
+
+    def _start_camera_inference(self, request, response):
+        if request.model_name not in self._models:
+            raise ValueError('Model "%s" is not loaded.' % request.model_name)
+        if self._camera_model is not None:
+            raise ValueError('Camera inference is already running.')
+        window = request.window
+        if window.width or window.height:
+            if (window.x < 0 or window.y < 0 or window.width <= 0 or
+                    window.height <= 0 or
+                    window.x + window.width > _CAMERA_SIZE[0] or
+                    window.y + window.height > _CAMERA_SIZE[1]):
+                raise ValueError('Window is outside of camera frame.')
+            self._camera_window = (window.x, window.y, window.width,
+                                   window.height)
+        else:
+            self._camera_window = None
+        self._camera_model = request.model_name
+        self._camera_start = time.monotonic()
+        self._last_frame = -1
+
+    def _stop_camera_inference(self, request, response):
+        if self._camera_model is None:
+            raise ValueError('Camera inference is not running.')
+        self._camera_model = None
+
+    def _camera_inference(self, request, response):
+        if self._camera_model is None:
+            raise ValueError('Camera inference is not running.')
+        # Like the camera, returns the latest frame, waits for the next one if
+        # the latest was already returned.
+        now = time.monotonic()
+        frame = int((now - self._camera_start) * self._fps)
+        delay = 0.0
+        if frame <= self._last_frame:
+            frame = self._last_frame + 1
+            delay = max(0.0, self._camera_start + frame / self._fps - now)
+        self._last_frame = frame
+
+        result = response.inference_result
+        if self._results:
+            result.CopyFrom(self._results[frame % len(self._results)])
+        else:
+            self._fill_result(result, self._camera_model, _CAMERA_SIZE,
+                              self._camera_window)
+        result.frame.index = frame
+        result.frame.timestamp_us = int((time.time() + delay) * 1000000)
+        return delay
+
+    def _get_camera_state(self, request, response):
+        response.camera_state.running = self._camera_model is not None
+        response.camera_state.width, response.camera_state.height = _CAMERA_SIZE
+
+    def _get_firmware_info(self, request, response):
+        response.firmware_info.major_version = 1
+        response.firmware_info.minor_version = 0
+
+    def _image_inference(self, request, response):
+        if request.model_name not in self._models:
+            raise ValueError('Model "%s" is not loaded.' % request.model_name)
+        shape = request.tensor.shape
+        if len(request.tensor.data) != shape.width * shape.height * shape.depth:
+            raise ValueError('Image tensor size does not match its shape.')
+        self._fill_result(response.inference_result, request.model_name,
+                          (shape.width, shape.height))
+
+    def _imu_self_test(self, request, response):
+        pass
+
+    def _fill_result(self, result, model_name, size, window=None):
+        result.model_name = model_name
+        result.width, result.height = size
+        (result.window.x, result.window.y, result.window.width,
+         result.window.height) = window or (0, 0) + tuple(size)
+        result.duration_ms = int(self._latency * 1000)
+        fill = _SYNTHETIC_TENSORS.get(model_name)
+        if fill:
+            fill(result, self._random)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='Address to listen on.')
+    parser.add_argument('--port', type=int, default=35000,
+                        help='Port to listen on.')
+    parser.add_argument('--fps', type=float, default=30.0,
+                        help='Camera frame rate.')
+    parser.add_argument('--latency_ms', type=float, default=0.0,
+                        help='Delay added to every response, in ms.')
+    parser.add_argument('--replay',
+                        help='Recording to replay for camera inference, see '
+                        'aiy.vision.recording.')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    results = list(read_results(args.replay)) if args.replay else None
+    with BonnetEmulator(args.host, args.port, args.fps, args.latency_ms,
+                        results) as emulator:
+        logging.info('Listening on %s:%d', *emulator.address)
+        try:
+            emulator.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming filters smoothing inference outputs over time.
+
+Per-frame scores and bounding boxes are noisy. Every filter takes one value
+per frame with update() and returns the filtered value, in constant time per
+frame (median: linear in its small window size). Example, smoothing average
+joy score of all faces:
+
+    joy = MovingAverage(10)
+    for result, score in smooth(inference.run(), average_joy_score, joy):
+        ...
+
+TrackFilters keeps one filter per track of aiy.vision.tracker.Tracker, e.g.
+to smooth the joy score of each face separately.
+"""
+
+import bisect
+import collections
+
+
+class MovingAverage(object):
+    """Mean of the last size values."""
+
+    def __init__(self, size):
+        self._window = collections.deque(maxlen=size)
+        self._sum = 0.0
+        self.value = None
+
+    def update(self, value):
+        if len(self._window) == self._window.maxlen:
+            self._sum -= self._window[0]
+        self._window.append(value)
+        self._sum += value
+        self.value = self._sum / len(self._window)
+        return self.value
+
+
+class ExponentialMovingAverage(object):
+    """Exponentially weighted mean, alpha is the weight of the new value."""
+
+    def __init__(self, alpha):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError('alpha must be in (0, 1].')
+        self._alpha = alpha
+        self.value = None
+
+    def update(self, value):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self._alpha * (value - self.value)
+        return self.value
+
+
+class MovingMedian(object):
+    """Median of the last size values, robust to single-frame outliers."""
+
+    def __init__(self, size):
+        self._window = collections.deque(maxlen=size)
+        self._sorted = []
+        self.value = None
+
+    def update(self, value):
+        if len(self._window) == self._window.maxlen:
+            del self._sorted[bisect.bisect_left(self._sorted, self._window[0])]
+        self._window.append(value)
+        bisect.insort(self._sorted, value)
+        self.value = self._sorted[len(self._sorted) // 2]
+        return self.value
+
+
+class Hysteresis(object):
+    """On/off state switching on at high and off at low threshold only.
+
+    Keeps a value hovering around a single threshold from flipping state on
+    every frame.
+    """
+
+    def __init__(self, low, high, value=False):
+        if low > high:
+            raise ValueError('low must not be greater than high.')
+        self._low = low
+        self._high = high
+        self.value = value
+
+    def update(self, value):
+        if value >= self._high:
+            self.value = True
+        elif value <= self._low:
+            self.value = False
+        return self.value
+
+
+class BoxFilter(object):
+    """Filters each coordinate of (x, y, width, height) bounding boxes."""
+
+    def __init__(self, make_filter):
+        """Creates a new filter.
+
+        Args:
+          make_filter: function returning a new filter, called for each
+            coordinate, e.g. lambda: MovingMedian(5).
+        """
+        self._filters = tuple(make_filter() for _ in range(4))
+        self.value = None
+
+    def update(self, box):
+        self.value = tuple(f.update(v) for f, v in zip(self._filters, box))
+        return self.value
+
+
+class TrackFilters(object):
+    """One filter per track, created on first update of each track."""
+
+    def __init__(self, make_filter):
+        """Creates new per-track filters.
+
+        Args:
+          make_filter: function returning a new filter for each track.
+        """
+        self._make_filter = make_filter
+        self._filters = {}  # Track id -> filter.
+
+    def update(self, track, value):
+        """Returns value filtered by the filter of track."""
+        track_filter = self._filters.get(track.id)
+        if track_filter is None:
+            track_filter = self._filters[track.id] = self._make_filter()
+        return track_filter.update(value)
+
+    def prune(self, tracks):
+        """Drops filters of tracks not in tracks, e.g. expired ones."""
+        live = {track.id for track in tracks}
+        for track_id in list(self._filters):
+            if track_id not in live:
+                del self._filters[track_id]
+
+
+def smooth(results, get_value, value_filter):
+    """Yields (result, filtered value) for every inference result.
+
+    Args:
+      results: iterable of inference results, e.g. CameraInference.run().
+      get_value: function returning value to filter from a result.
+      value_filter: filter, e.g. MovingAverage(10).
+    """
+    for result in results:
+        yield result, value_filter.update(get_value(result))
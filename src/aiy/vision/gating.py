@@ -0,0 +1,95 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Skips camera inference results while nothing changes.
+
+When the scene in front of the camera is static, model outputs stay (almost)
+the same and decoding every result wastes CPU. ChangeGate passes a result
+only if its output tensors differ from the last passed one, and once results
+stop changing it also requests them less often. The first changed result is
+passed right away and requests return to full rate. Example:
+
+    gate = ChangeGate(tolerance=0.05)
+    for result in gate.filter(inference.run()):
+        faces = face_detection.get_faces(result)
+"""
+
+import operator
+import time
+
+from aiy.vision.inference import get_tensor
+
+
+def _max_difference(data1, data2):
+    return max(map(abs, map(operator.sub, data1, data2)), default=0.0)
+
+
+class ChangeGate(object):
+    """Passes only results with changed output tensors."""
+
+    def __init__(self, tolerance=0.0, idle_frames=3, idle_interval=0.2):
+        """Creates a new gate.
+
+        Args:
+          tolerance: float, max difference of every tensor value to consider
+            results unchanged, 0 compares tensors exactly (fastest).
+          idle_frames: int, number of consecutive unchanged results after
+            which requests slow down.
+          idle_interval: float, min time between requests in seconds while
+            results don't change.
+        """
+        self._tolerance = tolerance
+        self._idle_frames = idle_frames
+        self._idle_interval = idle_interval
+        self._reference = None  # {name: tensor data} of last passed result.
+        self._unchanged = 0
+
+    @property
+    def idle(self):
+        """Whether results stopped changing."""
+        return self._unchanged >= self._idle_frames
+
+    def changed(self, result):
+        """Returns whether result differs from the last changed result."""
+        tensors = {name: get_tensor(result, name).data
+                   for name in result.tensors}
+        reference = self._reference
+        if reference is None or reference.keys() != tensors.keys():
+            changed = True
+        elif self._tolerance:
+            changed = any(
+                len(data) != len(reference[name]) or
+                _max_difference(data, reference[name]) > self._tolerance
+                for name, data in tensors.items())
+        else:
+            changed = any(data != reference[name]
+                          for name, data in tensors.items())
+
+        if changed:
+            self._reference = tensors
+            self._unchanged = 0
+        else:
+            self._unchanged += 1
+        return changed
+
+    def filter(self, results):
+        """Yields changed results, requesting results slower while idle."""
+        last_request = time.monotonic()
+        for result in results:
+            if self.changed(result):
+                yield result
+            if self.idle:
+                delay = last_request + self._idle_interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            last_request = time.monotonic()
@@ -21,8 +21,15 @@ deleted. See image_classification.py and object_recognition.py as examples on
 how to use this API.
 """
 
+import array
+import hashlib
 import logging
+import queue
+import threading
+import time
+import weakref
 from aiy._drivers._transport import make_transport
+from aiy.vision import metrics
 from aiy.vision.proto import protocol_pb2
 
 
@@ -60,22 +67,93 @@ def _check_firmware_info(info):
             supported_version, firmware_version)
 
 
+def _put_result(results, result, done, drop_stale):
+    """Puts result into queue, dropping the oldest queued result if needed."""
+    while not done.is_set():
+        try:
+            results.put(result, block=not drop_stale, timeout=0.1)
+            return
+        except queue.Full:
+            if drop_stale:
+                try:
+                    stale = results.get_nowait()
+                    logging.debug('Dropped result for frame %d.',
+                                  stale.frame.index)
+                except queue.Empty:
+                    pass
+
+
 class CameraInference(object):
     """Helper class to run camera inference."""
 
-    def __init__(self, descriptor, params=None):
+    def __init__(self, descriptor, params=None, window=None):
+        """Loads model and starts camera inference.
+
+        Args:
+          descriptor: ModelDescriptor.
+          params: dict, additional parameters to run inference.
+          window: (x, y, width, height), region of interest of the camera
+            frame, see InferenceEngine.start_camera_inference.
+        """
         self._engine = InferenceEngine()
         self._key = self._engine.load_model(descriptor)
-        self._engine.start_camera_inference(self._key, params)
+        self._engine.start_camera_inference(self._key, params, window)
+        self._fetcher = None
 
     def camera_state(self):
         return self._engine.get_camera_state()
 
-    def run(self):
-        while True:
-            yield self._engine.camera_inference()
+    def run(self, queue_size=None, drop_stale=True):
+        """Yields inference results from VisionBonnet.
+
+        By default the next result is only requested once the caller is done
+        with the previous one. If queue_size is set, a background thread keeps
+        requesting results instead, so transport latency overlaps with result
+        processing. Results keep their frame index and timestamp, dropped
+        results show up as gaps in result.frame.index.
+
+        Args:
+          queue_size: int, max number of results waiting to be processed.
+          drop_stale: bool, when the queue is full drop the oldest result if
+            True, or wait for the caller to process it if False.
+        """
+        if not queue_size:
+            while True:
+                yield self._engine.camera_inference()
+
+        results = queue.Queue(maxsize=queue_size)
+        done = threading.Event()
+        thread = threading.Thread(target=self._fetch_results,
+                                  args=(results, done, drop_stale))
+        thread.daemon = True
+        thread.start()
+        self._fetcher = (done, thread)
+        try:
+            while True:
+                result = results.get()
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+        finally:
+            self._stop_fetcher()
+
+    def _fetch_results(self, results, done, drop_stale):
+        try:
+            while not done.is_set():
+                _put_result(results, self._engine.camera_inference(), done,
+                            drop_stale)
+        except Exception as e:  # pylint: disable=broad-except
+            _put_result(results, e, done, drop_stale=False)
+
+    def _stop_fetcher(self):
+        if self._fetcher:
+            done, thread = self._fetcher
+            done.set()
+            thread.join()
+            self._fetcher = None
 
     def close(self):
+        self._stop_fetcher()
         self._engine.stop_camera_inference()
         self._engine.unload_model(self._key)
         self._engine.close()
@@ -94,8 +172,16 @@ class ImageInference(object):
         self._engine = InferenceEngine()
         self._key = self._engine.load_model(descriptor)
 
-    def run(self, image, params=None):
-        return self._engine.image_inference(self._key, image, params)
+    def run(self, image, params=None, resize=False, window=None):
+        return self._engine.image_inference(self._key, image, params, resize,
+                                            window)
+
+    def run_batch(self, images, params=None, queue_size=2, resize=False,
+                  window=None):
+        """Yields inference results for every image, see
+        InferenceEngine.image_inference_batch."""
+        return self._engine.image_inference_batch(self._key, images, params,
+                                                  queue_size, resize, window)
 
     def close(self):
         self._engine.unload_model(self._key)
@@ -130,6 +216,37 @@ class ModelDescriptor(object):
         self.input_shape = input_shape
         self.input_normalizer = input_normalizer
         self.compute_graph = compute_graph
+        self._content_hash = None
+
+    @property
+    def content_hash(self):
+        """Hex digest of everything sent to VisionBonnet to load the model.
+
+        Computed on first access, the descriptor is not expected to change
+        afterwards.
+        """
+        if self._content_hash is None:
+            digest = hashlib.sha256()
+            digest.update(repr((self.name, tuple(self.input_shape),
+                                tuple(self.input_normalizer))).encode('utf-8'))
+            digest.update(self.compute_graph or b'')
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    def same_content(self, other):
+        """Returns whether other descriptor loads the same model.
+
+        Descriptors created by model() functions share the compute graph
+        cached by load_compute_graph, comparing it by identity avoids hashing
+        multi-megabyte graphs.
+        """
+        if (self.name != other.name or
+                tuple(self.input_shape) != tuple(other.input_shape) or
+                tuple(self.input_normalizer) != tuple(other.input_normalizer)):
+            return False
+        if self.compute_graph is other.compute_graph:
+            return True
+        return self.content_hash == other.content_hash
 
 
 class InferenceException(Exception):
@@ -138,6 +255,63 @@ class InferenceException(Exception):
         Exception.__init__(self, *args, **kwargs)
 
 
+class Tensor(object):
+    """Output tensor of inference result.
+
+    Attributes:
+      shape: (batch, height, width, depth) tuple.
+      data: array of floats in (batch, height, width, depth) order.
+    """
+
+    def __init__(self, shape, data):
+        self.shape = shape
+        self.data = data
+
+
+# Per thread (reference to result, frame, {name: Tensor}) of the most recent
+# result passed to get_tensor, so threads don't evict each other's tensors.
+_tensor_cache = threading.local()
+
+
+def _reference(result):
+    try:
+        return weakref.ref(result)
+    except TypeError:  # Message implementation without weak references.
+        return lambda: result
+
+
+def get_tensor(result, name):
+    """Returns output tensor of inference result as Tensor.
+
+    Tensor data is copied out of the protobuf message once and cached for the
+    most recent result of the calling thread, so several decoders reading the
+    same result share a single copy. Cached tensors are dropped when the
+    result's frame or tensor size changes, e.g. when the message is reused
+    with ParseFromString.
+
+    Args:
+      result: protocol_pb2.InferenceResult.
+      name: string, output tensor name.
+
+    Returns:
+      Tensor.
+    """
+    frame = (result.frame.index, result.frame.timestamp_us)
+    cache = getattr(_tensor_cache, 'value', None)
+    if cache is None or cache[0]() is not result or cache[1] != frame:
+        cache = (_reference(result), frame, {})
+        _tensor_cache.value = cache
+
+    proto = result.tensors[name]
+    tensor = cache[2].get(name)
+    if tensor is None or len(tensor.data) != len(proto.data):
+        shape = (proto.shape.batch, proto.shape.height, proto.shape.width,
+                 proto.shape.depth)
+        tensor = Tensor(shape, array.array('f', proto.data))
+        cache[2][name] = tensor
+    return tensor
+
+
 class InferenceEngine(object):
     """Class to access InferenceEngine on VisionBonnet board.
 
@@ -162,6 +336,8 @@ class InferenceEngine(object):
 
     def __init__(self):
         self._transport = make_transport()
+        self._lock = threading.Lock()
+        self._models = {}  # Model name -> ModelDescriptor of loaded models.
         logging.info('InferenceEngine transport: %s',
                      self._transport.__class__.__name__)
 
@@ -184,20 +360,63 @@ class InferenceEngine(object):
           protocol_pb2.Response
         """
         response = protocol_pb2.Response()
-        response.ParseFromString(self._transport.send(request.SerializeToString()))
+        if metrics.enabled():
+            self._communicate_measured(request, response)
+        else:
+            request_data = request.SerializeToString()
+            with self._lock, self._transport.lease(request_data) as data:
+                response.ParseFromString(data)
         if response.status.code != protocol_pb2.Response.Status.OK:
             raise InferenceException(response.status.message)
         return response
 
+    def _communicate_measured(self, request, response):
+        """Like _communicate, records request in aiy.vision.metrics."""
+        start = time.monotonic()
+        request_data = request.SerializeToString()
+        serialized = time.monotonic()
+        with self._lock:
+            sent = time.monotonic()  # Excludes waiting for other threads.
+            with self._transport.lease(request_data) as data:
+                received = time.monotonic()
+                response_size = len(data)
+                response.ParseFromString(data)
+            parsed = time.monotonic()
+
+        bonnet_ms = None
+        if response.HasField('inference_result'):
+            bonnet_ms = response.inference_result.duration_ms
+        metrics.record(request.WhichOneof('request'), len(request_data),
+                       response_size, 1000.0 * (serialized - start),
+                       1000.0 * (received - sent), 1000.0 * (parsed - received),
+                       1000.0 * (parsed - start), bonnet_ms)
+
+    @property
+    def resident_models(self):
+        """Names of models loaded on VisionBonnet by this engine."""
+        return frozenset(self._models)
+
     def load_model(self, descriptor):
         """Loads model on VisionBonnet.
 
+        Loading a model this engine already loaded with the same content is a
+        no-op, so the compute graph isn't sent again. A model with the same
+        name but different content is unloaded first.
+
         Args:
           descriptor: ModelDescriptor, meta info that defines model name,
             where to get the model and etc.
         Returns:
-          Model identifier.
+          Model identifier, also if VisionBonnet reported an error loading the
+          model (logged), in which case it isn't in resident_models.
         """
+        resident = self._models.get(descriptor.name)
+        if resident is not None:
+            if resident.same_content(descriptor):
+                logging.info('Model "%s" is already loaded.', descriptor.name)
+                return descriptor.name
+            self.unload_model(descriptor.name)
+
         _check_firmware_info(self.get_firmware_info())
 
         logging.info('Loading model "%s"...', descriptor.name)
@@ -224,8 +443,13 @@ class InferenceEngine(object):
         try:
             self._communicate(request)
         except InferenceException as e:
+            # E.g. loaded before by another process and still usable, or out
+            # of memory. The status doesn't tell which, so only successful
+            # loads are recorded as resident.
             logging.warning(str(e))
+            return descriptor.name
 
+        self._models[descriptor.name] = descriptor
         return descriptor.name
 
     def unload_model(self, model_name):
@@ -239,11 +463,26 @@ class InferenceEngine(object):
         request = protocol_pb2.Request()
         request.unload_model.model_name = model_name
         self._communicate(request)
+        self._models.pop(model_name, None)
+
+    def start_camera_inference(self, model_name, params=None, window=None):
+        """Starts inference running on VisionBonnet.
 
-    def start_camera_inference(self, model_name, params=None):
-        """Starts inference running on VisionBonnet."""
+        Args:
+          model_name: string, unique identifier used to refer a model.
+          params: dict, additional parameters to run inference.
+          window: (x, y, width, height), region of interest of the camera
+            frame to run inference on, whole frame by default. The window
+            actually used is reported in every result and decoders return
+            coordinates in the whole frame.
+        """
         request = protocol_pb2.Request()
         request.start_camera_inference.model_name = model_name
+        if window:
+            (request.start_camera_inference.window.x,
+             request.start_camera_inference.window.y,
+             request.start_camera_inference.window.width,
+             request.start_camera_inference.window.height) = window
 
         for key, value in (params or {}).items():
             request.start_camera_inference.params[key] = str(value)
@@ -278,13 +517,23 @@ class InferenceEngine(object):
             # Request is not supported by firmware, default to 1.0
             return (1, 0)
 
-    def image_inference(self, model_name, image, params=None):
+    def image_inference(self, model_name, image, params=None, resize=False,
+                        window=None):
         """Runs inference on image using model (identified by model_name).
 
         Args:
           model_name: string, unique identifier used to refer a model.
           image: PIL.Image,
           params: dict, additional parameters to run inference
+          resize: bool, whether to crop image to the aspect ratio of model
+            input and resize it to model input size before sending it to
+            VisionBonnet, instead of sending it in full resolution. Model must
+            be loaded by this engine. Result width, height and window are
+            still given in original image coordinates, so decoded bounding
+            boxes are too.
+          window: (x, y, width, height), region of interest of the image.
+            Only this region is sent, like with resize, results are still
+            given in original image coordinates.
 
         Returns:
           protocol_pb2.Response
@@ -293,25 +542,169 @@ class InferenceEngine(object):
             raise ValueError('Model name must not be empty.')
 
         logging.info('Image inference with model "%s"...', model_name)
+        request, crop = _image_inference_request(
+            model_name, image, params, self._resize_shape(model_name, resize),
+            window)
+        return _uncrop_result(self._communicate(request).inference_result, crop)
+
+    def _resize_shape(self, model_name, resize):
+        """Returns input shape to resize images to, or None."""
+        if not resize:
+            return None
+        try:
+            return self._models[model_name].input_shape
+        except KeyError:
+            raise ValueError('Model "%s" is not loaded by this engine, its '
+                             'input shape is unknown.' % model_name)
 
-        width, height = image.size
+    def image_inference_batch(self, model_name, images, params=None,
+                              queue_size=2, resize=False, window=None):
+        """Runs inference on every image using model (identified by model_name).
 
-        request = protocol_pb2.Request()
-        request.image_inference.model_name = model_name
-        request.image_inference.tensor.shape.height = height
-        request.image_inference.tensor.shape.width = width
-
-        if image.mode == 'RGB':
-            r, g, b = image.split()
-            request.image_inference.tensor.shape.depth = 3
-            request.image_inference.tensor.data = r.tobytes() + g.tobytes() + b.tobytes()
-        elif image.mode == 'L':
-            request.image_inference.tensor.shape.depth = 1
-            request.image_inference.tensor.data = image.tobytes()
-        else:
-            raise InferenceException('Unsupported image format: %s. Must be L or RGB.' % image.mode)
+        A background thread takes images from the iterator and prepares their
+        requests (including decoding lazily opened images) while the current
+        request is running on VisionBonnet. Throughput is logged at the end.
 
-        for key, value in (params or {}).items():
-            request.image_inference.params[key] = str(value)
+        Args:
+          model_name: string, unique identifier used to refer a model.
+          images: iterable of PIL.Image.
+          params: dict, additional parameters to run inference
+          queue_size: int, max number of requests prepared ahead.
+          resize: bool, see image_inference.
+          window: (x, y, width, height), see image_inference.
 
-        return self._communicate(request).inference_result
+        Yields:
+          protocol_pb2.InferenceResult for every image, in order.
+        """
+        if not model_name:
+            raise ValueError('Model name must not be empty.')
+
+        input_shape = self._resize_shape(model_name, resize)
+        requests = queue.Queue(maxsize=queue_size)
+        done = threading.Event()
+        thread = threading.Thread(target=_prepare_requests,
+                                  args=(model_name, images, params, input_shape,
+                                        window, requests, done))
+        thread.daemon = True
+        thread.start()
+        count = 0
+        start = time.monotonic()
+        try:
+            while True:
+                item = requests.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                request, crop = item
+                result = _uncrop_result(
+                    self._communicate(request).inference_result, crop)
+                count += 1
+                yield result
+        finally:
+            done.set()
+            thread.join()
+            duration = time.monotonic() - start
+            logging.info('Image inference with model "%s": %d images, '
+                         '%.1f images/s.', model_name, count,
+                         count / duration if duration else 0.0)
+
+
+def _resize_image(image, input_shape):
+    """Crops image to aspect ratio of input_shape and resizes it to fit.
+
+    Returns:
+      (resized image, (x, y, width, height) of the crop in image), or
+      (image, None) if image doesn't need resizing.
+    """
+    _, height, width, _ = input_shape
+    if not width or not height or image.size == (width, height):
+        return image, None  # Model takes any size, or nothing to do.
+
+    from PIL import Image
+    image_width, image_height = image.size
+    scale = min(image_width / width, image_height / height)
+    crop_width, crop_height = round(width * scale), round(height * scale)
+    x, y = (image_width - crop_width) // 2, (image_height - crop_height) // 2
+    box = (x, y, x + crop_width, y + crop_height)
+    if hasattr(image, 'reduce'):
+        # Pillow 7.0+: reduce by an integer factor with a box filter first,
+        # then resample, much faster than bilinear over the whole crop.
+        resized = image.resize((width, height), Image.BILINEAR, box=box,
+                               reducing_gap=2.0)
+    else:
+        resized = image.resize((width, height), Image.BILINEAR, box=box)
+    return resized, (x, y, crop_width, crop_height)
+
+
+def _uncrop_result(result, crop):
+    """Maps result of resized image back to original image coordinates."""
+    if crop:
+        image_size, window = crop
+        result.width, result.height = image_size
+        (result.window.x, result.window.y, result.window.width,
+         result.window.height) = window
+    return result
+
+
+def _image_inference_request(model_name, image, params, input_shape=None,
+                             window=None):
+    """Returns protocol_pb2.Request to run inference on image.
+
+    If window is set, image is cropped to it first. If input_shape is set,
+    image is resized to it.
+
+    Returns:
+      (protocol_pb2.Request, crop) where crop is None or (original image size,
+      crop window) for _uncrop_result.
+    """
+    image_size = image.size
+    x, y = 0, 0
+    if window:
+        x, y, width, height = window
+        image = image.crop((x, y, x + width, y + height))
+    if input_shape:
+        resized, resize_window = _resize_image(image, input_shape)
+        if resize_window:
+            image = resized
+            window = (x + resize_window[0], y + resize_window[1],
+                      resize_window[2], resize_window[3])
+    crop = (image_size, tuple(window)) if window else None
+    width, height = image.size
+
+    request = protocol_pb2.Request()
+    request.image_inference.model_name = model_name
+    request.image_inference.tensor.shape.height = height
+    request.image_inference.tensor.shape.width = width
+
+    if image.mode == 'RGB':
+        # Planar RGB, packing each band directly from the image.
+        request.image_inference.tensor.shape.depth = 3
+        request.image_inference.tensor.data = b''.join(
+            image.tobytes('raw', band) for band in 'RGB')
+    elif image.mode == 'L':
+        request.image_inference.tensor.shape.depth = 1
+        request.image_inference.tensor.data = image.tobytes()
+    else:
+        raise InferenceException('Unsupported image format: %s. Must be L or RGB.' % image.mode)
+
+    for key, value in (params or {}).items():
+        request.image_inference.params[key] = str(value)
+
+    return request, crop
+
+
+def _prepare_requests(model_name, images, params, input_shape, window,
+                      requests, done):
+    """Puts (request, crop) for every image into queue, followed by None."""
+    try:
+        for image in images:
+            if done.is_set():
+                return
+            _put_result(requests,
+                        _image_inference_request(model_name, image, params,
+                                                 input_shape, window),
+                        done, drop_stale=False)
+        _put_result(requests, None, done, drop_stale=False)
+    except Exception as e:  # pylint: disable=broad-except
+        _put_result(requests, e, done, drop_stale=False)
@@ -0,0 +1,186 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Opt-in latency and throughput metrics of VisionBonnet requests.
+
+When enabled, every InferenceEngine request in the process is measured, per
+request type (load_model, camera_inference, ...):
+ - number of requests, request and response bytes,
+ - time to serialize request, transport round trip, time to parse response,
+   and total host-side wall time,
+ - inference duration reported by VisionBonnet, for inference requests.
+
+Comparing these tells whether a slow frame rate comes from the transport,
+protobuf or the model itself. Example:
+
+    metrics.enable()
+    ... run inference ...
+    print(metrics.format_stats())
+
+Setting VISION_BONNET_METRICS=<seconds> enables metrics and logs them at that
+interval, without code changes.
+"""
+
+import copy
+import logging
+import os
+import threading
+
+_lock = threading.Lock()
+_stats = {}  # Request type -> RequestStats.
+_enabled = False
+_logger = None  # (thread, stop event) logging stats periodically.
+
+
+class Histogram(object):
+    """Histogram of durations in ms with fixed, roughly logarithmic buckets."""
+
+    BOUNDS_MS = (0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000,
+                 5000, float('inf'))
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.buckets = [0] * len(self.BOUNDS_MS)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        for i, bound in enumerate(self.BOUNDS_MS):
+            if value <= bound:
+                self.buckets[i] += 1
+                break
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """Returns upper bound of the bucket containing given percentile."""
+        rank = percent / 100.0 * self.count
+        seen = 0
+        for bound, count in zip(self.BOUNDS_MS, self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(bound, self.max)
+        return 0.0
+
+    def __str__(self):
+        if not self.count:
+            return '-'
+        return 'mean %.2f, p50 <= %.3g, p90 <= %.3g, max %.2f ms' % (
+            self.mean, self.percentile(50), self.percentile(90), self.max)
+
+
+class RequestStats(object):
+    """Metrics of one request type."""
+
+    def __init__(self):
+        self.count = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.serialize = Histogram()
+        self.transport = Histogram()
+        self.parse = Histogram()
+        self.total = Histogram()
+        self.bonnet = Histogram()  # Inference duration reported by bonnet.
+
+    def __str__(self):
+        return ('count %d, bytes sent %d, received %d\n'
+                '  serialize: %s\n'
+                '  transport: %s\n'
+                '  parse:     %s\n'
+                '  total:     %s\n'
+                '  bonnet:    %s' % (self.count, self.request_bytes,
+                                     self.response_bytes, self.serialize,
+                                     self.transport, self.parse, self.total,
+                                     self.bonnet))
+
+
+def enabled():
+    return _enabled
+
+
+def enable(log_interval=None):
+    """Starts collecting metrics.
+
+    Args:
+      log_interval: float, if set, logs stats every log_interval seconds.
+    """
+    global _enabled, _logger
+    _enabled = True
+    if log_interval and not _logger:
+        stop = threading.Event()
+        thread = threading.Thread(target=_log_stats, args=(log_interval, stop))
+        thread.daemon = True
+        thread.start()
+        _logger = (thread, stop)
+
+
+def disable():
+    """Stops collecting metrics and logging them."""
+    global _enabled, _logger
+    _enabled = False
+    if _logger:
+        _, stop = _logger
+        stop.set()
+        _logger = None
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def record(request_type, request_bytes, response_bytes, serialize_ms,
+           transport_ms, parse_ms, total_ms, bonnet_ms=None):
+    """Records one request, called by InferenceEngine."""
+    with _lock:
+        stats = _stats.get(request_type)
+        if stats is None:
+            stats = _stats[request_type] = RequestStats()
+        stats.count += 1
+        stats.request_bytes += request_bytes
+        stats.response_bytes += response_bytes
+        stats.serialize.add(serialize_ms)
+        stats.transport.add(transport_ms)
+        stats.parse.add(parse_ms)
+        stats.total.add(total_ms)
+        if bonnet_ms is not None:
+            stats.bonnet.add(bonnet_ms)
+
+
+def get_stats():
+    """Returns copy of collected metrics as {request type: RequestStats}."""
+    with _lock:
+        return copy.deepcopy(_stats)
+
+
+def format_stats():
+    """Returns collected metrics as human readable string."""
+    stats = get_stats()
+    return '\n'.join('%s: %s' % (request_type, stats[request_type])
+                     for request_type in sorted(stats))
+
+
+def _log_stats(interval, stop):
+    while not stop.wait(interval):
+        logging.info('VisionBonnet metrics:\n%s', format_stats())
+
+
+if 'VISION_BONNET_METRICS' in os.environ:
+    enable(float(os.environ['VISION_BONNET_METRICS']))
@@ -0,0 +1,251 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Keeps several models loaded on VisionBonnet.
+
+CameraInference and ImageInference load their model when created and unload
+it when closed, so apps switching between models pay the full load cost on
+every switch. ModelManager keeps up to max_models loaded on one engine,
+unloading the least recently used one to make room, and switches the camera
+model without closing the engine. Example:
+
+    with ModelManager(max_models=2) as manager:
+        manager.start_camera_inference(face_detection.model())
+        faces = face_detection.get_faces(manager.camera_inference())
+        manager.start_camera_inference(object_detection.model())
+        objects = object_detection.get_objects(manager.camera_inference())
+        result = manager.image_inference(image_classification.model(), image)
+"""
+
+import collections
+import logging
+import time
+
+from aiy.vision.inference import InferenceEngine
+
+
+class ModelManager(object):
+    """Loads models on demand, evicting least recently used ones."""
+
+    def __init__(self, max_models=2, engine=None):
+        """Creates a new manager.
+
+        Args:
+          max_models: int, max number of models to keep loaded, limited by
+            VisionBonnet memory and model sizes.
+          engine: InferenceEngine to use, a new one (closed with the manager)
+            by default.
+        """
+        if max_models < 1:
+            raise ValueError('max_models must be at least 1.')
+        self._max_models = max_models
+        self._owns_engine = engine is None
+        self._engine = engine or InferenceEngine()
+        self._models = collections.OrderedDict()  # Name -> descriptor, LRU.
+        self._camera_model = None
+        self.load_times = {}  # Model name -> duration of last load, in s.
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @property
+    def loaded_models(self):
+        """Names of loaded models, least recently used first."""
+        return tuple(self._models)
+
+    @property
+    def camera_model(self):
+        """Name of model running camera inference, or None."""
+        return self._camera_model
+
+    def load(self, descriptor):
+        """Makes sure model is loaded and marks it as most recently used.
+
+        Args:
+          descriptor: ModelDescriptor.
+
+        Returns:
+          Model identifier. If VisionBonnet fails to load the model even with
+          all other models (except the camera model) unloaded, the error is
+          logged and the model isn't in loaded_models.
+        """
+        name = descriptor.name
+        loaded = self._models.get(name)
+        if loaded is not None:
+            if loaded.same_content(descriptor):
+                self._models.move_to_end(name)
+                return name
+            self.unload(name)  # Same name, different model.
+
+        while len(self._models) >= self._max_models:
+            self._evict()
+
+        while True:
+            start = time.monotonic()
+            self._engine.load_model(descriptor)
+            duration = time.monotonic() - start
+            if name in self._engine.resident_models:
+                break
+            # Failed, likely out of memory, make room and try again.
+            if not self._evictable():
+                logging.warning('Model "%s" failed to load.', name)
+                return name
+            logging.warning('Model "%s" failed to load, unloading least '
+                            'recently used model.', name)
+            self._evict()
+        self._models[name] = descriptor
+        self._models.move_to_end(name)
+        self.load_times[name] = duration
+        logging.info('Model "%s" loaded in %.1f ms.', name, 1000.0 * duration)
+        return name
+
+    def _evictable(self):
+        return any(name != self._camera_model for name in self._models)
+
+    def _evict(self):
+        for name in self._models:
+            if name != self._camera_model:
+                self.unload(name)
+                return
+        raise ValueError('No model can be unloaded, the only loaded model is '
+                         'used by camera inference.')
+
+    def unload(self, model_name):
+        """Unloads model, stopping camera inference if it uses the model."""
+        if model_name == self._camera_model:
+            self.stop_camera_inference()
+        self._engine.unload_model(model_name)
+        del self._models[model_name]
+
+    def start_camera_inference(self, descriptor, params=None, window=None):
+        """Runs camera inference with given model, loading it if needed.
+
+        Camera inference running with another model is stopped first, the
+        previous model stays loaded if there is room for both.
+        """
+        loaded = self._models.get(descriptor.name)
+        if ((loaded is None or not loaded.same_content(descriptor)) and
+                len(self._models) >= self._max_models):
+            # Lets the camera model be unloaded to make room.
+            self.stop_camera_inference()
+        name = self.load(descriptor)
+        if self._camera_model is not None:
+            self.stop_camera_inference()
+        self._engine.start_camera_inference(name, params, window)
+        self._camera_model = name
+        return name
+
+    def stop_camera_inference(self):
+        if self._camera_model is not None:
+            self._camera_model = None
+            self._engine.stop_camera_inference()
+
+    def camera_inference(self):
+        """Returns the next camera inference result."""
+        return self._engine.camera_inference()
+
+    def run(self):
+        """Yields camera inference results until camera model changes."""
+        model = self._camera_model
+        while self._camera_model == model:
+            yield self._engine.camera_inference()
+
+    def image_inference(self, descriptor, image, params=None, resize=False,
+                        window=None):
+        """Runs inference on image with given model, loading it if needed."""
+        name = self.load(descriptor)
+        return self._engine.image_inference(name, image, params, resize,
+                                            window)
+
+    def close(self):
+        self.stop_camera_inference()
+        for name in list(self._models):
+            self.unload(name)
+        if self._owns_engine:
+            self._engine.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+
+class MultiModelCameraInference(object):
+    """Runs camera inference with several models taking turns.
+
+    VisionBonnet runs camera inference with one model at a time, so models
+    take turns on the same engine: all of them stay loaded and camera
+    inference is restarted with the next model on every turn. Turns are
+    scheduled by smooth weighted round-robin, so a model with weight 2 gets
+    twice as many turns as a model with weight 1, evenly spread. Example:
+
+        models = ((face_detection.model(), 2), (object_detection.model(), 1))
+        with MultiModelCameraInference(models) as inference:
+            for model_name, result in inference.run():
+                ...
+    """
+
+    def __init__(self, models, frames_per_turn=1, params=None):
+        """Loads all models.
+
+        Args:
+          models: sequence of ModelDescriptor or (ModelDescriptor, weight)
+            pairs, weight is a positive int (1 by default).
+          frames_per_turn: int, results to get from a model before switching
+            to the next one, higher values make switching overhead smaller.
+          params: dict, camera inference params used with every model.
+        """
+        self._models = []  # [descriptor, weight, current weight]
+        for model in models:
+            descriptor, weight = model if isinstance(model, tuple) else (model, 1)
+            if weight < 1:
+                raise ValueError('Model weight must be positive.')
+            self._models.append([descriptor, weight, 0])
+        if not self._models:
+            raise ValueError('At least one model is required.')
+        self._frames_per_turn = frames_per_turn
+        self._params = params
+        self._manager = ModelManager(max_models=len(self._models))
+        for descriptor, _, _ in self._models:
+            self._manager.load(descriptor)
+
+    def _next_model(self):
+        total = 0
+        best = None
+        for model in self._models:
+            model[2] += model[1]
+            total += model[1]
+            if best is None or model[2] > best[2]:
+                best = model
+        best[2] -= total
+        return best[0]
+
+    def run(self):
+        """Yields (model name, inference result) pairs."""
+        while True:
+            descriptor = self._next_model()
+            if self._manager.camera_model != descriptor.name:
+                self._manager.start_camera_inference(descriptor, self._params)
+            for _ in range(self._frames_per_turn):
+                yield descriptor.name, self._manager.camera_inference()
+
+    def close(self):
+        self._manager.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
@@ -14,10 +14,11 @@
 """API for Dish Classifier."""
 
 from aiy.vision.inference import ModelDescriptor
+from aiy.vision.inference import get_tensor
 from aiy.vision.models import utils
-from aiy.vision.models.dish_classifier_classes import CLASSES
 
 _COMPUTE_GRAPH_NAME = 'mobilenet_v1_192res_1.0_seefood.binaryproto'
+_CLASSES = utils.LabelTable('dish_classifier_classes.txt')
 
 
 def model():
@@ -46,12 +47,9 @@ def get_classes(result, max_num_objects=None, object_prob_threshold=0.0):
        ('Yaka mein, 0.005497)]
     """
     assert len(result.tensors) == 1
-    tensor = result.tensors['MobilenetV1/Predictions/Softmax']
+    tensor = get_tensor(result, 'MobilenetV1/Predictions/Softmax')
     probs, shape = tensor.data, tensor.shape
-    assert (shape.batch, shape.height, shape.width, shape.depth) == (1, 1, 1,
-                                                                     2024)
+    assert shape == (1, 1, 1, 2024)
 
-    pairs = [pair for pair in enumerate(probs) if pair[1] > object_prob_threshold]
-    pairs = sorted(pairs, key=lambda pair: pair[1], reverse=True)
-    pairs = pairs[0:max_num_objects]
-    return [('/'.join(CLASSES[index]), prob) for index, prob in pairs]
+    return utils.get_top_classes(probs, _CLASSES, max_num_objects,
+                                 object_prob_threshold)
@@ -1,2042 +0,0 @@
-# Copyright 2017 Google Inc.
-#
-# Licensed under the Apache License, Version 2.0 (the "License");
-# you may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#     http://www.apache.org/licenses/LICENSE-2.0
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
-"""Predefined dish classes for dish classifier model."""
-
-CLASSES = (
-    ('background',),  # index=0
-    ('Chaudin',),  # index=1
-    ('Bambalouni',),  # index=2
-    ('Ghoriba',),  # index=3
-    ('Mango sticky rice',),  # index=4
-    ('Jianbing',),  # index=5
-    ('Aguachile',),  # index=6
-    ('Carrozza',),  # index=7
-    ('Miyan kuka',),  # index=8
-    ('Efo riro',),  # index=9
-    ('Ayam masak merah',),  # index=10
-    ('Chiffon pie',),  # index=11
-    ('Instant noodle',),  # index=12
-    ('Riso patate e cozze',),  # index=13
-    ('Bazin',),  # index=14
-    ('Black bottom pie',),  # index=15
-    ('Pal\xc3\xb3c soup',),  # index=16
-    ('Sailor sandwich',),  # index=17
-    ('Tuwo shinkafa',),  # index=18
-    ('Carne a la tampique\xc3\xb1a',),  # index=19
-    ('Pastel azteca',),  # index=20
-    ('Fujian red wine chicken',),  # index=21
-    ('Boeber',),  # index=22
-    ('Lady Baltimore cake',),  # index=23
-    ('Yam khai dao',),  # index=24
-    ('Texas Tommy',),  # index=25
-    ('Har cheong gai',),  # index=26
-    ('Kolokythopita',),  # index=27
-    ('Karydopita',),  # index=28
-    ('Rinflaj\xc5\xa1',),  # index=29
-    ('Hainanese curry rice',),  # index=30
-    ('Sonoran hot dog',),  # index=31
-    ('Kamounia',),  # index=32
-    ('Afghani burger',),  # index=33
-    ('Teochew porridge',),  # index=34
-    ('Minestra di ceci',),  # index=35
-    ('Pastrami on rye',),  # index=36
-    ('Roast beef sandwich',),  # index=37
-    ('Chahan',),  # index=38
-    ('Ekuru',),  # index=39
-    ('Sciusceddu',),  # index=40
-    ('Breakfast burrito',),  # index=41
-    ('\xc3\x84ggost',),  # index=42
-    ('Sausage Stroganoff',),  # index=43
-    ('Roti jala',),  # index=44
-    ('Pirao',),  # index=45
-    ('Casatiello',),  # index=46
-    ('Khanom tan',),  # index=47
-    ('Muamba chicken',),  # index=48
-    ('Dobradinha',),  # index=49
-    ('Bruckfleisch',),  # index=50
-    ('Molote',),  # index=51
-    ('Spongata',),  # index=52
-    ('Funge',),  # index=53
-    ('\xc3\x84lplermagronen',),  # index=54
-    ('K\xc3\xb6ttbullar',),  # index=55
-    ("Ka'ak",),  # index=56
-    ('Papet vaudois',),  # index=57
-    ('Broodpap',),  # index=58
-    ('Prosciutto di Norcia',),  # index=59
-    ('Malloreddus',),  # index=60
-    ('Farcidure',),  # index=61
-    ('Pannekoek',),  # index=62
-    ('\xc5\xa0porki makaruli',),  # index=63
-    ('Bolo Rei',),  # index=64
-    ('Camarones al mojo de ajo',),  # index=65
-    ('Fricasse',),  # index=66
-    ('Stracciatella',),  # index=67
-    ('Fondu creusois',),  # index=68
-    ('Sart\xc3\xb9',),  # index=69
-    ('Matelote',),  # index=70
-    ('Baodu',),  # index=71
-    ('Tarte au maton',),  # index=72
-    ('Cartellate',),  # index=73
-    ('Gyeran-ppang',),  # index=74
-    ('Torta pasqualina',),  # index=75
-    ('Caltabo\xc8\x99',),  # index=76
-    ('Khanom mo kaeng',),  # index=77
-    ('Suimono',),  # index=78
-    ('Dimlama',),  # index=79
-    ('Tav\xc3\xab kosi',),  # index=80
-    ('Salade li\xc3\xa9geoise',),  # index=81
-    ('Salame di Fabriano',),  # index=82
-    ('Kalach',),  # index=83
-    ('Jambon persill\xc3\xa9',),  # index=84
-    ('Tonkotsu ramen',),  # index=85
-    ('Pozharsky cutlet',),  # index=86
-    ('Roccoc\xc3\xb2',),  # index=87
-    ('Feij\xc3\xa3o com \xc3\xb3leo de palma',),  # index=88
-    ('Calulu',),  # index=89
-    ('Begova \xc4\x8dorba',),  # index=90
-    ('Cuzzupa',),  # index=91
-    ('Th\xe1\xbb\x8bt kho t\xc3\xa0u',),  # index=92
-    ('Bon bon chicken',),  # index=93
-    ('Zoque',),  # index=94
-    ('Bint al-sahn',),  # index=95
-    ('Tempoyak',),  # index=96
-    ('Puran poli',),  # index=97
-    ('Enfrijoladas',),  # index=98
-    ('Chueo-tang',),  # index=99
-    ('Naem',),  # index=100
-    ('Sate kikil',),  # index=101
-    ('Pinzimonio',),  # index=102
-    ('Pizokels',),  # index=103
-    ('Schiacciatina',),  # index=104
-    ('Schiacciata',),  # index=105
-    ('Daheen',),  # index=106
-    ('Chapssal-tteok',),  # index=107
-    ('Ojja',),  # index=108
-    ('Tigella',),  # index=109
-    ('Pansotti',),  # index=110
-    ('Fried eggplant',),  # index=111
-    ('Portuguese seafood rice',),  # index=112
-    ('Tripes \xc3\xa0 la mode de Caen',),  # index=113
-    ('Arraksbulle',),  # index=114
-    ('Brenebon',),  # index=115
-    ('Gnocco fritto',),  # index=116
-    ('Pan di ramerino',),  # index=117
-    ('Tahu tek-tek',),  # index=118
-    ('Bibikkan',),  # index=119
-    ('Tongseng cumi',),  # index=120
-    ('Nakl\xc3\xa1dan\xc3\xbd hermel\xc3\xadn',),  # index=121
-    ('Bundevara',),  # index=122
-    ('Sop saudara',),  # index=123
-    ('Mian cha',),  # index=124
-    ('Erbazzone',),  # index=125
-    ('Kisra',),  # index=126
-    ('Carne di t\xc3\xacblizze del Me\xc4\x91imurje',),  # index=127
-    ('Kagape kambing',),  # index=128
-    ('Markook',),  # index=129
-    ('Pisarei e fa\xc5\x9b\xc3\xb6',),  # index=130
-    ('Lontong Krubyuk',),  # index=131
-    ('Pampushka',),  # index=132
-    ('Makowiec',),  # index=133
-    ('Saleeg',),  # index=134
-    ('Scaccia',),  # index=135
-    ('J\xc3\xb3kai bean soup',),  # index=136
-    ('Bookbinder soup',),  # index=137
-    ('Selat solo',),  # index=138
-    ('Kutsinta',),  # index=139
-    ('Sago soup',),  # index=140
-    ('Vinegret',),  # index=141
-    ('Shrimp and grits',),  # index=142
-    ('Sirop de Li\xc3\xa8ge',),  # index=143
-    ('Woku',),  # index=144
-    ('Muhallebi',),  # index=145
-    ('Empal gepuk',),  # index=146
-    ('Fou\xc3\xa9e',),  # index=147
-    ('Octopus as food',),  # index=148
-    ('Koba',),  # index=149
-    ('B\xc3\xb2 l\xc3\xbac l\xe1\xba\xafc',),  # index=150
-    ("Squid l\xc5\xab'au",),  # index=151
-    ('Shrimp Louie',),  # index=152
-    ('Black pudding',),  # index=153
-    ('Cherry kebab',),  # index=154
-    ('Pitsi-pits\xc3\xae',),  # index=155
-    ('Sabich salad',),  # index=156
-    ('Mie kocok',),  # index=157
-    ('Maraca pie',),  # index=158
-    ('Banga',),  # index=159
-    ('Baccal\xc3\xa0 alla lucana',),  # index=160
-    ('Nasi tumpang',),  # index=161
-    ('Gratin dauphinois',),  # index=162
-    ('Arroz chaufa',),  # index=163
-    ('Kuih',),  # index=164
-    ('Ayam goreng',),  # index=165
-    ('Chongos zamoranos',),  # index=166
-    ('NOT_HOT_DOG',),  # index=167
-    ('M\xc4\x83m\xc4\x83lig\xc4\x83',),  # index=168
-    ('Candied almonds',),  # index=169
-    ('Lasagne',),  # index=170
-    ('Pecel Lele',),  # index=171
-    ('Lettuce soup',),  # index=172
-    ('Acquacotta',),  # index=173
-    ('Pork blood soup',),  # index=174
-    ('Sai krok Isan',),  # index=175
-    ('Buridda',),  # index=176
-    ('Maccu',),  # index=177
-    ('Turkey Devonshire',),  # index=178
-    ('Ginestrata',),  # index=179
-    ('Garmugia',),  # index=180
-    ('Meringue',),  # index=181
-    ('Peanut butter and jelly sandwich',),  # index=182
-    ('Couque de Dinant',),  # index=183
-    ('Omo tuo',),  # index=184
-    ('Thapthim krop',),  # index=185
-    ('Pie tee',),  # index=186
-    ('Sutarfeni',),  # index=187
-    ('Raclette',),  # index=188
-    ('Wotou',),  # index=189
-    ('Punugulu',),  # index=190
-    ('Succotash',),  # index=191
-    ('Chim chum',),  # index=192
-    ('Wachipa',),  # index=193
-    ('Boat noodles',),  # index=194
-    ('Tantuni',),  # index=195
-    ('Shab Deg',),  # index=196
-    ('Ch\xe1\xba\xa3 gi\xc3\xb2',),  # index=197
-    ('Ciabatta Bacon Cheeseburger',),  # index=198
-    ('Mie kangkung',),  # index=199
-    ('Tuwo masara',),  # index=200
-    ('Kokonte',),  # index=201
-    ('Akple',),  # index=202
-    ('Plakali',),  # index=203
-    ('Kware\xc5\xbcimal',),  # index=204
-    ('Bento',),  # index=205
-    ('Osechi',),  # index=206
-    ('Okonomiyaki',),  # index=207
-    ('Miso soup',),  # index=208
-    ('Dango',),  # index=209
-    ('Onigiri',),  # index=210
-    ('Hiyayakko',),  # index=211
-    ('Tempura',),  # index=212
-    ('Mochi',),  # index=213
-    ('Peppersoup',),  # index=214
-    ('Caldo de queso',),  # index=215
-    ('Dodo ikire',),  # index=216
-    ('Uir\xc5\x8d',),  # index=217
-    ('Red bean soup',),  # index=218
-    ('Kakig\xc5\x8dri',),  # index=219
-    ('Khichu',),  # index=220
-    ('Bolo de arroz',),  # index=221
-    ('Chips and dip',),  # index=222
-    ('Murgh Musallam',),  # index=223
-    ('Utica greens',),  # index=224
-    ('Zaalouk',),  # index=225
-    ('Mutton curry',),  # index=226
-    ('Mughlai paratha',),  # index=227
-    ('Tuo Zaafi',),  # index=228
-    ('B\xc3\xa1nh b\xe1\xbb\x99t l\xe1\xbb\x8dc',),  # index=229
-    ('Kavarma',),  # index=230
-    ('Cheeseburger',),  # index=231
-    ('Jelly bean',),  # index=232
-    ('Apple pie',),  # index=233
-    ('Udon',),  # index=234
-    ('Falafel',),  # index=235
-    ('Agedashi tofu',),  # index=236
-    ('Dashi',),  # index=237
-    ('Tortell',),  # index=238
-    ('Omelette',),  # index=239
-    ('Cr\xc3\xa8me br\xc3\xbbl\xc3\xa9e',),  # index=240
-    ('Cucumber soup',),  # index=241
-    ('French toast',),  # index=242
-    ('Tripe',),  # index=243
-    ('Pepperoni',),  # index=244
-    ('Salami',),  # index=245
-    ('Kimchi',),  # index=246
-    ('Kn\xc3\xb6del',),  # index=247
-    ('Takoyaki',),  # index=248
-    ('Halva',),  # index=249
-    ('Pigs in blankets',),  # index=250
-    ('Spanakopita',),  # index=251
-    ('Pumpkin pie',),  # index=252
-    ('Jambalaya',),  # index=253
-    ('Club sandwich',),  # index=254
-    ('Churro',),  # index=255
-    ('Turducken',),  # index=256
-    ('Welsh rarebit',),  # index=257
-    ('Hot dog',),  # index=258
-    ('Oyakodon',),  # index=259
-    ('Meatball',),  # index=260
-    ('Waldorf salad',),  # index=261
-    ('Potato salad',),  # index=262
-    ('Satay',),  # index=263
-    ('Pemmican',),  # index=264
-    ('M\xc3\xa4mmi',),  # index=265
-    ('Fideu\xc3\xa0',),  # index=266
-    ('Waffle',),  # index=267
-    ('Pancake',),  # index=268
-    ('Quiche',),  # index=269
-    ('Borscht',),  # index=270
-    ('Bratwurst',),  # index=271
-    ('Foie gras',),  # index=272
-    ('Burrito',),  # index=273
-    ('Goulash',),  # index=274
-    ('Spotted dick',),  # index=275
-    ('Coq au vin',),  # index=276
-    ('Ratatouille',),  # index=277
-    ('Cornbread',),  # index=278
-    ('Souvlaki',),  # index=279
-    ('Chow mein',),  # index=280
-    ('Roast beef',),  # index=281
-    ('Peking duck',),  # index=282
-    ('Fried chicken',),  # index=283
-    ('Croquembouche',),  # index=284
-    ('Tahini',),  # index=285
-    ('Gumbo',),  # index=286
-    ('Fajita',),  # index=287
-    ('Chicken fried steak',),  # index=288
-    ('Sukiyaki',),  # index=289
-    ('Scrapple',),  # index=290
-    ('Chili con carne',),  # index=291
-    ('Monte Cristo sandwich',),  # index=292
-    ('Kielbasa',),  # index=293
-    ('Polenta',),  # index=294
-    ('Reuben sandwich',),  # index=295
-    ("S'more",),  # index=296
-    ('Andouille',),  # index=297
-    ('Beignet',),  # index=298
-    ('Cr\xc3\xaape',),  # index=299
-    ('Gulai',),  # index=300
-    ('Breakfast sausage',),  # index=301
-    ('Chorizo',),  # index=302
-    ('Gyro',),  # index=303
-    ('Nachos',),  # index=304
-    ('Larb',),  # index=305
-    ('Couscous',),  # index=306
-    ('Meze',),  # index=307
-    ('Cheesesteak',),  # index=308
-    ('Frozen yogurt',),  # index=309
-    ('Injera',),  # index=310
-    ('Muesli',),  # index=311
-    ('Meatloaf',),  # index=312
-    ('Fuet',),  # index=313
-    ('Natt\xc5\x8d',),  # index=314
-    ('Banana split',),  # index=315
-    ('P\xc4\x85czki',),  # index=316
-    ('Pound cake',),  # index=317
-    ('Fuqi feipian',),  # index=318
-    ('Nasi lemak',),  # index=319
-    ('Flan',),  # index=320
-    ('Pad thai',),  # index=321
-    ('Yakitori',),  # index=322
-    ('Amanatt\xc5\x8d',),  # index=323
-    ('Tom kha kai',),  # index=324
-    ('Lokma',),  # index=325
-    ('Mooncake',),  # index=326
-    ('Idli',),  # index=327
-    ('Sp\xc3\xa4tzle',),  # index=328
-    ('Nopalito',),  # index=329
-    ('Sincronizada',),  # index=330
-    ('\xc5\xbdganci',),  # index=331
-    ('Totopo',),  # index=332
-    ('Folar',),  # index=333
-    ('Cherry pie',),  # index=334
-    ('Umeboshi',),  # index=335
-    ('Patty',),  # index=336
-    ('Saltah',),  # index=337
-    ('Khinkali',),  # index=338
-    ('Shkedei marak',),  # index=339
-    ('Tekkadon',),  # index=340
-    ('Chadachadi',),  # index=341
-    ('Kaipen',),  # index=342
-    ('Draw soup',),  # index=343
-    ('Shahan ful',),  # index=344
-    ('Shiro',),  # index=345
-    ("Ga'at",),  # index=346
-    ('Skordalia',),  # index=347
-    ('Budae jjigae',),  # index=348
-    ('Anju',),  # index=349
-    ('Fried Coke',),  # index=350
-    ('Lemang',),  # index=351
-    ('Basundi',),  # index=352
-    ('Brown Betty',),  # index=353
-    ('Khabees',),  # index=354
-    ('Kottu',),  # index=355
-    ('Isterband',),  # index=356
-    ('Ciauscolo',),  # index=357
-    ('Khatkhate',),  # index=358
-    ('Pan de muerto',),  # index=359
-    ('Caponata',),  # index=360
-    ('Pulla',),  # index=361
-    ('Sabaayad',),  # index=362
-    ('Miyeok-guk',),  # index=363
-    ('Imoni',),  # index=364
-    ('Pitha',),  # index=365
-    ('Kedgeree',),  # index=366
-    ('Bife a cavalo',),  # index=367
-    ('Yaki udon',),  # index=368
-    ('She-crab soup',),  # index=369
-    ('Koozh',),  # index=370
-    ('Ke\xc5\x9fkek',),  # index=371
-    ('Cabidela',),  # index=372
-    ('Gerber sandwich',),  # index=373
-    ('Zagorski \xc5\xa0trukli',),  # index=374
-    ('Himbasha',),  # index=375
-    ('Satara\xc5\xa1',),  # index=376
-    ('Kakuni',),  # index=377
-    ('Enormous Omelet Sandwich',),  # index=378
-    ('Turr\xc3\xb3n',),  # index=379
-    ('Tsukudani',),  # index=380
-    ('Hawaiian haystack',),  # index=381
-    ('Kateh',),  # index=382
-    ('Stoemp',),  # index=383
-    ('Pajeon',),  # index=384
-    ('\xc4\xa0bejna',),  # index=385
-    ('Kaya toast',),  # index=386
-    ('Fit-fit',),  # index=387
-    ('Kitcha',),  # index=388
-    ('Thalipeeth',),  # index=389
-    ('Figgy pudding',),  # index=390
-    ('Cachupa',),  # index=391
-    ('Cherries jubilee',),  # index=392
-    ('Crappit heid',),  # index=393
-    ('Mince and tatties',),  # index=394
-    ('Anadama bread',),  # index=395
-    ('Carbonara',),  # index=396
-    ('Kladdkaka',),  # index=397
-    ('Shakshouka',),  # index=398
-    ('Chicken Vesuvio',),  # index=399
-    ('Jibarito',),  # index=400
-    ('Chicken Divan',),  # index=401
-    ('Motsunabe',),  # index=402
-    ('Sonofabitch stew',),  # index=403
-    ('Pudding corn',),  # index=404
-    ('Johnny Marzetti',),  # index=405
-    ('Mostarda',),  # index=406
-    ('Maafe',),  # index=407
-    ('Churma',),  # index=408
-    ('Chole bhature',),  # index=409
-    ('Dobos torte',),  # index=410
-    ('Carne de porco \xc3\xa0 alentejana',),  # index=411
-    ('Khao soi',),  # index=412
-    ('Kissel',),  # index=413
-    ('Cottage loaf',),  # index=414
-    ('Silver needle noodles',),  # index=415
-    ('Shrimp DeJonghe',),  # index=416
-    ('Kiritanpo',),  # index=417
-    ('Bean pie',),  # index=418
-    ('Churchkhela',),  # index=419
-    ('Yahni',),  # index=420
-    ('Gringas',),  # index=421
-    ('Annin tofu',),  # index=422
-    ('Jiaozi',),  # index=423
-    ('Breakfast sandwich',),  # index=424
-    ('Tanghulu',),  # index=425
-    ('Black sesame soup',),  # index=426
-    ('Goug\xc3\xa8re',),  # index=427
-    ('Namul',),  # index=428
-    ('Kosambari',),  # index=429
-    ("Ma'amoul",),  # index=430
-    ('Caldo de pollo',),  # index=431
-    ('Loukaniko',),  # index=432
-    ('Doberge cake',),  # index=433
-    ('Nasi campur',),  # index=434
-    ('Snack cake',),  # index=435
-    ('Taiyaki',),  # index=436
-    ('Karn\xc4\xb1yar\xc4\xb1k',),  # index=437
-    ('Pierogi',),  # index=438
-    ('Macaroni and cheese',),  # index=439
-    ('Huevos motule\xc3\xb1os',),  # index=440
-    ('Chislic',),  # index=441
-    ('Corn dog',),  # index=442
-    ('Shawarma',),  # index=443
-    ('Zongzi',),  # index=444
-    ('Dumpling',),  # index=445
-    ('Syrniki',),  # index=446
-    ('King cake',),  # index=447
-    ('Souffl\xc3\xa9',),  # index=448
-    ('Gy\xc5\xabdon',),  # index=449
-    ('Chicken nugget',),  # index=450
-    ('Bulgogi',),  # index=451
-    ('Eggs Benedict',),  # index=452
-    ('Hot dry noodles',),  # index=453
-    ('Mashed potato',),  # index=454
-    ('Anpan',),  # index=455
-    ('Quesadilla',),  # index=456
-    ('Youtiao',),  # index=457
-    ('Congee',),  # index=458
-    ('Sekihan',),  # index=459
-    ('Semla',),  # index=460
-    ('Arctic roll',),  # index=461
-    ('Castella',),  # index=462
-    ('Hanabiramochi',),  # index=463
-    ('Falukorv',),  # index=464
-    ('Ketupat',),  # index=465
-    ('Rendang',),  # index=466
-    ('Chocolate brownie',),  # index=467
-    ('Mapo doufu',),  # index=468
-    ('Chinese noodles',),  # index=469
-    ('Empanada',),  # index=470
-    ('Fried rice',),  # index=471
-    ('Chicago-style pizza',),  # index=472
-    ('Cuban sandwich',),  # index=473
-    ('Tarte Tatin',),  # index=474
-    ('Yakisoba',),  # index=475
-    ('Dagwood sandwich',),  # index=476
-    ('Cheesecake',),  # index=477
-    ('Samosa',),  # index=478
-    ("Devil's food cake",),  # index=479
-    ('Shashlik',),  # index=480
-    ('Horseshoe sandwich',),  # index=481
-    ('City chicken',),  # index=482
-    ('Key lime pie',),  # index=483
-    ('Potato skins',),  # index=484
-    ('Haejang-guk',),  # index=485
-    ('Burmese tofu',),  # index=486
-    ('Shumai',),  # index=487
-    ('Sour cherry soup',),  # index=488
-    ('Gigandes plaki',),  # index=489
-    ('Kabsa',),  # index=490
-    ('Chicken curry',),  # index=491
-    ('Shrimp Creole',),  # index=492
-    ('Pork tenderloin sandwich',),  # index=493
-    ('Dampfnudel',),  # index=494
-    ('Finnan haddie',),  # index=495
-    ('Kenkey',),  # index=496
-    ('Pincho',),  # index=497
-    ('Gundruk',),  # index=498
-    ('Chilorio',),  # index=499
-    ('Koulourakia',),  # index=500
-    ('Bryndzov\xc3\xa9 halu\xc5\xa1ky',),  # index=501
-    ('Imagawayaki',),  # index=502
-    ('Vasilopita',),  # index=503
-    ('Strapa\xc4\x8dky',),  # index=504
-    ("Po' boy",),  # index=505
-    ('Capirotada',),  # index=506
-    ('Beef Manhattan',),  # index=507
-    ('Sandwich loaf',),  # index=508
-    ('Jian dui',),  # index=509
-    ('Almond biscuit',),  # index=510
-    ('North Slavic fermented cereal soups',),  # index=511
-    ('Fried plantain',),  # index=512
-    ('Stuffed peppers',),  # index=513
-    ('Piperade',),  # index=514
-    ('Rogan josh',),  # index=515
-    ('Fabada asturiana',),  # index=516
-    ('Potato wedges',),  # index=517
-    ('Calisson',),  # index=518
-    ('Prawn ball',),  # index=519
-    ('Kushikatsu',),  # index=520
-    ('Lo mai chi',),  # index=521
-    ('Manchet',),  # index=522
-    ('Leek soup',),  # index=523
-    ('Vanillerostbraten',),  # index=524
-    ('Hangtown fry',),  # index=525
-    ('Cabbie claw',),  # index=526
-    ('Chitranna',),  # index=527
-    ('Ragi mudde',),  # index=528
-    ('Denver sandwich',),  # index=529
-    ('Laver',),  # index=530
-    ('Elote',),  # index=531
-    ('Kulolo',),  # index=532
-    ('Oxtail soup',),  # index=533
-    ('Pantua',),  # index=534
-    ('Corn relish',),  # index=535
-    ('Poga\xc4\x8da',),  # index=536
-    ('Qubani ka meetha',),  # index=537
-    ('Boondi',),  # index=538
-    ('Arrosticini',),  # index=539
-    ('Panelle',),  # index=540
-    ('Santula',),  # index=541
-    ('Tofu skin roll',),  # index=542
-    ('Crispy fried chicken',),  # index=543
-    ('Steamed meatball',),  # index=544
-    ('Lobio',),  # index=545
-    ('Suman',),  # index=546
-    ('H\xc5\x8dt\xc5\x8d',),  # index=547
-    ('Matbukha',),  # index=548
-    ('Stuffed squash',),  # index=549
-    ('A\xc3\xa7orda',),  # index=550
-    ('Makdous',),  # index=551
-    ('Soto',),  # index=552
-    ('Frangollo',),  # index=553
-    ('Patty melt',),  # index=554
-    ('Taro dumpling',),  # index=555
-    ('Entomatada',),  # index=556
-    ('B\xc3\xa1nh cu\xe1\xbb\x91n',),  # index=557
-    ('Corunda',),  # index=558
-    ('Zhaliang',),  # index=559
-    ('Cassoulet',),  # index=560
-    ('Debrecener',),  # index=561
-    ('Scampi',),  # index=562
-    ('Pilaf',),  # index=563
-    ('Sambar',),  # index=564
-    ('Century egg',),  # index=565
-    ('Escargot',),  # index=566
-    ('Cong you bing',),  # index=567
-    ('Beef noodle soup',),  # index=568
-    ('Magiritsa',),  # index=569
-    ('Gugelhupf',),  # index=570
-    ('Sachima',),  # index=571
-    ('White rice',),  # index=572
-    ('Maultasche',),  # index=573
-    ('American chop suey',),  # index=574
-    ('Fish slice',),  # index=575
-    ('Sea cucumber as food',),  # index=576
-    ('Beef ball',),  # index=577
-    ('Siu yuk',),  # index=578
-    ('Seafood birdsnest',),  # index=579
-    ('White cut chicken',),  # index=580
-    ('Pinchitos',),  # index=581
-    ('Satsivi',),  # index=582
-    ('Malpua',),  # index=583
-    ('Chhena gaja',),  # index=584
-    ('Flying Jacob',),  # index=585
-    ('Steak de Burgo',),  # index=586
-    ('Crab Louie',),  # index=587
-    ('Butter chicken',),  # index=588
-    ('Amok trey',),  # index=589
-    ('Menemen',),  # index=590
-    ('Piadina',),  # index=591
-    ('Orange cuttlefish',),  # index=592
-    ('Fudge',),  # index=593
-    ('Cottage Pudding',),  # index=594
-    ('Meatcake',),  # index=595
-    ('Buttermilk pie',),  # index=596
-    ('Kalamay',),  # index=597
-    ('Puto',),  # index=598
-    ('Dal makhani',),  # index=599
-    ('Mixiote',),  # index=600
-    ('Bagel dog',),  # index=601
-    ('B\xc3\xban ri\xc3\xaau',),  # index=602
-    ('Feijoada',),  # index=603
-    ('Pho',),  # index=604
-    ('Milk toast',),  # index=605
-    ('Liver and onions',),  # index=606
-    ('Iced bun',),  # index=607
-    ('Sheer khurma',),  # index=608
-    ('Yi mein',),  # index=609
-    ('Shrimp roe noodles',),  # index=610
-    ('Lai fun',),  # index=611
-    ('Oil noodles',),  # index=612
-    ('Kal-guksu',),  # index=613
-    ('Youmian',),  # index=614
-    ('Avgolemono',),  # index=615
-    ('Pork roll',),  # index=616
-    ('Tart',),  # index=617
-    ('Leberk\xc3\xa4se',),  # index=618
-    ('Kalakukko',),  # index=619
-    ('Mustamakkara',),  # index=620
-    ('Baba ghanoush',),  # index=621
-    ('Karelian pasty',),  # index=622
-    ('Shortcake',),  # index=623
-    ('Profiterole',),  # index=624
-    ('Moussaka',),  # index=625
-    ('Dulce de leche',),  # index=626
-    ('Blaa',),  # index=627
-    ('Risotto',),  # index=628
-    ('Funnel cake',),  # index=629
-    ('Fried dough',),  # index=630
-    ('Consomm\xc3\xa9',),  # index=631
-    ('Clam chowder',),  # index=632
-    ('Tartiflette',),  # index=633
-    ('Red curry',),  # index=634
-    ('Tandoori chicken',),  # index=635
-    ('Gazpacho',),  # index=636
-    ('Prosciutto',),  # index=637
-    ('Boerewors',),  # index=638
-    ('Baked potato',),  # index=639
-    ('Bouillabaisse',),  # index=640
-    ('Kralan',),  # index=641
-    ('Chireta',),  # index=642
-    ('Bakewell tart',),  # index=643
-    ('Grits',),  # index=644
-    ('Shaved ice',),  # index=645
-    ('Choco pie',),  # index=646
-    ('Cumian',),  # index=647
-    ('Jokbal',),  # index=648
-    ('Grillades',),  # index=649
-    ('Hotteok',),  # index=650
-    ('Ezogelin soup',),  # index=651
-    ('Knedle',),  # index=652
-    ('Masgouf',),  # index=653
-    ('Sope',),  # index=654
-    ('Coconut rice',),  # index=655
-    ('Bakarkhani',),  # index=656
-    ('Asida',),  # index=657
-    ('Dirt cake',),  # index=658
-    ('Sel roti',),  # index=659
-    ('Kalakand',),  # index=660
-    ('Ghevar',),  # index=661
-    ('Sussex pond pudding',),  # index=662
-    ('Lontong',),  # index=663
-    ('B\xc3\xa1nh b\xc3\xa8o',),  # index=664
-    ('Pring\xc3\xa1',),  # index=665
-    ('Bull roast',),  # index=666
-    ('Stuffed ham',),  # index=667
-    ('Lablabi',),  # index=668
-    ('Gooey butter cake',),  # index=669
-    ('Carciofi alla giudia',),  # index=670
-    ('Yin si juan',),  # index=671
-    ('Babi panggang',),  # index=672
-    ('Chao hong guo',),  # index=673
-    ('Fun guo',),  # index=674
-    ('Khira sagara',),  # index=675
-    ('Coconut bar',),  # index=676
-    ('Sundae',),  # index=677
-    ('Tuna fish sandwich',),  # index=678
-    ('Zhangcha duck',),  # index=679
-    ('Marry girl cake',),  # index=680
-    ('Frijoles charros',),  # index=681
-    ('Rosca de reyes',),  # index=682
-    ('Happy Faces',),  # index=683
-    ('Deviled crab',),  # index=684
-    ('Sundubu-jjigae',),  # index=685
-    ('Sinseollo',),  # index=686
-    ('Dongchimi',),  # index=687
-    ('Nabak-kimchi',),  # index=688
-    ('Dhondas',),  # index=689
-    ('Soan papdi',),  # index=690
-    ('Baek-kimchi',),  # index=691
-    ('Chicken riggies',),  # index=692
-    ('Afelia',),  # index=693
-    ('Guly\xc3\xa1sleves',),  # index=694
-    ('Marie biscuit',),  # index=695
-    ('Caf\xc3\xa9 li\xc3\xa9geois',),  # index=696
-    ('Ch\xc3\xa8',),  # index=697
-    ('Pootharekulu',),  # index=698
-    ('Escalope',),  # index=699
-    ('Rajma',),  # index=700
-    ('Beshbarmak',),  # index=701
-    ('Torta Tre Monti',),  # index=702
-    ('French dip',),  # index=703
-    ('Pumpkin-coconut custard',),  # index=704
-    ('Rose hip soup',),  # index=705
-    ('Veggie burger',),  # index=706
-    ('Steak tartare',),  # index=707
-    ('Bologna sausage',),  # index=708
-    ('P\xc3\xa2t\xc3\xa9',),  # index=709
-    ('Bibimbap',),  # index=710
-    ('Shahi paneer',),  # index=711
-    ('Fufu',),  # index=712
-    ('Pyttipanna',),  # index=713
-    ('Chicken sandwich',),  # index=714
-    ('Ghari',),  # index=715
-    ('Michigan salad',),  # index=716
-    ('Cabinet pudding',),  # index=717
-    ('American fried rice',),  # index=718
-    ('Korovai',),  # index=719
-    ('Churrasco',),  # index=720
-    ('Pasulj',),  # index=721
-    ('Mitraillette',),  # index=722
-    ('Salat\xc4\x83 de boeuf',),  # index=723
-    ('Rice pudding',),  # index=724
-    ('R\xc3\xb6sti',),  # index=725
-    ('Naryn',),  # index=726
-    ('Kaldereta',),  # index=727
-    ('Makroudh',),  # index=728
-    ('Kachumbari',),  # index=729
-    ('Tsukemono',),  # index=730
-    ('Cheese fries',),  # index=731
-    ('Slatko',),  # index=732
-    ('Qatayef',),  # index=733
-    ('Passatelli',),  # index=734
-    ('Sweet potato soup',),  # index=735
-    ('Shchi',),  # index=736
-    ('Kulfi',),  # index=737
-    ('Dolma',),  # index=738
-    ('Kai yang',),  # index=739
-    ('Shark fin soup',),  # index=740
-    ('Pozole',),  # index=741
-    ('Pakora',),  # index=742
-    ('Chantilly cake',),  # index=743
-    ('Kr\xc3\xb3wki',),  # index=744
-    ('Russian tea cake',),  # index=745
-    ('Ox-tongue pastry',),  # index=746
-    ('Sachertorte',),  # index=747
-    ('Palitaw',),  # index=748
-    ('Jolpan',),  # index=749
-    ('Mantou',),  # index=750
-    ('Finger steaks',),  # index=751
-    ('Steak sandwich',),  # index=752
-    ('Talo',),  # index=753
-    ('Erkuai',),  # index=754
-    ('Mixian',),  # index=755
-    ('St. Louis-style pizza',),  # index=756
-    ('Moambe',),  # index=757
-    ('Upma',),  # index=758
-    ('Panjiri',),  # index=759
-    ('Eggs Sardou',),  # index=760
-    ('Shanghai fried noodles',),  # index=761
-    ('Quarkk\xc3\xa4ulchen',),  # index=762
-    ('Cupcake',),  # index=763
-    ('Snickerdoodle',),  # index=764
-    ('Farl',),  # index=765
-    ('Coleslaw',),  # index=766
-    ('Calas',),  # index=767
-    ('Beef Stroganoff',),  # index=768
-    ('Shimotsukare',),  # index=769
-    ('Squab',),  # index=770
-    ('Basbousa',),  # index=771
-    ('Watalappam',),  # index=772
-    ('Tepsi baytinijan',),  # index=773
-    ('Kuli-kuli',),  # index=774
-    ('Shabu-shabu',),  # index=775
-    ('Sundae',),  # index=776
-    ('Fried brain sandwich',),  # index=777
-    ('Rollmops',),  # index=778
-    ('Higashi',),  # index=779
-    ('Panna cotta',),  # index=780
-    ('Aloo gobi',),  # index=781
-    ('Aspic',),  # index=782
-    ('Obatzda',),  # index=783
-    ('Gulab jamun',),  # index=784
-    ('Tuna casserole',),  # index=785
-    ('Ribollita',),  # index=786
-    ('Chomchom',),  # index=787
-    ('Rassolnik',),  # index=788
-    ('Jeongol',),  # index=789
-    ('Cantonese seafood soup',),  # index=790
-    ('Mashed Eggplant Salad',),  # index=791
-    ('K\xc3\xbcrt\xc5\x91skal\xc3\xa1cs',),  # index=792
-    ('P\xc3\xb6lsa',),  # index=793
-    ('Lobster roll',),  # index=794
-    ('Sloppy joe',),  # index=795
-    ('Schnitzel',),  # index=796
-    ('Bacalhau',),  # index=797
-    ('Sfenj',),  # index=798
-    ('Menudo',),  # index=799
-    ('Gujia',),  # index=800
-    ('Liver soup',),  # index=801
-    ('Panocha',),  # index=802
-    ('Chakapuli',),  # index=803
-    ('Sklandrausis',),  # index=804
-    ('Liver p\xc3\xa2t\xc3\xa9',),  # index=805
-    ('Rullep\xc3\xb8lse',),  # index=806
-    ('Frikadeller',),  # index=807
-    ('Frikandel',),  # index=808
-    ('Cinnamon roll',),  # index=809
-    ('Scotch pie',),  # index=810
-    ('Hot wiener',),  # index=811
-    ('Wodzionka',),  # index=812
-    ('Greek salad',),  # index=813
-    ('Raita',),  # index=814
-    ("Dong'an chicken",),  # index=815
-    ('Boortsog',),  # index=816
-    ('Coca',),  # index=817
-    ('Champon',),  # index=818
-    ('Tabbouleh',),  # index=819
-    ('Korokke',),  # index=820
-    ('Chile relleno',),  # index=821
-    ('Brandade',),  # index=822
-    ('Hoppang',),  # index=823
-    ('Gozinaki',),  # index=824
-    ('Lazarakia',),  # index=825
-    ('Puff Puff',),  # index=826
-    ('Fatteh',),  # index=827
-    ('Speculaas',),  # index=828
-    ('Karasumi',),  # index=829
-    ('Brandy snaps',),  # index=830
-    ('Trdeln\xc3\xadk',),  # index=831
-    ('Cocido madrile\xc3\xb1o',),  # index=832
-    ('Red velvet cake',),  # index=833
-    ('Kringle',),  # index=834
-    ('Quenelle',),  # index=835
-    ('Toasted ravioli',),  # index=836
-    ('Tajine',),  # index=837
-    ('Cranachan',),  # index=838
-    ('Rusk',),  # index=839
-    ('Mille-feuille',),  # index=840
-    ('Acorn noodle soup',),  # index=841
-    ('Gachas',),  # index=842
-    ('Jingisukan',),  # index=843
-    ('Thekua',),  # index=844
-    ('Ghugni',),  # index=845
-    ('Taramasalata',),  # index=846
-    ('Italian beef',),  # index=847
-    ('Challah',),  # index=848
-    ('Fried ice cream',),  # index=849
-    ('Onion ring',),  # index=850
-    ('Smoked meat',),  # index=851
-    ('Dahi vada',),  # index=852
-    ('Mother-in-law',),  # index=853
-    ('Blondie',),  # index=854
-    ('Guk',),  # index=855
-    ('Hiyashi ch\xc5\xabka',),  # index=856
-    ('Sweet shells',),  # index=857
-    ('Salisbury steak',),  # index=858
-    ('Poffertjes',),  # index=859
-    ('Eggs Neptune',),  # index=860
-    ('Galbi-jjim',),  # index=861
-    ('Agwi-jjim',),  # index=862
-    ('Ladob',),  # index=863
-    ('Instant-boiled mutton',),  # index=864
-    ('Cincalok',),  # index=865
-    ('Jook-sing noodles',),  # index=866
-    ('Potbrood',),  # index=867
-    ('Burkinab\xc3\xa9 cuisine',),  # index=868
-    ('Taralli',),  # index=869
-    ('Carbonade flamande',),  # index=870
-    ('X\xc3\xb4i',),  # index=871
-    ('Sauerbraten',),  # index=872
-    ('Spiedie',),  # index=873
-    ('Gimbap',),  # index=874
-    ('Czernina',),  # index=875
-    ('Kroppkaka',),  # index=876
-    ("Buddha's delight",),  # index=877
-    ('Pain au chocolat',),  # index=878
-    ('Goetta',),  # index=879
-    ('German chocolate cake',),  # index=880
-    ('Melt sandwich',),  # index=881
-    ('Popiah',),  # index=882
-    ('Haleem',),  # index=883
-    ('Hornazo',),  # index=884
-    ('Janchi-guksu',),  # index=885
-    ('Kipper',),  # index=886
-    ('Bossam',),  # index=887
-    ('Arbroath smokie',),  # index=888
-    ('Bologna sandwich',),  # index=889
-    ('Cobbler',),  # index=890
-    ('Kouign-amann',),  # index=891
-    ('Char kway teow',),  # index=892
-    ('Rostbr\xc3\xa4tel',),  # index=893
-    ('Doenjang-jjigae',),  # index=894
-    ('Tharid',),  # index=895
-    ('Hainanese chicken rice',),  # index=896
-    ('Bak kut teh',),  # index=897
-    ('Cabbage roll',),  # index=898
-    ('Runza',),  # index=899
-    ('Bananas Foster',),  # index=900
-    ('Kozhukkatta',),  # index=901
-    ('K\xc5\xab\xc4\x8diukai',),  # index=902
-    ('Sm\xc3\xb8rrebr\xc3\xb8d',),  # index=903
-    ('Kutia',),  # index=904
-    ('Deviled egg',),  # index=905
-    ('Buchteln',),  # index=906
-    ('Apple strudel',),  # index=907
-    ('Wonton',),  # index=908
-    ('Chess pie',),  # index=909
-    ('Pirozhki',),  # index=910
-    ('Douzhi',),  # index=911
-    ('Macaroni soup',),  # index=912
-    ('Crossing the bridge noodles',),  # index=913
-    ('Lechazo',),  # index=914
-    ('Rolled oyster',),  # index=915
-    ('Asam pedas',),  # index=916
-    ('Mi krop',),  # index=917
-    ('Patoleo',),  # index=918
-    ('Rig\xc3\xb3 Jancsi',),  # index=919
-    ('Ollada',),  # index=920
-    ('Garbure',),  # index=921
-    ('Sabudana Khichadi',),  # index=922
-    ('Pot\xc3\xa9e',),  # index=923
-    ('Phanaeng curry',),  # index=924
-    ('Madeleine',),  # index=925
-    ('Mashed pumpkin',),  # index=926
-    ('Suet pudding',),  # index=927
-    ('Bombay mix',),  # index=928
-    ('Namagashi',),  # index=929
-    ('Struffoli',),  # index=930
-    ('Dak-galbi',),  # index=931
-    ('Dumpling',),  # index=932
-    ('Misal',),  # index=933
-    ('Patatnik',),  # index=934
-    ('Yuxiang',),  # index=935
-    ('Frozen banana',),  # index=936
-    ('Psarosoupa',),  # index=937
-    ('Mekitsa',),  # index=938
-    ('Sanna',),  # index=939
-    ('Kazy',),  # index=940
-    ('Sorbetes',),  # index=941
-    ("Potatoes O'Brien",),  # index=942
-    ('Tom yum',),  # index=943
-    ('Balushahi',),  # index=944
-    ('Arroz a la cubana',),  # index=945
-    ('Jalebi',),  # index=946
-    ('Sopaipilla',),  # index=947
-    ('Ukha',),  # index=948
-    ('Sv\xc3\xad\xc4\x8dkov\xc3\xa1',),  # index=949
-    ('T\xc3\xbar\xc3\xb3s csusza',),  # index=950
-    ('Pinnekj\xc3\xb8tt',),  # index=951
-    ('Salty liquorice',),  # index=952
-    ('Lemon ice box pie',),  # index=953
-    ('Knickerbocker glory',),  # index=954
-    ('Zhajiangmian',),  # index=955
-    ('Cobb salad',),  # index=956
-    ('Misua',),  # index=957
-    ('Shoofly pie',),  # index=958
-    ('Bhakri',),  # index=959
-    ('Apple cake',),  # index=960
-    ('Orange chicken',),  # index=961
-    ('Jam\xc3\xb3n serrano',),  # index=962
-    ('Bundt cake',),  # index=963
-    ('Bara brith',),  # index=964
-    ('Hot pot',),  # index=965
-    ('Kung Pao chicken',),  # index=966
-    ('Mulukhiyah',),  # index=967
-    ('Piti',),  # index=968
-    ('Double ka meetha',),  # index=969
-    ('Choila',),  # index=970
-    ('Moustalevria',),  # index=971
-    ('Arizona cheese crisp',),  # index=972
-    ('Rice Krispies Treats',),  # index=973
-    ('Liangpi',),  # index=974
-    ('Prinskorv',),  # index=975
-    ('Salmorejo',),  # index=976
-    ('Chicken Fran\xc3\xa7aise',),  # index=977
-    ('Fl\xc3\xa4skkorv',),  # index=978
-    ('Glorified rice',),  # index=979
-    ('Shishbarak',),  # index=980
-    ('Stinky tofu',),  # index=981
-    ('Muffuletta',),  # index=982
-    ('Soy sauce chicken',),  # index=983
-    ('Chicken fingers',),  # index=984
-    ('Pecan pie',),  # index=985
-    ('Eba',),  # index=986
-    ('Parfait',),  # index=987
-    ('Ndol\xc3\xa9',),  # index=988
-    ('Cheese sandwich',),  # index=989
-    ("Carne de vinha d'alhos",),  # index=990
-    ('Bob Andy pie',),  # index=991
-    ('Cincinnati chili',),  # index=992
-    ('Frico',),  # index=993
-    ('Tapioca pudding',),  # index=994
-    ('Minestrone',),  # index=995
-    ('Boxty',),  # index=996
-    ('Naengmyeon',),  # index=997
-    ('Seven-layer salad',),  # index=998
-    ('Samgyeopsal',),  # index=999
-    ('Cawl',),  # index=1000
-    ('Chocolate pudding',),  # index=1001
-    ('Hotdish',),  # index=1002
-    ('Ciccioli',),  # index=1003
-    ('Douhua',),  # index=1004
-    ('Berliner',),  # index=1005
-    ('Fried fish',),  # index=1006
-    ('Apple crisp',),  # index=1007
-    ('Boudin',),  # index=1008
-    ('Yusheng',),  # index=1009
-    ('Babka',),  # index=1010
-    ('Pizzoccheri',),  # index=1011
-    ('Welsh cake',),  # index=1012
-    ('Parker House roll',),  # index=1013
-    ('Tripe soups',),  # index=1014
-    ('Chimichanga',),  # index=1015
-    ('Jucy Lucy',),  # index=1016
-    ('Dodger Dog',),  # index=1017
-    ('Pastiera',),  # index=1018
-    ('Huarache',),  # index=1019
-    ('Solkadhi',),  # index=1020
-    ('Schupfnudel',),  # index=1021
-    ('Waldorf pudding',),  # index=1022
-    ('Harees',),  # index=1023
-    ('Ash reshteh',),  # index=1024
-    ('Celery Victor',),  # index=1025
-    ('Diples',),  # index=1026
-    ('Kompot',),  # index=1027
-    ('French onion soup',),  # index=1028
-    ('Tres leches cake',),  # index=1029
-    ('Torta caprese',),  # index=1030
-    ('Black Forest gateau',),  # index=1031
-    ('P\xc3\xa2t\xc3\xa9 aux pommes de terre',),  # index=1032
-    ('L\xc3\xa2pa',),  # index=1033
-    ('B\xc3\xbcndner Nusstorte',),  # index=1034
-    ('Hachee',),  # index=1035
-    ('Spaghetti aglio e olio',),  # index=1036
-    ('Whoopie pie',),  # index=1037
-    ('Ais kacang',),  # index=1038
-    ('Chermoula',),  # index=1039
-    ('Gado-gado',),  # index=1040
-    ('Merguez',),  # index=1041
-    ('Snickers salad',),  # index=1042
-    ('Giouvetsi',),  # index=1043
-    ('Kharcho',),  # index=1044
-    ('Chicken fried bacon',),  # index=1045
-    ('Dessert bar',),  # index=1046
-    ('Coulibiac',),  # index=1047
-    ('Thieboudienne',),  # index=1048
-    ('Rabri',),  # index=1049
-    ('Sapin-sapin',),  # index=1050
-    ('Sealed crustless sandwich',),  # index=1051
-    ('Carne asada',),  # index=1052
-    ('Coyotas',),  # index=1053
-    ('Chocolate-covered bacon',),  # index=1054
-    ('Stroopwafel',),  # index=1055
-    ('Gravlax',),  # index=1056
-    ('Pot pie',),  # index=1057
-    ('Ghormeh sabzi',),  # index=1058
-    ('Surf and turf',),  # index=1059
-    ('Brunswick stew',),  # index=1060
-    ('Mititei',),  # index=1061
-    ('Fluffernutter',),  # index=1062
-    ('Khaja',),  # index=1063
-    ('Stottie cake',),  # index=1064
-    ('London broil',),  # index=1065
-    ('Fasolada',),  # index=1066
-    ('Strudel',),  # index=1067
-    ('\xc3\x98llebr\xc3\xb8d',),  # index=1068
-    ('Tamago kake gohan',),  # index=1069
-    ('Hot water corn bread',),  # index=1070
-    ('Philippine adobo',),  # index=1071
-    ('Hulatang',),  # index=1072
-    ('Dyrl\xc3\xa6gens natmad',),  # index=1073
-    ('Chistorra',),  # index=1074
-    ('Polkagris',),  # index=1075
-    ('Galbi-tang',),  # index=1076
-    ('Mrouzia',),  # index=1077
-    ('Gopchang-jeongol',),  # index=1078
-    ('Miang kham',),  # index=1079
-    ('Clams casino',),  # index=1080
-    ('Nanbanzuke',),  # index=1081
-    ('Dripping cake',),  # index=1082
-    ('Cookie salad',),  # index=1083
-    ('Usal',),  # index=1084
-    ('Mandu-guk',),  # index=1085
-    ('Smalahove',),  # index=1086
-    ('Kokis',),  # index=1087
-    ('Ori-tang',),  # index=1088
-    ('Pakhala',),  # index=1089
-    ('Cream pie',),  # index=1090
-    ('Butajiru',),  # index=1091
-    ('New England boiled dinner',),  # index=1092
-    ('Chhena jalebi',),  # index=1093
-    ('Pastitsio',),  # index=1094
-    ('Panucho',),  # index=1095
-    ('Chhena kheeri',),  # index=1096
-    ('Kifli',),  # index=1097
-    ('Solyanka',),  # index=1098
-    ('Sadhya',),  # index=1099
-    ('Cullen skink',),  # index=1100
-    ('Chokladboll',),  # index=1101
-    ('Harira',),  # index=1102
-    ('Cornish game hen',),  # index=1103
-    ('Beef on weck',),  # index=1104
-    ('Tompouce',),  # index=1105
-    ('Caldo de siete mares',),  # index=1106
-    ('Millionb\xc3\xb8f',),  # index=1107
-    ('Chicago-style hot dog',),  # index=1108
-    ('Risalamande',),  # index=1109
-    ('Alinazik kebab',),  # index=1110
-    ('Medisterp\xc3\xb8lse',),  # index=1111
-    ('Sarson da saag',),  # index=1112
-    ('Liangfen',),  # index=1113
-    ('Pistolette',),  # index=1114
-    ('Steamed clams',),  # index=1115
-    ('Ulam',),  # index=1116
-    ('Kheer',),  # index=1117
-    ('Tlacoyo',),  # index=1118
-    ('Tarator',),  # index=1119
-    ('Hu tieu',),  # index=1120
-    ('Teja',),  # index=1121
-    ('Cochinita pibil',),  # index=1122
-    ('Buddha Jumps Over the Wall',),  # index=1123
-    ('Sfouf',),  # index=1124
-    ('Ham and cheese sandwich',),  # index=1125
-    ('Peanut butter', 'banana and bacon sandwich'),  # index=1126
-    ('Bacon', 'egg and cheese sandwich'),  # index=1127
-    ('Chicken karahi',),  # index=1128
-    ('Maple bacon donut',),  # index=1129
-    ('Litti',),  # index=1130
-    ('Nam khao',),  # index=1131
-    ('Nam tok',),  # index=1132
-    ('Baozi',),  # index=1133
-    ('Kibbeh',),  # index=1134
-    ('Kushari',),  # index=1135
-    ('Jiuniang',),  # index=1136
-    ('Aseed',),  # index=1137
-    ('Machher Jhol',),  # index=1138
-    ('Fahsa',),  # index=1139
-    ('Mysore pak',),  # index=1140
-    ('Chalupa',),  # index=1141
-    ('Swiss roll',),  # index=1142
-    ('Balkenbrij',),  # index=1143
-    ('Tortas de aceite',),  # index=1144
-    ('Popover',),  # index=1145
-    ('Falooda',),  # index=1146
-    ('Macaroni salad',),  # index=1147
-    ('Barbacoa',),  # index=1148
-    ('Hushpuppy',),  # index=1149
-    ('Luther Burger',),  # index=1150
-    ('Ragout',),  # index=1151
-    ('B\xc3\xa1nh bao',),  # index=1152
-    ('Moronga',),  # index=1153
-    ('Hayashi rice',),  # index=1154
-    ('Z\xc3\xbcrcher Geschnetzeltes',),  # index=1155
-    ('\xc3\x89clair',),  # index=1156
-    ('Colcannon',),  # index=1157
-    ('Bear claw',),  # index=1158
-    ('Francesinha',),  # index=1159
-    ('Wat',),  # index=1160
-    ('Loco moco',),  # index=1161
-    ('Hot milk cake',),  # index=1162
-    ('Hoe',),  # index=1163
-    ('Gordita',),  # index=1164
-    ('Macaron',),  # index=1165
-    ('Pepperoni roll',),  # index=1166
-    ('Rasgulla',),  # index=1167
-    ('Angel wings',),  # index=1168
-    ('Huevos rancheros',),  # index=1169
-    ('Caprese salad',),  # index=1170
-    ('Kombdi vade',),  # index=1171
-    ('Yong Tau Foo',),  # index=1172
-    ('Chai tow kway',),  # index=1173
-    ('Machaca',),  # index=1174
-    ('Ugali',),  # index=1175
-    ('Arr\xc3\xb2s negre',),  # index=1176
-    ('Kimchi fried rice',),  # index=1177
-    ('Frybread',),  # index=1178
-    ('Halo-halo',),  # index=1179
-    ('Shiokara',),  # index=1180
-    ('Janssons frestelse',),  # index=1181
-    ('Hot Brown',),  # index=1182
-    ('Torta',),  # index=1183
-    ('\xc4\x86evapi',),  # index=1184
-    ('Salt water taffy',),  # index=1185
-    ('\xc3\x87\xc4\xb1lb\xc4\xb1r',),  # index=1186
-    ('Murtabak',),  # index=1187
-    ('Tahu goreng',),  # index=1188
-    ('Soto ayam',),  # index=1189
-    ('Mee siam',),  # index=1190
-    ('Submarine sandwich',),  # index=1191
-    ('Halu\xc5\xa1ky',),  # index=1192
-    ('Kimchi-jjigae',),  # index=1193
-    ('Fish ball',),  # index=1194
-    ('Blodpalt',),  # index=1195
-    ('Lebanon bologna',),  # index=1196
-    ('Okroshka',),  # index=1197
-    ('Linzer torte',),  # index=1198
-    ('Shrikhand',),  # index=1199
-    ('Yakiniku',),  # index=1200
-    ('Huevos divorciados',),  # index=1201
-    ('Nihari',),  # index=1202
-    ('Saut\xc3\xa9ed reindeer',),  # index=1203
-    ('Hasty pudding',),  # index=1204
-    ('Mission burrito',),  # index=1205
-    ('Sweet and sour pork',),  # index=1206
-    ('R\xc3\xb8dgr\xc3\xb8d',),  # index=1207
-    ('Booyah',),  # index=1208
-    ('Bienenstich',),  # index=1209
-    ('Dressed herring',),  # index=1210
-    ('New York-style pizza',),  # index=1211
-    ('Bistek',),  # index=1212
-    ('Sinigang',),  # index=1213
-    ('Fios de ovos',),  # index=1214
-    ('Vitello tonnato',),  # index=1215
-    ('Bisque',),  # index=1216
-    ('Khao tom',),  # index=1217
-    ('Modak',),  # index=1218
-    ('New Haven-style pizza',),  # index=1219
-    ('California-style pizza',),  # index=1220
-    ('Wrap',),  # index=1221
-    ('Puri',),  # index=1222
-    ('Jam\xc3\xb3n',),  # index=1223
-    ('Khash',),  # index=1224
-    ('Beef bourguignon',),  # index=1225
-    ('Truffade',),  # index=1226
-    ('B\xc3\xb2 n\xc6\xb0\xe1\xbb\x9bng l\xc3\xa1 l\xe1\xbb\x91t',
-     ),  # index=1227
-    ('Ful medames',),  # index=1228
-    ('Aligot',),  # index=1229
-    ('Kolach',),  # index=1230
-    ('Guaiwei',),  # index=1231
-    ('Kesme',),  # index=1232
-    ('Funeral potatoes',),  # index=1233
-    ('Sushi',),  # index=1234
-    ('Arancini',),  # index=1235
-    ('Creamed corn',),  # index=1236
-    ('Mozzarella sticks',),  # index=1237
-    ('American goulash',),  # index=1238
-    ('Gofio',),  # index=1239
-    ('Soup alla Canavese',),  # index=1240
-    ('Red beans and rice',),  # index=1241
-    ('R\xc3\xb6ssypottu',),  # index=1242
-    ('Fl\xc3\xa4skpannkaka',),  # index=1243
-    ('Hyderabadi biryani',),  # index=1244
-    ('Baeckeoffe',),  # index=1245
-    ('Eton mess',),  # index=1246
-    ('Khachapuri',),  # index=1247
-    ('Banoffee pie',),  # index=1248
-    ('Ants climbing a tree',),  # index=1249
-    ('Dandan noodles',),  # index=1250
-    ('Suanla chaoshou',),  # index=1251
-    ('Samgye-tang',),  # index=1252
-    ('Spam musubi',),  # index=1253
-    ('Bridie',),  # index=1254
-    ('Kaju katli',),  # index=1255
-    ('Chocolate-covered potato chips',),  # index=1256
-    ('Enne gai',),  # index=1257
-    ('Ruske kape',),  # index=1258
-    ('Spaghetti',),  # index=1259
-    ('Grass jelly',),  # index=1260
-    ('Salt potatoes',),  # index=1261
-    ('Katsudon',),  # index=1262
-    ('Pasanda',),  # index=1263
-    ('Banitsa',),  # index=1264
-    ('Tarte flamb\xc3\xa9e',),  # index=1265
-    ('Twice cooked pork',),  # index=1266
-    ('Kare-kare',),  # index=1267
-    ('Laobing',),  # index=1268
-    ('Banmian',),  # index=1269
-    ('Ontbijtkoek',),  # index=1270
-    ('Swiss wing',),  # index=1271
-    ('Michigan hot dog',),  # index=1272
-    ('Tong sui',),  # index=1273
-    ('Taco',),  # index=1274
-    ('Sosatie',),  # index=1275
-    ('Pap',),  # index=1276
-    ('Umngqusho',),  # index=1277
-    ('Malva pudding',),  # index=1278
-    ('Vichyssoise',),  # index=1279
-    ('Z\xc5\x8dni',),  # index=1280
-    ('Maxwell Street Polish',),  # index=1281
-    ('Vetkoek',),  # index=1282
-    ('Mealie bread',),  # index=1283
-    ('Chakalaka',),  # index=1284
-    ('Frikkadel',),  # index=1285
-    ('Pizza strips',),  # index=1286
-    ('Tteokguk',),  # index=1287
-    ('Coney Island hot dog',),  # index=1288
-    ('Tirokafteri',),  # index=1289
-    ('Fesikh',),  # index=1290
-    ('Boston cream pie',),  # index=1291
-    ('Buttermilk koldsk\xc3\xa5l',),  # index=1292
-    ('White boiled shrimp',),  # index=1293
-    ('Bagnun',),  # index=1294
-    ('Buntil',),  # index=1295
-    ('Kaiserschmarrn',),  # index=1296
-    ('Pisto',),  # index=1297
-    ('Dhokla',),  # index=1298
-    ('Al pastor',),  # index=1299
-    ('St. Paul sandwich',),  # index=1300
-    ('Melonpan',),  # index=1301
-    ('Haupia',),  # index=1302
-    ('L\xc3\xa1ngos',),  # index=1303
-    ('\xc3\x89touff\xc3\xa9e',),  # index=1304
-    ('Galaktoboureko',),  # index=1305
-    ('B\xc3\xb6rek',),  # index=1306
-    ('Suya',),  # index=1307
-    ('Rye bread',),  # index=1308
-    ("Escudella i carn d'olla",),  # index=1309
-    ('Gari',),  # index=1310
-    ('Tilkut',),  # index=1311
-    ('Botok',),  # index=1312
-    ('Tatws Pum Munud',),  # index=1313
-    ('Char siu',),  # index=1314
-    ('Burgoo',),  # index=1315
-    ('Cac\xc4\xb1k',),  # index=1316
-    ('Barfi',),  # index=1317
-    ('Mulligan stew',),  # index=1318
-    ('Biangbiang noodles',),  # index=1319
-    ('Banana pudding',),  # index=1320
-    ('Crab cake',),  # index=1321
-    ('Chinese sausage',),  # index=1322
-    ('Veal',),  # index=1323
-    ('Curry bread',),  # index=1324
-    ('Pastry heart',),  # index=1325
-    ('Cr\xc3\xa8me caramel',),  # index=1326
-    ('Panada',),  # index=1327
-    ('Pie \xc3\xa0 la Mode',),  # index=1328
-    ('Bonus Jack',),  # index=1329
-    ('Princess cake',),  # index=1330
-    ('Harihari-nabe',),  # index=1331
-    ('Hot chicken',),  # index=1332
-    ('Chhena Jhili',),  # index=1333
-    ('Grape pie',),  # index=1334
-    ('Chicken bog',),  # index=1335
-    ('Sausage gravy',),  # index=1336
-    ('Derby Pie',),  # index=1337
-    ('Ice cream cake',),  # index=1338
-    ('Swiss steak',),  # index=1339
-    ('Bagna c\xc3\xa0uda',),  # index=1340
-    ('Stack cake',),  # index=1341
-    ('Lobster Newberg',),  # index=1342
-    ('Nikujaga',),  # index=1343
-    ('Manti',),  # index=1344
-    ('Parmigiana',),  # index=1345
-    ('Palatschinke',),  # index=1346
-    ('Gujeolpan',),  # index=1347
-    ('Rajas con crema',),  # index=1348
-    ('Mak-guksu',),  # index=1349
-    ('Tetrazzini',),  # index=1350
-    ('Squid as food',),  # index=1351
-    ('Palak paneer',),  # index=1352
-    ('Krumkake',),  # index=1353
-    ('Bolani',),  # index=1354
-    ('Pork and beans',),  # index=1355
-    ('Nian gao',),  # index=1356
-    ('Oysters Rockefeller',),  # index=1357
-    ('Tav\xc4\x8de grav\xc4\x8de',),  # index=1358
-    ('Bakkwa',),  # index=1359
-    ('Xacuti',),  # index=1360
-    ('Sarapatel',),  # index=1361
-    ('Taquito',),  # index=1362
-    ('Egg drop soup',),  # index=1363
-    ('Shaobing',),  # index=1364
-    ('Chawanmushi',),  # index=1365
-    ('Nshima',),  # index=1366
-    ('Pollock roe',),  # index=1367
-    ('Slinger',),  # index=1368
-    ('Japchae',),  # index=1369
-    ('St. Honor\xc3\xa9 cake',),  # index=1370
-    ('Barm cake',),  # index=1371
-    ('Tulumba',),  # index=1372
-    ('Xiaolongbao',),  # index=1373
-    ('Delmonico steak',),  # index=1374
-    ('Stromboli',),  # index=1375
-    ('Kanafeh',),  # index=1376
-    ('Hamdog',),  # index=1377
-    ('Garri',),  # index=1378
-    ('Kofta',),  # index=1379
-    ('Chana masala',),  # index=1380
-    ('Salo',),  # index=1381
-    ('Lung fung soup',),  # index=1382
-    ('Dirty rice',),  # index=1383
-    ('Urnebes',),  # index=1384
-    ('Andouillette',),  # index=1385
-    ('Landj\xc3\xa4ger',),  # index=1386
-    ("Fisherman's soup",),  # index=1387
-    ('Romeritos',),  # index=1388
-    ('Lane cake',),  # index=1389
-    ('Pork jelly',),  # index=1390
-    ('Idiyappam',),  # index=1391
-    ('Sm\xc3\xb6rg\xc3\xa5st\xc3\xa5rta',),  # index=1392
-    ('Sma\xc5\xbeen\xc3\xbd s\xc3\xbdr',),  # index=1393
-    ('Arroz con pollo',),  # index=1394
-    ('Lahmacun',),  # index=1395
-    ('Molten chocolate cake',),  # index=1396
-    ('Tea egg',),  # index=1397
-    ('Cocada amarela',),  # index=1398
-    ('Japanese curry',),  # index=1399
-    ('Keema',),  # index=1400
-    ('Unagi',),  # index=1401
-    ("Hoppin' John",),  # index=1402
-    ('Gy\xc5\xabhi',),  # index=1403
-    ('Clafoutis',),  # index=1404
-    ('Green curry',),  # index=1405
-    ('G\xe1\xbb\x8fi cu\xe1\xbb\x91n',),  # index=1406
-    ('Chilli crab',),  # index=1407
-    ('Lo mai gai',),  # index=1408
-    ('Lo mein',),  # index=1409
-    ('Puttu',),  # index=1410
-    ('Fried pie',),  # index=1411
-    ('Spanish rice',),  # index=1412
-    ('Nuea phat phrik',),  # index=1413
-    ('Jeow bong',),  # index=1414
-    ('Massaman curry',),  # index=1415
-    ('Ostkaka',),  # index=1416
-    ('Guilinggao',),  # index=1417
-    ('Spettekaka',),  # index=1418
-    ('Cudighi',),  # index=1419
-    ('Saltimbocca',),  # index=1420
-    ('Sfogliatella',),  # index=1421
-    ('Beef chow fun',),  # index=1422
-    ('Chow mein sandwich',),  # index=1423
-    ('Carnitas',),  # index=1424
-    ('Chinese steamed eggs',),  # index=1425
-    ('Oyster omelette',),  # index=1426
-    ('Garden salad',),  # index=1427
-    ('Salade ni\xc3\xa7oise',),  # index=1428
-    ('Dal bhat',),  # index=1429
-    ('Biscuits and gravy',),  # index=1430
-    ('Omurice',),  # index=1431
-    ('Pao cai',),  # index=1432
-    ('Nasi liwet',),  # index=1433
-    ('Thai suki',),  # index=1434
-    ('Moo shu pork',),  # index=1435
-    ('Corn crab soup',),  # index=1436
-    ('Fabes con almejas',),  # index=1437
-    ('Golden Opulence Sundae',),  # index=1438
-    ('Ketoprak',),  # index=1439
-    ('Mala Mogodu',),  # index=1440
-    ('Tekwan',),  # index=1441
-    ('Vatrushka',),  # index=1442
-    ('Yin Yang fish',),  # index=1443
-    ('Boston cream doughnut',),  # index=1444
-    ('Ramen',),  # index=1445
-    ('Home fries',),  # index=1446
-    ('Mustacciuoli',),  # index=1447
-    ('Clam cake',),  # index=1448
-    ('Sarma',),  # index=1449
-    ('Shahe fen',),  # index=1450
-    ('Charleston red rice',),  # index=1451
-    ('Fish head curry',),  # index=1452
-    ('Podvarak',),  # index=1453
-    ('Pihtije',),  # index=1454
-    ('Popara',),  # index=1455
-    ('Ka\xc4\x8damak',),  # index=1456
-    ('Seolleongtang',),  # index=1457
-    ('Go\xc5\x82\xc4\x85bki',),  # index=1458
-    ('Szaloncukor',),  # index=1459
-    ('Kalduny',),  # index=1460
-    ('Zrazy',),  # index=1461
-    ('Panettone',),  # index=1462
-    ('Ambelopoulia',),  # index=1463
-    ('Persimmon pudding',),  # index=1464
-    ('Floating island',),  # index=1465
-    ('Zeeuwse bolus',),  # index=1466
-    ('Ambuyat',),  # index=1467
-    ('Smulpaj',),  # index=1468
-    ('Moravian spice cookies',),  # index=1469
-    ('Mee pok',),  # index=1470
-    ('Jjigae',),  # index=1471
-    ('Pizza bagel',),  # index=1472
-    ('Tteok',),  # index=1473
-    ('Br\xc3\xa6ndende k\xc3\xa6rlighed',),  # index=1474
-    ('Beaten biscuit',),  # index=1475
-    ('\xc3\x86blefl\xc3\xa6sk',),  # index=1476
-    ('Chicken paprikash',),  # index=1477
-    ('Tangyuan',),  # index=1478
-    ('Tuna pot',),  # index=1479
-    ('Burnt ends',),  # index=1480
-    ('Jam\xc3\xb3n ib\xc3\xa9rico',),  # index=1481
-    ('Rakfisk',),  # index=1482
-    ('Zarangollo',),  # index=1483
-    ('T\xc3\xbar\xc3\xb3 Rudi',),  # index=1484
-    ('Flummery',),  # index=1485
-    ('Cecina',),  # index=1486
-    ('Galinha \xc3\xa0 portuguesa',),  # index=1487
-    ('Ankimo',),  # index=1488
-    ('Galinha \xc3\xa0 africana',),  # index=1489
-    ('Cha siu bao',),  # index=1490
-    ('Fugu chiri',),  # index=1491
-    ('Assidat Zgougou',),  # index=1492
-    ('Oxtail stew',),  # index=1493
-    ('Laping',),  # index=1494
-    ('Chaku',),  # index=1495
-    ('Caldillo de perro',),  # index=1496
-    ('Sopa de Gato',),  # index=1497
-    ('Keledo\xc5\x9f',),  # index=1498
-    ('M\xc3\xbccver',),  # index=1499
-    ('Brotzeit',),  # index=1500
-    ('Shekerbura',),  # index=1501
-    ('Oeufs en meurette',),  # index=1502
-    ('Pappa al pomodoro',),  # index=1503
-    ('Teurgoule',),  # index=1504
-    ('B\xc3\xa1nh x\xc3\xa8o',),  # index=1505
-    ('Musakhan',),  # index=1506
-    ('Maqluba',),  # index=1507
-    ('Bob chorba',),  # index=1508
-    ('Rum baba',),  # index=1509
-    ('Veda bread',),  # index=1510
-    ('Fried prawn',),  # index=1511
-    ('Pastilla',),  # index=1512
-    ('Strawberry Delight',),  # index=1513
-    ('Cheese dream',),  # index=1514
-    ('Frejon',),  # index=1515
-    ('Gyeran-jjim',),  # index=1516
-    ('Revithia',),  # index=1517
-    ('Nasi bogana',),  # index=1518
-    ('Torta de gazpacho',),  # index=1519
-    ('Double Down',),  # index=1520
-    ('Seri Muka',),  # index=1521
-    ('Obi non',),  # index=1522
-    ('Garganelli',),  # index=1523
-    ('Kig ha farz',),  # index=1524
-    ('Mississippi mud pie',),  # index=1525
-    ("Eve's pudding",),  # index=1526
-    ('Amala',),  # index=1527
-    ('Okinawa soba',),  # index=1528
-    ('Lamian',),  # index=1529
-    ('Soki',),  # index=1530
-    ('Chicken Maryland',),  # index=1531
-    ('Chanpur\xc5\xab',),  # index=1532
-    ('Mlinci',),  # index=1533
-    ('Smyrna meatballs',),  # index=1534
-    ('Tavern sandwich',),  # index=1535
-    ('Yangzhou fried rice',),  # index=1536
-    ('Qutab',),  # index=1537
-    ('Dum Aloo',),  # index=1538
-    ('Queijo do Pico',),  # index=1539
-    ('Cocadas',),  # index=1540
-    ("Calf's liver and bacon",),  # index=1541
-    ('Moules-frites',),  # index=1542
-    ('Anarsa',),  # index=1543
-    ('Tlayuda',),  # index=1544
-    ('\xc5\xa0akotis',),  # index=1545
-    ('Jollof rice',),  # index=1546
-    ('Moin moin',),  # index=1547
-    ('Jam roly-poly',),  # index=1548
-    ('Hochzeitssuppe',),  # index=1549
-    ('Mucenici',),  # index=1550
-    ('Ema datshi',),  # index=1551
-    ('Ngo hiang',),  # index=1552
-    ('Jello salad',),  # index=1553
-    ('Claypot chicken rice',),  # index=1554
-    ('Maeun-tang',),  # index=1555
-    ('Cifantuan',),  # index=1556
-    ('Rhubarb pie',),  # index=1557
-    ('Olla podrida',),  # index=1558
-    ('Har gow',),  # index=1559
-    ('Sayur lodeh',),  # index=1560
-    ('Memela',),  # index=1561
-    ('Wenchang chicken',),  # index=1562
-    ('Galinhada',),  # index=1563
-    ('Lecs\xc3\xb3',),  # index=1564
-    ('Gypsy tart',),  # index=1565
-    ('Bougatsa',),  # index=1566
-    ('Germkn\xc3\xb6del',),  # index=1567
-    ('Haystack',),  # index=1568
-    ('Yule log',),  # index=1569
-    ('Butter cookie',),  # index=1570
-    ('Chicken \xc3\xa0 la King',),  # index=1571
-    ('M\xc3\xa9choui',),  # index=1572
-    ('Croquette',),  # index=1573
-    ('Shami kebab',),  # index=1574
-    ('Chicken and waffles',),  # index=1575
-    ('Poke',),  # index=1576
-    ('Punsch-roll',),  # index=1577
-    ('Turtle soup',),  # index=1578
-    ('Kansar',),  # index=1579
-    ('Glamorgan sausage',),  # index=1580
-    ('Mango pudding',),  # index=1581
-    ('B\xc3\xa1nh canh',),  # index=1582
-    ('Caparrones',),  # index=1583
-    ('Zopf',),  # index=1584
-    ('Bath bun',),  # index=1585
-    ('Chelsea bun',),  # index=1586
-    ('London bun',),  # index=1587
-    ('Saffron bun',),  # index=1588
-    ('Chakhchoukha',),  # index=1589
-    ('Angel food cake',),  # index=1590
-    ('Lalab',),  # index=1591
-    ('Suckling pig',),  # index=1592
-    ('Barmbrack',),  # index=1593
-    ('Kotlet schabowy',),  # index=1594
-    ('Pastel de nata',),  # index=1595
-    ('Shave ice',),  # index=1596
-    ('Tipsy cake',),  # index=1597
-    ('Creamed eggs on toast',),  # index=1598
-    ('Kerak telor',),  # index=1599
-    ('Ogok-bap',),  # index=1600
-    ('Mortadella',),  # index=1601
-    ('Nut roll',),  # index=1602
-    ('Fried green tomatoes',),  # index=1603
-    ('Beondegi',),  # index=1604
-    ('Tsoureki',),  # index=1605
-    ('Tiropita',),  # index=1606
-    ('Pljeskavica',),  # index=1607
-    ('Kara\xc4\x91or\xc4\x91eva \xc5\xa1nicla',),  # index=1608
-    ('Kokoretsi',),  # index=1609
-    ('Skilpadjies',),  # index=1610
-    ('Corn chowder',),  # index=1611
-    ('Tarhana',),  # index=1612
-    ('Tufahije',),  # index=1613
-    ('Birria',),  # index=1614
-    ('Veal Orloff',),  # index=1615
-    ('Fattoush',),  # index=1616
-    ('Pane carasau',),  # index=1617
-    ('Rab cake',),  # index=1618
-    ('Buffalo burger',),  # index=1619
-    ('Treacle tart',),  # index=1620
-    ('Hamburger',),  # index=1621
-    ('Stamppot',),  # index=1622
-    ('Kopytka',),  # index=1623
-    ('Khai yat sai',),  # index=1624
-    ('Minchee',),  # index=1625
-    ('Kinema',),  # index=1626
-    ('Sgabeo',),  # index=1627
-    ('Chili dog',),  # index=1628
-    ('Spaghetti alle vongole',),  # index=1629
-    ('Bavarian cream',),  # index=1630
-    ('Bhaji',),  # index=1631
-    ('Kachori',),  # index=1632
-    ('Chowder',),  # index=1633
-    ('Scotch broth',),  # index=1634
-    ('Pea soup',),  # index=1635
-    ('Kitfo',),  # index=1636
-    ('Gored gored',),  # index=1637
-    ('B\xc3\xa1nh ch\xc6\xb0ng',),  # index=1638
-    ('B\xc3\xban b\xc3\xb2 Hu\xe1\xba\xbf',),  # index=1639
-    ('B\xc3\xb2 7 m\xc3\xb3n',),  # index=1640
-    ('C\xc6\xa1m t\xe1\xba\xa5m',),  # index=1641
-    ('Ambrosia',),  # index=1642
-    ('R\xc3\xb6ntt\xc3\xb6nen',),  # index=1643
-    ('Balch\xc3\xa3o',),  # index=1644
-    ('Gibassier',),  # index=1645
-    ('Bacalhau \xc3\xa0 Z\xc3\xa9 do Pipo',),  # index=1646
-    ('Pane di Altamura',),  # index=1647
-    ('Mykyrokka',),  # index=1648
-    ('Paska',),  # index=1649
-    ('Blackberry pie',),  # index=1650
-    ('Mince pie',),  # index=1651
-    ('Corn cookie',),  # index=1652
-    ('Francesinha poveira',),  # index=1653
-    ('Picadillo',),  # index=1654
-    ('Runeberg torte',),  # index=1655
-    ('Khakhra',),  # index=1656
-    ('Ohn no khao sw\xc3\xa8',),  # index=1657
-    ('Sultsina',),  # index=1658
-    ('Kabab torsh',),  # index=1659
-    ('Paella',),  # index=1660
-    ('Espetada',),  # index=1661
-    ('Pathiri',),  # index=1662
-    ('Horumonyaki',),  # index=1663
-    ('Khubz',),  # index=1664
-    ('Ciorb\xc4\x83',),  # index=1665
-    ('Kimchi-buchimgae',),  # index=1666
-    ('Sesame chicken',),  # index=1667
-    ('Thukpa',),  # index=1668
-    ('Chwinamul',),  # index=1669
-    ('Kabuni',),  # index=1670
-    ('Jhunka',),  # index=1671
-    ('Jolada rotti',),  # index=1672
-    ('Spoonbread',),  # index=1673
-    ('Kulich',),  # index=1674
-    ('Phat khing',),  # index=1675
-    ('Namasu',),  # index=1676
-    ('Wonton noodles',),  # index=1677
-    ('Johnnycake',),  # index=1678
-    ('Panellets',),  # index=1679
-    ('Manj\xc5\xab',),  # index=1680
-    ('Mandi',),  # index=1681
-    ('Fortune cookie',),  # index=1682
-    ('Noppe',),  # index=1683
-    ('Slavink',),  # index=1684
-    ('Cockle bread',),  # index=1685
-    ('Caruru',),  # index=1686
-    ('Ch\xe1\xba\xa3 l\xe1\xbb\xa5a',),  # index=1687
-    ('Pan bagnat',),  # index=1688
-    ('Sardenara',),  # index=1689
-    ('Enchilada',),  # index=1690
-    ('Sausage sandwich',),  # index=1691
-    ('Pistachio pudding',),  # index=1692
-    ('Chikki',),  # index=1693
-    ('Champorado',),  # index=1694
-    ('Coconut cake',),  # index=1695
-    ('Kaassouffl\xc3\xa9',),  # index=1696
-    ('Carne pizzaiola',),  # index=1697
-    ('Khauk sw\xc3\xa8 thoke',),  # index=1698
-    ('Gamja-tang',),  # index=1699
-    ('Kadhi',),  # index=1700
-    ('Green bean casserole',),  # index=1701
-    ('Apple dumpling',),  # index=1702
-    ('Tsoureki',),  # index=1703
-    ('Pissaladi\xc3\xa8re',),  # index=1704
-    ('Phat si-io',),  # index=1705
-    ('Drunken noodles',),  # index=1706
-    ('Jing Jiang Rou Si',),  # index=1707
-    ('Enduri Pitha',),  # index=1708
-    ('Kakara pitha',),  # index=1709
-    ('Tarta de Santiago',),  # index=1710
-    ('Spoon sweets',),  # index=1711
-    ('Sheftalia',),  # index=1712
-    ('Soybean sprout',),  # index=1713
-    ('Italian hot dog',),  # index=1714
-    ('Makchang',),  # index=1715
-    ('Meeshay',),  # index=1716
-    ('Bacalhau com natas',),  # index=1717
-    ('Mazurek',),  # index=1718
-    ('Nan gyi thohk',),  # index=1719
-    ('Ajapsandali',),  # index=1720
-    ('Carac',),  # index=1721
-    ('Mont di',),  # index=1722
-    ('Geng',),  # index=1723
-    ('Vispipuuro',),  # index=1724
-    ('Bakso',),  # index=1725
-    ('Canjica',),  # index=1726
-    ('Fougasse',),  # index=1727
-    ("Fool's Gold Loaf",),  # index=1728
-    ('Blueberry pie',),  # index=1729
-    ('Cucumber Salad',),  # index=1730
-    ('Ogbono soup',),  # index=1731
-    ('Champ',),  # index=1732
-    ('Oysters en brochette',),  # index=1733
-    ('Paskha',),  # index=1734
-    ('Shish taouk',),  # index=1735
-    ('Acaraj\xc3\xa9',),  # index=1736
-    ('Ras malai',),  # index=1737
-    ('San-nakji',),  # index=1738
-    ('Bungeo-ppang',),  # index=1739
-    ('Skilandis',),  # index=1740
-    ('Gosh-e Fil',),  # index=1741
-    ('Nasi dagang',),  # index=1742
-    ('Gheimeh',),  # index=1743
-    ('Fesenj\xc4\x81n',),  # index=1744
-    ('Bacalhau \xc3\xa0 Gomes de S\xc3\xa1',),  # index=1745
-    ('F\xc3\xa5rik\xc3\xa5l',),  # index=1746
-    ('Bedfordshire clanger',),  # index=1747
-    ('Tonkatsu',),  # index=1748
-    ('Thai fried rice',),  # index=1749
-    ('Manakish',),  # index=1750
-    ('Schweinshaxe',),  # index=1751
-    ('Chorba',),  # index=1752
-    ('Oliebol',),  # index=1753
-    ('Ropa vieja',),  # index=1754
-    ('Natchitoches meat pie',),  # index=1755
-    ('Icebox cake',),  # index=1756
-    ('Sorrel soup',),  # index=1757
-    ('Lahoh',),  # index=1758
-    ('Bolillo',),  # index=1759
-    ('Mollete',),  # index=1760
-    ('Caldeirada',),  # index=1761
-    ('Ogi',),  # index=1762
-    ('Watergate salad',),  # index=1763
-    ('Yaksik',),  # index=1764
-    ('Half-smoke',),  # index=1765
-    ('Dakos',),  # index=1766
-    ('Sweet potato pie',),  # index=1767
-    ('Cappon magro',),  # index=1768
-    ('Serundeng',),  # index=1769
-    ('Rijstevlaai',),  # index=1770
-    ('Ajoblanco',),  # index=1771
-    ('Yaka mein',),  # index=1772
-    ('Jujeh kabab',),  # index=1773
-    ('Soy egg',),  # index=1774
-    ('Shuizhu',),  # index=1775
-    ('Puliyogare',),  # index=1776
-    ('Sago',),  # index=1777
-    ('Laulau',),  # index=1778
-    ('Curtido',),  # index=1779
-    ('Tapai',),  # index=1780
-    ('Press cake',),  # index=1781
-    ('Cuchifritos',),  # index=1782
-    ('Vlaai',),  # index=1783
-    ('Malvern pudding',),  # index=1784
-    ('Baklava',),  # index=1785
-    ('Cheese dog',),  # index=1786
-    ('Luchi',),  # index=1787
-    ('Cowboy beans',),  # index=1788
-    ('Sandesh',),  # index=1789
-    ('Steak Diane',),  # index=1790
-    ('Lobster stew',),  # index=1791
-    ('Finikia',),  # index=1792
-    ('Bibingka',),  # index=1793
-    ('Tafelspitz',),  # index=1794
-    ('Ploye',),  # index=1795
-    ('Sayur asem',),  # index=1796
-    ('Trinxat',),  # index=1797
-    ('Nikuman',),  # index=1798
-    ('Cozido \xc3\xa0 portuguesa',),  # index=1799
-    ('Bacalhau \xc3\xa0 Br\xc3\xa1s',),  # index=1800
-    ('Tomato compote',),  # index=1801
-    ('Sesame seed candy',),  # index=1802
-    ('Dhebra',),  # index=1803
-    ('Kaeng pa',),  # index=1804
-    ('Mas riha',),  # index=1805
-    ('Zosui',),  # index=1806
-    ('Yassa',),  # index=1807
-    ('Pambazo',),  # index=1808
-    ('Imarti',),  # index=1809
-    ('Bacalhau com todos',),  # index=1810
-    ('Black pepper crab',),  # index=1811
-    ('Queso flameado',),  # index=1812
-    ('Black and white cookie',),  # index=1813
-    ('Red braised pork belly',),  # index=1814
-    ('Krofne',),  # index=1815
-    ('U\xc5\xa1tipci',),  # index=1816
-    ('Ro\xc5\xbeata',),  # index=1817
-    ('Punjena paprika',),  # index=1818
-    ('Fusi',),  # index=1819
-    ('Mane\xc5\xa1tra',),  # index=1820
-    ('Kro\xc5\xa1tule',),  # index=1821
-    ('Fritule',),  # index=1822
-    ('Protein bar',),  # index=1823
-    ('Cordon bleu',),  # index=1824
-    ('Pirog',),  # index=1825
-    ('Pachi Pulusu',),  # index=1826
-    ('Frig\xc4\x83rui',),  # index=1827
-    ('Chhena poda',),  # index=1828
-    ('Poornalu',),  # index=1829
-    ('Ponganalu',),  # index=1830
-    ('Bing',),  # index=1831
-    ('Flaouna',),  # index=1832
-    ('Chakodi',),  # index=1833
-    ('Aloo paratha',),  # index=1834
-    ('Konro',),  # index=1835
-    ('Cemita',),  # index=1836
-    ('Asinan',),  # index=1837
-    ('Broa',),  # index=1838
-    ('Trifle',),  # index=1839
-    ('Rat na',),  # index=1840
-    ('Borlengo',),  # index=1841
-    ('Gazpachuelo',),  # index=1842
-    ('Esterh\xc3\xa1zy torte',),  # index=1843
-    ('Magenbrot',),  # index=1844
-    ('Detroit-style pizza',),  # index=1845
-    ('Fuling jiabing',),  # index=1846
-    ('Lakhamari',),  # index=1847
-    ('Mu\xc4\x87kalica',),  # index=1848
-    ('Sukhdi',),  # index=1849
-    ('Kilishi',),  # index=1850
-    ('Baji',),  # index=1851
-    ('Peanut butter cookie',),  # index=1852
-    ('Rabbit pie',),  # index=1853
-    ("Paling in 't groen",),  # index=1854
-    ('Chataamari',),  # index=1855
-    ('Lawar',),  # index=1856
-    ('Arisa Pitha',),  # index=1857
-    ('Empal gentong',),  # index=1858
-    ('Carne asada fries',),  # index=1859
-    ('Takikomi gohan',),  # index=1860
-    ('Kamameshi',),  # index=1861
-    ('Pasta salad',),  # index=1862
-    ('Fasole cu c\xc3\xa2rna\xc8\x9bi',),  # index=1863
-    ('Zelnik',),  # index=1864
-    ('Pl\xc4\x83cint\xc4\x83',),  # index=1865
-    ('Tongseng',),  # index=1866
-    ('Soto mie',),  # index=1867
-    ('Sarburma',),  # index=1868
-    ('Lutefisk',),  # index=1869
-    ('Khichdi',),  # index=1870
-    ('Briouat',),  # index=1871
-    ('Chili burger',),  # index=1872
-    ('Bolo de mel',),  # index=1873
-    ('Clootie',),  # index=1874
-    ('Seswaa',),  # index=1875
-    ('Tahu sumedang',),  # index=1876
-    ('Pichelsteiner',),  # index=1877
-    ('Bread soup',),  # index=1878
-    ('Scotcheroos',),  # index=1879
-    ('Kartoffelk\xc3\xa4se',),  # index=1880
-    ('Schuxen',),  # index=1881
-    ('Caramel',),  # index=1882
-    ('Zwetschgenkuchen',),  # index=1883
-    ('Alloco',),  # index=1884
-    ('Vangibath',),  # index=1885
-    ('Torricado',),  # index=1886
-    ('Phat phrik khing',),  # index=1887
-    ('Tomato and egg soup',),  # index=1888
-    ('Dushbara',),  # index=1889
-    ('Spanakorizo',),  # index=1890
-    ('Ostropel',),  # index=1891
-    ('Tamale',),  # index=1892
-    ('Seattle-style hot dog',),  # index=1893
-    ('Ammonia cookie',),  # index=1894
-    ('Boston baked beans',),  # index=1895
-    ('Amandine',),  # index=1896
-    ('Duck blood and vermicelli soup',),  # index=1897
-    ('Azerbaijani pakhlava',),  # index=1898
-    ('Bakwan',),  # index=1899
-    ('Wallenbergare',),  # index=1900
-    ('Pastry',),  # index=1901
-    ('Melomakarono',),  # index=1902
-    ('Cocido lebaniego',),  # index=1903
-    ('Koi',),  # index=1904
-    ('Stir-fried tomato and scrambled eggs',),  # index=1905
-    ('Fl\xc3\xa6skesteg',),  # index=1906
-    ("Beggar's Chicken",),  # index=1907
-    ('Lymonnyk',),  # index=1908
-    ('Konkonte',),  # index=1909
-    ('Stuffed zucchini',),  # index=1910
-    ('Kaeng som',),  # index=1911
-    ('Kentucky jam cake',),  # index=1912
-    ('Mur\xc4\x83turi',),  # index=1913
-    ('Tochitur\xc4\x83',),  # index=1914
-    ('Urap',),  # index=1915
-    ('Cornule\xc8\x9be',),  # index=1916
-    ('Quad City-style pizza',),  # index=1917
-    ('Paneer tikka',),  # index=1918
-    ('Ciorb\xc4\x83 de peri\xc8\x99oare',),  # index=1919
-    ('Semolina porridge',),  # index=1920
-    ('Shaker Lemon Pie',),  # index=1921
-    ('Doodhpak',),  # index=1922
-    ('Ceviche',),  # index=1923
-    ('Cabbage soup',),  # index=1924
-    ('Nasi timbel',),  # index=1925
-    ('Pa amb tom\xc3\xa0quet',),  # index=1926
-    ('Escalivada',),  # index=1927
-    ('Me\xc4\x91imurska gibanica',),  # index=1928
-    ('Khanom chan',),  # index=1929
-    ('Ohaw',),  # index=1930
-    ('Baghrir',),  # index=1931
-    ('Hummingbird cake',),  # index=1932
-    ('Neapolitan pizza',),  # index=1933
-    ('Doughnut',),  # index=1934
-    ('Hummus',),  # index=1935
-    ('Nimono',),  # index=1936
-    ('Chocolate chip cookie',),  # index=1937
-    ('B\xc3\xban \xe1\xbb\x91c',),  # index=1938
-    ('Cheese straw',),  # index=1939
-    ('Sausage',),  # index=1940
-    ('Frogeye salad',),  # index=1941
-    ('Senate bean soup',),  # index=1942
-    ('Botifarra',),  # index=1943
-    ('Leberkn\xc3\xb6del',),  # index=1944
-    ('Laziji',),  # index=1945
-    ('Quzi',),  # index=1946
-    ('Chazuke',),  # index=1947
-    ('Sandwich',),  # index=1948
-    ('BLT',),  # index=1949
-    ('Chikhirtma',),  # index=1950
-    ('Pico de gallo',),  # index=1951
-    ('Oden',),  # index=1952
-    ('Tostada',),  # index=1953
-    ('Chilaquiles',),  # index=1954
-    ('Cocido monta\xc3\xb1\xc3\xa9s',),  # index=1955
-    ('Lontong Cap Go Meh',),  # index=1956
-    ('Porra antequerana',),  # index=1957
-    ('Kedjenou',),  # index=1958
-    ('Tourin',),  # index=1959
-    ('Atti\xc3\xa9k\xc3\xa9',),  # index=1960
-    ('Dak-bokkeum-tang',),  # index=1961
-    ('\xc5\xbdemlovka',),  # index=1962
-    ('Dovga',),  # index=1963
-    ('Rice and gravy',),  # index=1964
-    ('Sai ua',),  # index=1965
-    ('Nam ngiao',),  # index=1966
-    ('Kaeng khae',),  # index=1967
-    ('Kaeng tai pla',),  # index=1968
-    ('Dim sum',),  # index=1969
-    ('Tahri',),  # index=1970
-    ('Bolo do caco',),  # index=1971
-    ('Buffalo wing',),  # index=1972
-    ('Pustakari',),  # index=1973
-    ('Pieds paquets',),  # index=1974
-    ('Tinginys',),  # index=1975
-    ('Sunnundallu',),  # index=1976
-    ('Lapskaus',),  # index=1977
-    ('Caldo tlalpe\xc3\xb1o',),  # index=1978
-    ('Milho frito',),  # index=1979
-    ('Kalu dodol',),  # index=1980
-    ('Poppyseed muffin',),  # index=1981
-    ('Peanut soup',),  # index=1982
-    ('Tarte \xc3\xa0 la Bouillie',),  # index=1983
-    ('Caldo gallego',),  # index=1984
-    ('Samay Baji',),  # index=1985
-    ('Limburger sandwich',),  # index=1986
-    ('Huachinango a la Veracruzana',),  # index=1987
-    ('Sambal stingray',),  # index=1988
-    ('Kuluban',),  # index=1989
-    ('Modjeska',),  # index=1990
-    ('Pan dulce',),  # index=1991
-    ('Florina pepper',),  # index=1992
-    ('Oysters Bienville',),  # index=1993
-    ('Cronut',),  # index=1994
-    ('Duck rice',),  # index=1995
-    ('Sulu k\xc3\xb6fte',),  # index=1996
-    ('Toyga soup',),  # index=1997
-    ('Majjige huli',),  # index=1998
-    ('Ikan goreng',),  # index=1999
-    ('Lekor',),  # index=2000
-    ('Ciulama',),  # index=2001
-    ('Ayam bakar',),  # index=2002
-    ('Hinava',),  # index=2003
-    ('Waakye',),  # index=2004
-    ('Salbute',),  # index=2005
-    ('Kuchmachi',),  # index=2006
-    ('Kibinai',),  # index=2007
-    ('Lobiani',),  # index=2008
-    ('Chanakhi',),  # index=2009
-    ('Baghala ghatogh',),  # index=2010
-    ('Pkhali',),  # index=2011
-    ('Poc Chuc',),  # index=2012
-    ('Bionico',),  # index=2013
-    ('Bamischijf',),  # index=2014
-    ('Racuchy',),  # index=2015
-    ('Kuurdak',),  # index=2016
-    ('Hokkien fried rice',),  # index=2017
-    ('Mu kratha',),  # index=2018
-    ('Thong yip',),  # index=2019
-    ('Zuppa toscana',),  # index=2020
-    ('Dhindo',),  # index=2021
-    ('Thiakry',),  # index=2022
-    ('Kondowole',),  # index=2023
-)
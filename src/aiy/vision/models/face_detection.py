@@ -16,6 +16,7 @@
 from __future__ import division
 
 from aiy.vision.inference import ModelDescriptor
+from aiy.vision.inference import get_tensor
 from aiy.vision.models import utils
 
 _COMPUTE_GRAPH_NAME = 'face_detection.binaryproto'
@@ -62,12 +63,15 @@ def get_faces(result):
     """Retunrs list of Face objects decoded from the inference result."""
     assert len(result.tensors) == 3
     # TODO(dkovalev): check tensor shapes
-    bboxes = _reshape(result.tensors['bounding_boxes'].data, 4)
-    face_scores = result.tensors['face_scores'].data
-    joy_scores = result.tensors['joy_scores'].data
+    bboxes = _reshape(get_tensor(result, 'bounding_boxes').data, 4)
+    face_scores = get_tensor(result, 'face_scores').data
+    joy_scores = get_tensor(result, 'joy_scores').data
     assert len(bboxes) == len(joy_scores)
     assert len(bboxes) == len(face_scores)
+    # Boxes are relative to the window of the image model ran on.
+    x0, y0 = result.window.x, result.window.y
     return [
-        Face(tuple(bbox), face_score, joy_score)
-        for bbox, face_score, joy_score in zip(bboxes, face_scores, joy_scores)
+        Face((x0 + x, y0 + y, width, height), face_score, joy_score)
+        for (x, y, width, height), face_score, joy_score in zip(
+            bboxes, face_scores, joy_scores)
     ]
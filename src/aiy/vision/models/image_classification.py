@@ -14,8 +14,8 @@
 """API for Image Classification tasks."""
 
 from aiy.vision.inference import ModelDescriptor
+from aiy.vision.inference import get_tensor
 from aiy.vision.models import utils
-from aiy.vision.models.image_classification_classes import CLASSES
 
 # There are two models in our repository that can do image classification. One
 # based on MobileNet model structure, the other based on SqueezeNet model
@@ -33,6 +33,7 @@ _OUTPUT_TENSOR_NAME_MAP = {
     MOBILENET: 'MobilenetV1/Predictions/Softmax',
     SQUEEZENET: 'Prediction',
 }
+_CLASSES = utils.LabelTable('image_classification_classes.txt')
 
 
 def model(model_type=MOBILENET):
@@ -64,12 +65,9 @@ def get_classes(result, max_num_objects=None, object_prob_threshold=0.0):
     """
     assert len(result.tensors) == 1
     tensor_name = _OUTPUT_TENSOR_NAME_MAP[result.model_name]
-    tensor = result.tensors[tensor_name]
+    tensor = get_tensor(result, tensor_name)
     probs, shape = tensor.data, tensor.shape
-    assert (shape.batch, shape.height, shape.width, shape.depth) == (1, 1, 1,
-                                                                     1001)
+    assert shape == (1, 1, 1, 1001)
 
-    pairs = [pair for pair in enumerate(probs) if pair[1] > object_prob_threshold]
-    pairs = sorted(pairs, key=lambda pair: pair[1], reverse=True)
-    pairs = pairs[0:max_num_objects]
-    return [('/'.join(CLASSES[index]), prob) for index, prob in pairs]
+    return utils.get_top_classes(probs, _CLASSES, max_num_objects,
+                                 object_prob_threshold)
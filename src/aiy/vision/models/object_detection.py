@@ -12,15 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """API for Object Detection tasks."""
+import bisect
+import functools
+import itertools
+import logging
 import math
+import operator
 import sys
+import time
 
 from aiy.vision.inference import ModelDescriptor
+from aiy.vision.inference import get_tensor
 from aiy.vision.models import utils
-from aiy.vision.models.object_detection_anchors import ANCHORS
+from aiy.vision.models import object_detection_anchors
 
 _COMPUTE_GRAPH_NAME = 'mobilenet_ssd_256res_0.125_person_cat_dog.binaryproto'
-_NUM_ANCHORS = len(ANCHORS)
+_NUM_ANCHORS = object_detection_anchors.NUM_ANCHORS
 _MACHINE_EPS = sys.float_info.epsilon
 
 
@@ -60,10 +67,14 @@ def _decode_detection_result(logit_scores, box_encodings, anchors,
                              score_threshold, image_size, offset):
     """Decodes result as bounding boxes.
 
+    Anchors are filtered in batch first, so only the few anchors above the
+    threshold are decoded one by one.
+
     Args:
       logit_scores: list of scores
       box_encodings: list of bounding boxes
-      anchors: list of anchors
+      anchors: anchors in center form, see
+        object_detection_anchors.anchor_centers
       score_threshold: float, bounding box candidates below this threshold will
         be rejected.
       image_size: (width, height)
@@ -80,16 +91,28 @@ def _decode_detection_result(logit_scores, box_encodings, anchors,
 
     score_threshold = max(score_threshold, _MACHINE_EPS)
     logit_score_threshold = math.log(score_threshold / (1 - score_threshold))
-    for i in range(_NUM_ANCHORS):
+
+    # Only anchors with at least one non-background score above threshold
+    # can pass, find them with a single pass over each class column.
+    is_above_threshold = functools.partial(operator.lt, logit_score_threshold)
+    candidates = set()
+    for column in range(1, 4):
+        candidates.update(itertools.compress(
+            range(_NUM_ANCHORS),
+            map(is_above_threshold, logit_scores[column::4])))
+
+    ycenters, xcenters, heights, widths = anchors
+    for i in sorted(candidates):
         logits = logit_scores[4 * i: 4 * (i + 1)]
         max_logit_score = max(logits)
         max_score_index = logits.index(max_logit_score)
-        # Skip if max score is below threshold or max score is 'background'.
-        if max_score_index == 0 or max_logit_score <= logit_score_threshold:
+        # Skip if max score is 'background'.
+        if max_score_index == 0:
             continue
 
         box_encoding = box_encodings[4 * i: 4 * (i + 1)]
-        xmin, ymin, xmax, ymax = _decode_box_encoding(box_encoding, anchors[i])
+        anchor = (ycenters[i], xcenters[i], heights[i], widths[i])
+        xmin, ymin, xmax, ymax = _decode_box_encoding(box_encoding, anchor)
         x = int(x0 + xmin * width)
         y = int(y0 + ymin * height)
         w = int((xmax - xmin) * width)
@@ -109,7 +132,7 @@ def _decode_box_encoding(box_encoding, anchor):
 
     Args:
       box_encoding: a tuple of 4 floats.
-      anchor: a tuple of 4 floats.
+      anchor: a tuple of 4 floats (ycenter, xcenter, height, width).
     Returns:
       A tuple of 4 floats (xmin, ymin, xmax, ymax), each has range [0.0, 1.0].
     """
@@ -125,11 +148,7 @@ def _decode_box_encoding(box_encoding, anchor):
     rel_height_dilation = box_encoding[2] / height_scale
     rel_width_dilation = box_encoding[3] / width_scale
 
-    anchor_ymin, anchor_xmin, anchor_ymax, anchor_xmax = anchor
-    anchor_ycenter = (anchor_ymax + anchor_ymin) / 2
-    anchor_xcenter = (anchor_xmax + anchor_xmin) / 2
-    anchor_height = anchor_ymax - anchor_ymin
-    anchor_width = anchor_xmax - anchor_xmin
+    anchor_ycenter, anchor_xcenter, anchor_height, anchor_width = anchor
 
     ycenter = anchor_ycenter + anchor_height * rel_y_translation
     xcenter = anchor_xcenter + anchor_width * rel_x_translation
@@ -146,23 +165,27 @@ def _decode_box_encoding(box_encoding, anchor):
     return (xmin, ymin, xmax, ymax)
 
 
-def _area(box):
-    _, _, width, height = box
-    area = width * height
-    assert area >= 0
-    return area
+def _corners(box):
+    """Converts (x, y, width, height) box to (xmin, ymin, xmax, ymax, area)."""
+    x, y, width, height = box
+    return (x, y, x + width, y + height, width * height)
 
 
-def _intersection_area(box1, box2):
-    x1, y1, width1, height1 = box1
-    x2, y2, width2, height2 = box2
-    x = max(x1, x2)
-    y = max(y1, y2)
-    width = max(min(x1 + width1, x2 + width2) - x, 0)
-    height = max(min(y1 + height1, y2 + height2) - y, 0)
-    area = width * height
-    assert area >= 0
-    return area
+def _corners_overlap_ratio(corners1, corners2):
+    """Computes overlap ratio of two bounding boxes given by _corners.
+
+    Same as _overlap_ratio, but avoids recomputing corners and areas when the
+    same box is compared many times.
+    """
+    xmin1, ymin1, xmax1, ymax1, area1 = corners1
+    xmin2, ymin2, xmax2, ymax2, area2 = corners2
+    width = min(xmax1, xmax2) - max(xmin1, xmin2)
+    height = min(ymax1, ymax2) - max(ymin1, ymin2)
+    intersection_area = max(width, 0) * max(height, 0)
+    union_area = area1 + area2 - intersection_area
+    if union_area > 0:
+        return float(intersection_area) / float(union_area)
+    return 1.0
 
 
 def _overlap_ratio(box1, box2):
@@ -175,39 +198,95 @@ def _overlap_ratio(box1, box2):
     Returns:
       float, represents overlap ratio between given boxes.
     """
-    intersection_area = _intersection_area(box1, box2)
-    union_area = _area(box1) + _area(box2) - intersection_area
-    assert union_area >= 0
-    if union_area > 0:
-        return float(intersection_area) / float(union_area)
-    return 1.0
+    return _corners_overlap_ratio(_corners(box1), _corners(box2))
 
 
-def _non_maximum_suppression(objs, overlap_threshold=0.5):
+def _non_maximum_suppression(objs, overlap_threshold=0.5, per_class=False,
+                             max_num_objects=None, soft_nms_sigma=None,
+                             score_threshold=0.0):
     """Runs Non Maximum Suppression.
 
     Removes candidate that overlaps with existing candidate who has higher
-    score.
+    score. Candidates are visited once in score order and only compared with
+    nearby kept boxes. Given objects are never modified.
 
     Args:
       objs: list of ObjectDetection.Object
       overlap_threshold: float
+      per_class: bool, if True only objects of the same kind suppress each
+        other, e.g. a cat is kept even when it overlaps with a person.
+      max_num_objects: int, max number of objects to return, None means no
+        limit.
+      soft_nms_sigma: float, if set, runs Soft-NMS instead: scores of
+        overlapping candidates are decayed by exp(-overlap^2 / sigma) rather
+        than removed, overlap_threshold is not used.
+      score_threshold: float, Soft-NMS candidates whose decayed score drops
+        below this threshold are removed.
     Returns:
       A list of ObjectDetection.Object
     """
+    if soft_nms_sigma is not None:
+        return _soft_non_maximum_suppression(objs, soft_nms_sigma,
+                                             score_threshold, per_class,
+                                             max_num_objects)
+
     objs = sorted(objs, key=lambda x: x.score, reverse=True)
-    for i in range(len(objs)):
-        if objs[i].score < 0.0:
+    kept = []
+    # Kept boxes per kind (or None if not per_class): list sorted by xmin, the
+    # corners in the same order, and max width. Only kept boxes with xmin in
+    # (xmin - max width, xmax) can intersect with a candidate box.
+    groups = {}
+    for obj in objs:
+        if max_num_objects is not None and len(kept) >= max_num_objects:
+            break
+        corners = _corners(obj.bounding_box)
+        xmin, _, xmax, _, _ = corners
+        key = obj.kind if per_class else None
+        if key not in groups:
+            groups[key] = ([], [], [0])
+        xmins, others, max_width = groups[key]
+
+        # Suppress box if it overlaps with any kept box having higher score.
+        begin = bisect.bisect_right(xmins, xmin - max_width[0])
+        end = bisect.bisect_left(xmins, xmax)
+        if any(_corners_overlap_ratio(corners, others[i]) > overlap_threshold
+               for i in range(begin, end)):
             continue
-        # Suppress any nearby bounding boxes having lower score than boxes[i]
-        for j in range(i + 1, len(objs)):
-            if objs[j].score < 0.0:
-                continue
-            if _overlap_ratio(objs[i].bounding_box,
-                              objs[j].bounding_box) > overlap_threshold:
-                objs[j].score = -1.0  # Suppress box
 
-    return [obj for obj in objs if obj.score >= 0.0]  # Exclude suppressed boxes
+        i = bisect.bisect(xmins, xmin)
+        xmins.insert(i, xmin)
+        others.insert(i, corners)
+        max_width[0] = max(max_width[0], xmax - xmin)
+        kept.append(obj)
+    return kept
+
+
+def _soft_non_maximum_suppression(objs, sigma, score_threshold, per_class,
+                                  max_num_objects):
+    """Runs Gaussian Soft-NMS, see _non_maximum_suppression.
+
+    Returns:
+      A list of new ObjectDetection.Object with decayed scores.
+    """
+    candidates = [(obj.score, obj, _corners(obj.bounding_box))
+                  for obj in sorted(objs, key=lambda x: x.score, reverse=True)]
+    kept = []
+    while candidates:
+        if max_num_objects is not None and len(kept) >= max_num_objects:
+            break
+        best = max(range(len(candidates)), key=lambda i: candidates[i][0])
+        score, obj, corners = candidates.pop(best)
+        kept.append(Object(obj.bounding_box, obj.kind, score))
+
+        decayed = []
+        for other_score, other, other_corners in candidates:
+            if not per_class or other.kind == obj.kind:
+                overlap = _corners_overlap_ratio(corners, other_corners)
+                other_score *= math.exp(-overlap * overlap / sigma)
+            if other_score >= score_threshold:
+                decayed.append((other_score, other, other_corners))
+        candidates = decayed
+    return kept
 
 
 def model():
@@ -219,12 +298,82 @@ def model():
 
 
 # TODO: check all tensor shapes
-def get_objects(result, score_threshold=0.3, offset=(0, 0)):
+def get_objects(result, score_threshold=0.3, offset=(0, 0),
+                overlap_threshold=0.5, per_class=False, max_num_objects=None,
+                soft_nms_sigma=None):
+    """Returns list of Object decoded from the inference result.
+
+    Args:
+      result: output from object detection model.
+      score_threshold: float, min score of each returned object.
+      offset: (x, y), added to every bounding box.
+      overlap_threshold: float, see _non_maximum_suppression.
+      per_class: bool, run non maximum suppression for each kind separately.
+      max_num_objects: int, max number of objects to return.
+      soft_nms_sigma: float, use Soft-NMS with given sigma.
+    """
     assert len(result.tensors) == 2
-    logit_scores = tuple(result.tensors['concat_1'].data)
-    box_encodings = tuple(result.tensors['concat'].data)
+    logit_scores = get_tensor(result, 'concat_1').data
+    box_encodings = get_tensor(result, 'concat').data
 
+    # Boxes are relative to the window of the image model ran on.
     size = (result.window.width, result.window.height)
-    objs = _decode_detection_result(logit_scores, box_encodings, ANCHORS,
+    offset = (offset[0] + result.window.x, offset[1] + result.window.y)
+    anchors = object_detection_anchors.anchor_centers()
+    objs = _decode_detection_result(logit_scores, box_encodings, anchors,
                                     score_threshold, size, offset)
-    return _non_maximum_suppression(objs)
+    return _non_maximum_suppression(objs, overlap_threshold, per_class,
+                                    max_num_objects, soft_nms_sigma,
+                                    score_threshold)
+
+
+def _tiles(image_size, tile_size, tile_overlap):
+    """Returns (x, y, size, size) of overlapping square tiles covering image."""
+    width, height = image_size
+    size = min(tile_size, width, height)
+    stride = max(1, int(size * (1.0 - tile_overlap)))
+
+    def starts(length):
+        positions = list(range(0, length - size, stride))
+        positions.append(length - size)  # Last tile is aligned to the edge.
+        return positions
+
+    return [(x, y, size, size) for y in starts(height) for x in starts(width)]
+
+
+def get_objects_tiled(inference, image, tile_size=512, tile_overlap=0.25,
+                      score_threshold=0.3, overlap_threshold=0.5,
+                      per_class=False, max_num_objects=None):
+    """Returns list of Object detected in overlapping tiles of a large image.
+
+    The model runs on 256x256 input, so objects small relative to the whole
+    image are missed. Each tile is resized to model input instead and runs
+    on the same loaded model, tiles are prepared while the previous one is
+    running. Detections in tile overlaps are merged by non maximum
+    suppression across tiles.
+
+    Args:
+      inference: ImageInference with the object detection model.
+      image: PIL.Image, RGB.
+      tile_size: int, tile width and height in image pixels.
+      tile_overlap: float, fraction of tile size shared by adjacent tiles,
+        should be larger than the size of objects to detect.
+      score_threshold: float, min score of each returned object.
+      overlap_threshold: float, see _non_maximum_suppression.
+      per_class: bool, run non maximum suppression for each kind separately.
+      max_num_objects: int, max number of objects to return.
+    """
+    start = time.monotonic()
+    tiles = _tiles(image.size, tile_size, tile_overlap)
+    crops = (image.crop((x, y, x + width, y + height))
+             for x, y, width, height in tiles)
+    objs = []
+    for (x, y, _, _), result in zip(tiles,
+                                    inference.run_batch(crops, resize=True)):
+        objs.extend(get_objects(result, score_threshold, (x, y),
+                                overlap_threshold, per_class))
+    duration = time.monotonic() - start
+    logging.info('Tiled object detection: %d tiles in %.1f ms, %.1f tiles/s.',
+                 len(tiles), 1000.0 * duration, len(tiles) / duration)
+    return _non_maximum_suppression(objs, overlap_threshold, per_class,
+                                    max_num_objects)
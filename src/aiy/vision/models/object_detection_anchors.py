@@ -11,1285 +11,43 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Predefined anchors for object detection model."""
+"""Predefined anchors for object detection model.
 
-ANCHORS = (
-    (-0.018750000745, -0.018750000745, 0.08124999702, 0.08124999702),
-    (-0.039460681379, -0.11017136276, 0.10196068138, 0.17267136276),
-    (-0.11017136276, -0.039460681379, 0.17267136276, 0.10196068138),
-    (-0.018750000745, 0.043749999255, 0.08124999702, 0.14374999702),
-    (-0.039460681379, -0.047671362758, 0.10196068138, 0.23517136276),
-    (-0.11017136276, 0.023039318621, 0.17267136276, 0.16446068883),
-    (-0.018750000745, 0.10625000298, 0.08124999702, 0.20624999702),
-    (-0.039460681379, 0.014828637242, 0.10196068138, 0.29767137766),
-    (-0.11017136276, 0.085539318621, 0.17267136276, 0.22696068883),
-    (-0.018750000745, 0.16875000298, 0.08124999702, 0.26875001192),
-    (-0.039460681379, 0.077328637242, 0.10196068138, 0.36017137766),
-    (-0.11017136276, 0.14803931117, 0.17267136276, 0.28946068883),
-    (-0.018750000745, 0.23125000298, 0.08124999702, 0.33125001192),
-    (-0.039460681379, 0.13982863724, 0.10196068138, 0.42267137766),
-    (-0.11017136276, 0.21053931117, 0.17267136276, 0.35196068883),
-    (-0.018750000745, 0.29374998808, 0.08124999702, 0.39375001192),
-    (-0.039460681379, 0.20232863724, 0.10196068138, 0.48517137766),
-    (-0.11017136276, 0.27303931117, 0.17267136276, 0.41446068883),
-    (-0.018750000745, 0.35624998808, 0.08124999702, 0.45625001192),
-    (-0.039460681379, 0.26482862234, 0.10196068138, 0.54767137766),
-    (-0.11017136276, 0.33553931117, 0.17267136276, 0.47696068883),
-    (-0.018750000745, 0.41874998808, 0.08124999702, 0.51875001192),
-    (-0.039460681379, 0.32732862234, 0.10196068138, 0.61017137766),
-    (-0.11017136276, 0.39803931117, 0.17267136276, 0.53946065903),
-    (-0.018750000745, 0.48124998808, 0.08124999702, 0.58125001192),
-    (-0.039460681379, 0.38982862234, 0.10196068138, 0.67267137766),
-    (-0.11017136276, 0.46053931117, 0.17267136276, 0.60196065903),
-    (-0.018750000745, 0.54374998808, 0.08124999702, 0.64375001192),
-    (-0.039460681379, 0.45232862234, 0.10196068138, 0.73517137766),
-    (-0.11017136276, 0.52303934097, 0.17267136276, 0.66446065903),
-    (-0.018750000745, 0.60624998808, 0.08124999702, 0.70625001192),
-    (-0.039460681379, 0.51482862234, 0.10196068138, 0.79767137766),
-    (-0.11017136276, 0.58553934097, 0.17267136276, 0.72696065903),
-    (-0.018750000745, 0.66874998808, 0.08124999702, 0.76875001192),
-    (-0.039460681379, 0.57732862234, 0.10196068138, 0.86017137766),
-    (-0.11017136276, 0.64803934097, 0.17267136276, 0.78946065903),
-    (-0.018750000745, 0.73124998808, 0.08124999702, 0.83125001192),
-    (-0.039460681379, 0.63982862234, 0.10196068138, 0.92267137766),
-    (-0.11017136276, 0.71053934097, 0.17267136276, 0.85196065903),
-    (-0.018750000745, 0.79374998808, 0.08124999702, 0.89375001192),
-    (-0.039460681379, 0.70232862234, 0.10196068138, 0.98517137766),
-    (-0.11017136276, 0.77303934097, 0.17267136276, 0.91446065903),
-    (-0.018750000745, 0.85624998808, 0.08124999702, 0.95625001192),
-    (-0.039460681379, 0.76482862234, 0.10196068138, 1.0476713181),
-    (-0.11017136276, 0.83553934097, 0.17267136276, 0.97696065903),
-    (-0.018750000745, 0.91874998808, 0.08124999702, 1.0187499523),
-    (-0.039460681379, 0.82732862234, 0.10196068138, 1.1101713181),
-    (-0.11017136276, 0.89803934097, 0.17267136276, 1.039460659),
-    (0.043749999255, -0.018750000745, 0.14374999702, 0.08124999702),
-    (0.023039318621, -0.11017136276, 0.16446068883, 0.17267136276),
-    (-0.047671362758, -0.039460681379, 0.23517136276, 0.10196068138),
-    (0.043749999255, 0.043749999255, 0.14374999702, 0.14374999702),
-    (0.023039318621, -0.047671362758, 0.16446068883, 0.23517136276),
-    (-0.047671362758, 0.023039318621, 0.23517136276, 0.16446068883),
-    (0.043749999255, 0.10625000298, 0.14374999702, 0.20624999702),
-    (0.023039318621, 0.014828637242, 0.16446068883, 0.29767137766),
-    (-0.047671362758, 0.085539318621, 0.23517136276, 0.22696068883),
-    (0.043749999255, 0.16875000298, 0.14374999702, 0.26875001192),
-    (0.023039318621, 0.077328637242, 0.16446068883, 0.36017137766),
-    (-0.047671362758, 0.14803931117, 0.23517136276, 0.28946068883),
-    (0.043749999255, 0.23125000298, 0.14374999702, 0.33125001192),
-    (0.023039318621, 0.13982863724, 0.16446068883, 0.42267137766),
-    (-0.047671362758, 0.21053931117, 0.23517136276, 0.35196068883),
-    (0.043749999255, 0.29374998808, 0.14374999702, 0.39375001192),
-    (0.023039318621, 0.20232863724, 0.16446068883, 0.48517137766),
-    (-0.047671362758, 0.27303931117, 0.23517136276, 0.41446068883),
-    (0.043749999255, 0.35624998808, 0.14374999702, 0.45625001192),
-    (0.023039318621, 0.26482862234, 0.16446068883, 0.54767137766),
-    (-0.047671362758, 0.33553931117, 0.23517136276, 0.47696068883),
-    (0.043749999255, 0.41874998808, 0.14374999702, 0.51875001192),
-    (0.023039318621, 0.32732862234, 0.16446068883, 0.61017137766),
-    (-0.047671362758, 0.39803931117, 0.23517136276, 0.53946065903),
-    (0.043749999255, 0.48124998808, 0.14374999702, 0.58125001192),
-    (0.023039318621, 0.38982862234, 0.16446068883, 0.67267137766),
-    (-0.047671362758, 0.46053931117, 0.23517136276, 0.60196065903),
-    (0.043749999255, 0.54374998808, 0.14374999702, 0.64375001192),
-    (0.023039318621, 0.45232862234, 0.16446068883, 0.73517137766),
-    (-0.047671362758, 0.52303934097, 0.23517136276, 0.66446065903),
-    (0.043749999255, 0.60624998808, 0.14374999702, 0.70625001192),
-    (0.023039318621, 0.51482862234, 0.16446068883, 0.79767137766),
-    (-0.047671362758, 0.58553934097, 0.23517136276, 0.72696065903),
-    (0.043749999255, 0.66874998808, 0.14374999702, 0.76875001192),
-    (0.023039318621, 0.57732862234, 0.16446068883, 0.86017137766),
-    (-0.047671362758, 0.64803934097, 0.23517136276, 0.78946065903),
-    (0.043749999255, 0.73124998808, 0.14374999702, 0.83125001192),
-    (0.023039318621, 0.63982862234, 0.16446068883, 0.92267137766),
-    (-0.047671362758, 0.71053934097, 0.23517136276, 0.85196065903),
-    (0.043749999255, 0.79374998808, 0.14374999702, 0.89375001192),
-    (0.023039318621, 0.70232862234, 0.16446068883, 0.98517137766),
-    (-0.047671362758, 0.77303934097, 0.23517136276, 0.91446065903),
-    (0.043749999255, 0.85624998808, 0.14374999702, 0.95625001192),
-    (0.023039318621, 0.76482862234, 0.16446068883, 1.0476713181),
-    (-0.047671362758, 0.83553934097, 0.23517136276, 0.97696065903),
-    (0.043749999255, 0.91874998808, 0.14374999702, 1.0187499523),
-    (0.023039318621, 0.82732862234, 0.16446068883, 1.1101713181),
-    (-0.047671362758, 0.89803934097, 0.23517136276, 1.039460659),
-    (0.10625000298, -0.018750000745, 0.20624999702, 0.08124999702),
-    (0.085539318621, -0.11017136276, 0.22696068883, 0.17267136276),
-    (0.014828637242, -0.039460681379, 0.29767137766, 0.10196068138),
-    (0.10625000298, 0.043749999255, 0.20624999702, 0.14374999702),
-    (0.085539318621, -0.047671362758, 0.22696068883, 0.23517136276),
-    (0.014828637242, 0.023039318621, 0.29767137766, 0.16446068883),
-    (0.10625000298, 0.10625000298, 0.20624999702, 0.20624999702),
-    (0.085539318621, 0.014828637242, 0.22696068883, 0.29767137766),
-    (0.014828637242, 0.085539318621, 0.29767137766, 0.22696068883),
-    (0.10625000298, 0.16875000298, 0.20624999702, 0.26875001192),
-    (0.085539318621, 0.077328637242, 0.22696068883, 0.36017137766),
-    (0.014828637242, 0.14803931117, 0.29767137766, 0.28946068883),
-    (0.10625000298, 0.23125000298, 0.20624999702, 0.33125001192),
-    (0.085539318621, 0.13982863724, 0.22696068883, 0.42267137766),
-    (0.014828637242, 0.21053931117, 0.29767137766, 0.35196068883),
-    (0.10625000298, 0.29374998808, 0.20624999702, 0.39375001192),
-    (0.085539318621, 0.20232863724, 0.22696068883, 0.48517137766),
-    (0.014828637242, 0.27303931117, 0.29767137766, 0.41446068883),
-    (0.10625000298, 0.35624998808, 0.20624999702, 0.45625001192),
-    (0.085539318621, 0.26482862234, 0.22696068883, 0.54767137766),
-    (0.014828637242, 0.33553931117, 0.29767137766, 0.47696068883),
-    (0.10625000298, 0.41874998808, 0.20624999702, 0.51875001192),
-    (0.085539318621, 0.32732862234, 0.22696068883, 0.61017137766),
-    (0.014828637242, 0.39803931117, 0.29767137766, 0.53946065903),
-    (0.10625000298, 0.48124998808, 0.20624999702, 0.58125001192),
-    (0.085539318621, 0.38982862234, 0.22696068883, 0.67267137766),
-    (0.014828637242, 0.46053931117, 0.29767137766, 0.60196065903),
-    (0.10625000298, 0.54374998808, 0.20624999702, 0.64375001192),
-    (0.085539318621, 0.45232862234, 0.22696068883, 0.73517137766),
-    (0.014828637242, 0.52303934097, 0.29767137766, 0.66446065903),
-    (0.10625000298, 0.60624998808, 0.20624999702, 0.70625001192),
-    (0.085539318621, 0.51482862234, 0.22696068883, 0.79767137766),
-    (0.014828637242, 0.58553934097, 0.29767137766, 0.72696065903),
-    (0.10625000298, 0.66874998808, 0.20624999702, 0.76875001192),
-    (0.085539318621, 0.57732862234, 0.22696068883, 0.86017137766),
-    (0.014828637242, 0.64803934097, 0.29767137766, 0.78946065903),
-    (0.10625000298, 0.73124998808, 0.20624999702, 0.83125001192),
-    (0.085539318621, 0.63982862234, 0.22696068883, 0.92267137766),
-    (0.014828637242, 0.71053934097, 0.29767137766, 0.85196065903),
-    (0.10625000298, 0.79374998808, 0.20624999702, 0.89375001192),
-    (0.085539318621, 0.70232862234, 0.22696068883, 0.98517137766),
-    (0.014828637242, 0.77303934097, 0.29767137766, 0.91446065903),
-    (0.10625000298, 0.85624998808, 0.20624999702, 0.95625001192),
-    (0.085539318621, 0.76482862234, 0.22696068883, 1.0476713181),
-    (0.014828637242, 0.83553934097, 0.29767137766, 0.97696065903),
-    (0.10625000298, 0.91874998808, 0.20624999702, 1.0187499523),
-    (0.085539318621, 0.82732862234, 0.22696068883, 1.1101713181),
-    (0.014828637242, 0.89803934097, 0.29767137766, 1.039460659),
-    (0.16875000298, -0.018750000745, 0.26875001192, 0.08124999702),
-    (0.14803931117, -0.11017136276, 0.28946068883, 0.17267136276),
-    (0.077328637242, -0.039460681379, 0.36017137766, 0.10196068138),
-    (0.16875000298, 0.043749999255, 0.26875001192, 0.14374999702),
-    (0.14803931117, -0.047671362758, 0.28946068883, 0.23517136276),
-    (0.077328637242, 0.023039318621, 0.36017137766, 0.16446068883),
-    (0.16875000298, 0.10625000298, 0.26875001192, 0.20624999702),
-    (0.14803931117, 0.014828637242, 0.28946068883, 0.29767137766),
-    (0.077328637242, 0.085539318621, 0.36017137766, 0.22696068883),
-    (0.16875000298, 0.16875000298, 0.26875001192, 0.26875001192),
-    (0.14803931117, 0.077328637242, 0.28946068883, 0.36017137766),
-    (0.077328637242, 0.14803931117, 0.36017137766, 0.28946068883),
-    (0.16875000298, 0.23125000298, 0.26875001192, 0.33125001192),
-    (0.14803931117, 0.13982863724, 0.28946068883, 0.42267137766),
-    (0.077328637242, 0.21053931117, 0.36017137766, 0.35196068883),
-    (0.16875000298, 0.29374998808, 0.26875001192, 0.39375001192),
-    (0.14803931117, 0.20232863724, 0.28946068883, 0.48517137766),
-    (0.077328637242, 0.27303931117, 0.36017137766, 0.41446068883),
-    (0.16875000298, 0.35624998808, 0.26875001192, 0.45625001192),
-    (0.14803931117, 0.26482862234, 0.28946068883, 0.54767137766),
-    (0.077328637242, 0.33553931117, 0.36017137766, 0.47696068883),
-    (0.16875000298, 0.41874998808, 0.26875001192, 0.51875001192),
-    (0.14803931117, 0.32732862234, 0.28946068883, 0.61017137766),
-    (0.077328637242, 0.39803931117, 0.36017137766, 0.53946065903),
-    (0.16875000298, 0.48124998808, 0.26875001192, 0.58125001192),
-    (0.14803931117, 0.38982862234, 0.28946068883, 0.67267137766),
-    (0.077328637242, 0.46053931117, 0.36017137766, 0.60196065903),
-    (0.16875000298, 0.54374998808, 0.26875001192, 0.64375001192),
-    (0.14803931117, 0.45232862234, 0.28946068883, 0.73517137766),
-    (0.077328637242, 0.52303934097, 0.36017137766, 0.66446065903),
-    (0.16875000298, 0.60624998808, 0.26875001192, 0.70625001192),
-    (0.14803931117, 0.51482862234, 0.28946068883, 0.79767137766),
-    (0.077328637242, 0.58553934097, 0.36017137766, 0.72696065903),
-    (0.16875000298, 0.66874998808, 0.26875001192, 0.76875001192),
-    (0.14803931117, 0.57732862234, 0.28946068883, 0.86017137766),
-    (0.077328637242, 0.64803934097, 0.36017137766, 0.78946065903),
-    (0.16875000298, 0.73124998808, 0.26875001192, 0.83125001192),
-    (0.14803931117, 0.63982862234, 0.28946068883, 0.92267137766),
-    (0.077328637242, 0.71053934097, 0.36017137766, 0.85196065903),
-    (0.16875000298, 0.79374998808, 0.26875001192, 0.89375001192),
-    (0.14803931117, 0.70232862234, 0.28946068883, 0.98517137766),
-    (0.077328637242, 0.77303934097, 0.36017137766, 0.91446065903),
-    (0.16875000298, 0.85624998808, 0.26875001192, 0.95625001192),
-    (0.14803931117, 0.76482862234, 0.28946068883, 1.0476713181),
-    (0.077328637242, 0.83553934097, 0.36017137766, 0.97696065903),
-    (0.16875000298, 0.91874998808, 0.26875001192, 1.0187499523),
-    (0.14803931117, 0.82732862234, 0.28946068883, 1.1101713181),
-    (0.077328637242, 0.89803934097, 0.36017137766, 1.039460659),
-    (0.23125000298, -0.018750000745, 0.33125001192, 0.08124999702),
-    (0.21053931117, -0.11017136276, 0.35196068883, 0.17267136276),
-    (0.13982863724, -0.039460681379, 0.42267137766, 0.10196068138),
-    (0.23125000298, 0.043749999255, 0.33125001192, 0.14374999702),
-    (0.21053931117, -0.047671362758, 0.35196068883, 0.23517136276),
-    (0.13982863724, 0.023039318621, 0.42267137766, 0.16446068883),
-    (0.23125000298, 0.10625000298, 0.33125001192, 0.20624999702),
-    (0.21053931117, 0.014828637242, 0.35196068883, 0.29767137766),
-    (0.13982863724, 0.085539318621, 0.42267137766, 0.22696068883),
-    (0.23125000298, 0.16875000298, 0.33125001192, 0.26875001192),
-    (0.21053931117, 0.077328637242, 0.35196068883, 0.36017137766),
-    (0.13982863724, 0.14803931117, 0.42267137766, 0.28946068883),
-    (0.23125000298, 0.23125000298, 0.33125001192, 0.33125001192),
-    (0.21053931117, 0.13982863724, 0.35196068883, 0.42267137766),
-    (0.13982863724, 0.21053931117, 0.42267137766, 0.35196068883),
-    (0.23125000298, 0.29374998808, 0.33125001192, 0.39375001192),
-    (0.21053931117, 0.20232863724, 0.35196068883, 0.48517137766),
-    (0.13982863724, 0.27303931117, 0.42267137766, 0.41446068883),
-    (0.23125000298, 0.35624998808, 0.33125001192, 0.45625001192),
-    (0.21053931117, 0.26482862234, 0.35196068883, 0.54767137766),
-    (0.13982863724, 0.33553931117, 0.42267137766, 0.47696068883),
-    (0.23125000298, 0.41874998808, 0.33125001192, 0.51875001192),
-    (0.21053931117, 0.32732862234, 0.35196068883, 0.61017137766),
-    (0.13982863724, 0.39803931117, 0.42267137766, 0.53946065903),
-    (0.23125000298, 0.48124998808, 0.33125001192, 0.58125001192),
-    (0.21053931117, 0.38982862234, 0.35196068883, 0.67267137766),
-    (0.13982863724, 0.46053931117, 0.42267137766, 0.60196065903),
-    (0.23125000298, 0.54374998808, 0.33125001192, 0.64375001192),
-    (0.21053931117, 0.45232862234, 0.35196068883, 0.73517137766),
-    (0.13982863724, 0.52303934097, 0.42267137766, 0.66446065903),
-    (0.23125000298, 0.60624998808, 0.33125001192, 0.70625001192),
-    (0.21053931117, 0.51482862234, 0.35196068883, 0.79767137766),
-    (0.13982863724, 0.58553934097, 0.42267137766, 0.72696065903),
-    (0.23125000298, 0.66874998808, 0.33125001192, 0.76875001192),
-    (0.21053931117, 0.57732862234, 0.35196068883, 0.86017137766),
-    (0.13982863724, 0.64803934097, 0.42267137766, 0.78946065903),
-    (0.23125000298, 0.73124998808, 0.33125001192, 0.83125001192),
-    (0.21053931117, 0.63982862234, 0.35196068883, 0.92267137766),
-    (0.13982863724, 0.71053934097, 0.42267137766, 0.85196065903),
-    (0.23125000298, 0.79374998808, 0.33125001192, 0.89375001192),
-    (0.21053931117, 0.70232862234, 0.35196068883, 0.98517137766),
-    (0.13982863724, 0.77303934097, 0.42267137766, 0.91446065903),
-    (0.23125000298, 0.85624998808, 0.33125001192, 0.95625001192),
-    (0.21053931117, 0.76482862234, 0.35196068883, 1.0476713181),
-    (0.13982863724, 0.83553934097, 0.42267137766, 0.97696065903),
-    (0.23125000298, 0.91874998808, 0.33125001192, 1.0187499523),
-    (0.21053931117, 0.82732862234, 0.35196068883, 1.1101713181),
-    (0.13982863724, 0.89803934097, 0.42267137766, 1.039460659),
-    (0.29374998808, -0.018750000745, 0.39375001192, 0.08124999702),
-    (0.27303931117, -0.11017136276, 0.41446068883, 0.17267136276),
-    (0.20232863724, -0.039460681379, 0.48517137766, 0.10196068138),
-    (0.29374998808, 0.043749999255, 0.39375001192, 0.14374999702),
-    (0.27303931117, -0.047671362758, 0.41446068883, 0.23517136276),
-    (0.20232863724, 0.023039318621, 0.48517137766, 0.16446068883),
-    (0.29374998808, 0.10625000298, 0.39375001192, 0.20624999702),
-    (0.27303931117, 0.014828637242, 0.41446068883, 0.29767137766),
-    (0.20232863724, 0.085539318621, 0.48517137766, 0.22696068883),
-    (0.29374998808, 0.16875000298, 0.39375001192, 0.26875001192),
-    (0.27303931117, 0.077328637242, 0.41446068883, 0.36017137766),
-    (0.20232863724, 0.14803931117, 0.48517137766, 0.28946068883),
-    (0.29374998808, 0.23125000298, 0.39375001192, 0.33125001192),
-    (0.27303931117, 0.13982863724, 0.41446068883, 0.42267137766),
-    (0.20232863724, 0.21053931117, 0.48517137766, 0.35196068883),
-    (0.29374998808, 0.29374998808, 0.39375001192, 0.39375001192),
-    (0.27303931117, 0.20232863724, 0.41446068883, 0.48517137766),
-    (0.20232863724, 0.27303931117, 0.48517137766, 0.41446068883),
-    (0.29374998808, 0.35624998808, 0.39375001192, 0.45625001192),
-    (0.27303931117, 0.26482862234, 0.41446068883, 0.54767137766),
-    (0.20232863724, 0.33553931117, 0.48517137766, 0.47696068883),
-    (0.29374998808, 0.41874998808, 0.39375001192, 0.51875001192),
-    (0.27303931117, 0.32732862234, 0.41446068883, 0.61017137766),
-    (0.20232863724, 0.39803931117, 0.48517137766, 0.53946065903),
-    (0.29374998808, 0.48124998808, 0.39375001192, 0.58125001192),
-    (0.27303931117, 0.38982862234, 0.41446068883, 0.67267137766),
-    (0.20232863724, 0.46053931117, 0.48517137766, 0.60196065903),
-    (0.29374998808, 0.54374998808, 0.39375001192, 0.64375001192),
-    (0.27303931117, 0.45232862234, 0.41446068883, 0.73517137766),
-    (0.20232863724, 0.52303934097, 0.48517137766, 0.66446065903),
-    (0.29374998808, 0.60624998808, 0.39375001192, 0.70625001192),
-    (0.27303931117, 0.51482862234, 0.41446068883, 0.79767137766),
-    (0.20232863724, 0.58553934097, 0.48517137766, 0.72696065903),
-    (0.29374998808, 0.66874998808, 0.39375001192, 0.76875001192),
-    (0.27303931117, 0.57732862234, 0.41446068883, 0.86017137766),
-    (0.20232863724, 0.64803934097, 0.48517137766, 0.78946065903),
-    (0.29374998808, 0.73124998808, 0.39375001192, 0.83125001192),
-    (0.27303931117, 0.63982862234, 0.41446068883, 0.92267137766),
-    (0.20232863724, 0.71053934097, 0.48517137766, 0.85196065903),
-    (0.29374998808, 0.79374998808, 0.39375001192, 0.89375001192),
-    (0.27303931117, 0.70232862234, 0.41446068883, 0.98517137766),
-    (0.20232863724, 0.77303934097, 0.48517137766, 0.91446065903),
-    (0.29374998808, 0.85624998808, 0.39375001192, 0.95625001192),
-    (0.27303931117, 0.76482862234, 0.41446068883, 1.0476713181),
-    (0.20232863724, 0.83553934097, 0.48517137766, 0.97696065903),
-    (0.29374998808, 0.91874998808, 0.39375001192, 1.0187499523),
-    (0.27303931117, 0.82732862234, 0.41446068883, 1.1101713181),
-    (0.20232863724, 0.89803934097, 0.48517137766, 1.039460659),
-    (0.35624998808, -0.018750000745, 0.45625001192, 0.08124999702),
-    (0.33553931117, -0.11017136276, 0.47696068883, 0.17267136276),
-    (0.26482862234, -0.039460681379, 0.54767137766, 0.10196068138),
-    (0.35624998808, 0.043749999255, 0.45625001192, 0.14374999702),
-    (0.33553931117, -0.047671362758, 0.47696068883, 0.23517136276),
-    (0.26482862234, 0.023039318621, 0.54767137766, 0.16446068883),
-    (0.35624998808, 0.10625000298, 0.45625001192, 0.20624999702),
-    (0.33553931117, 0.014828637242, 0.47696068883, 0.29767137766),
-    (0.26482862234, 0.085539318621, 0.54767137766, 0.22696068883),
-    (0.35624998808, 0.16875000298, 0.45625001192, 0.26875001192),
-    (0.33553931117, 0.077328637242, 0.47696068883, 0.36017137766),
-    (0.26482862234, 0.14803931117, 0.54767137766, 0.28946068883),
-    (0.35624998808, 0.23125000298, 0.45625001192, 0.33125001192),
-    (0.33553931117, 0.13982863724, 0.47696068883, 0.42267137766),
-    (0.26482862234, 0.21053931117, 0.54767137766, 0.35196068883),
-    (0.35624998808, 0.29374998808, 0.45625001192, 0.39375001192),
-    (0.33553931117, 0.20232863724, 0.47696068883, 0.48517137766),
-    (0.26482862234, 0.27303931117, 0.54767137766, 0.41446068883),
-    (0.35624998808, 0.35624998808, 0.45625001192, 0.45625001192),
-    (0.33553931117, 0.26482862234, 0.47696068883, 0.54767137766),
-    (0.26482862234, 0.33553931117, 0.54767137766, 0.47696068883),
-    (0.35624998808, 0.41874998808, 0.45625001192, 0.51875001192),
-    (0.33553931117, 0.32732862234, 0.47696068883, 0.61017137766),
-    (0.26482862234, 0.39803931117, 0.54767137766, 0.53946065903),
-    (0.35624998808, 0.48124998808, 0.45625001192, 0.58125001192),
-    (0.33553931117, 0.38982862234, 0.47696068883, 0.67267137766),
-    (0.26482862234, 0.46053931117, 0.54767137766, 0.60196065903),
-    (0.35624998808, 0.54374998808, 0.45625001192, 0.64375001192),
-    (0.33553931117, 0.45232862234, 0.47696068883, 0.73517137766),
-    (0.26482862234, 0.52303934097, 0.54767137766, 0.66446065903),
-    (0.35624998808, 0.60624998808, 0.45625001192, 0.70625001192),
-    (0.33553931117, 0.51482862234, 0.47696068883, 0.79767137766),
-    (0.26482862234, 0.58553934097, 0.54767137766, 0.72696065903),
-    (0.35624998808, 0.66874998808, 0.45625001192, 0.76875001192),
-    (0.33553931117, 0.57732862234, 0.47696068883, 0.86017137766),
-    (0.26482862234, 0.64803934097, 0.54767137766, 0.78946065903),
-    (0.35624998808, 0.73124998808, 0.45625001192, 0.83125001192),
-    (0.33553931117, 0.63982862234, 0.47696068883, 0.92267137766),
-    (0.26482862234, 0.71053934097, 0.54767137766, 0.85196065903),
-    (0.35624998808, 0.79374998808, 0.45625001192, 0.89375001192),
-    (0.33553931117, 0.70232862234, 0.47696068883, 0.98517137766),
-    (0.26482862234, 0.77303934097, 0.54767137766, 0.91446065903),
-    (0.35624998808, 0.85624998808, 0.45625001192, 0.95625001192),
-    (0.33553931117, 0.76482862234, 0.47696068883, 1.0476713181),
-    (0.26482862234, 0.83553934097, 0.54767137766, 0.97696065903),
-    (0.35624998808, 0.91874998808, 0.45625001192, 1.0187499523),
-    (0.33553931117, 0.82732862234, 0.47696068883, 1.1101713181),
-    (0.26482862234, 0.89803934097, 0.54767137766, 1.039460659),
-    (0.41874998808, -0.018750000745, 0.51875001192, 0.08124999702),
-    (0.39803931117, -0.11017136276, 0.53946065903, 0.17267136276),
-    (0.32732862234, -0.039460681379, 0.61017137766, 0.10196068138),
-    (0.41874998808, 0.043749999255, 0.51875001192, 0.14374999702),
-    (0.39803931117, -0.047671362758, 0.53946065903, 0.23517136276),
-    (0.32732862234, 0.023039318621, 0.61017137766, 0.16446068883),
-    (0.41874998808, 0.10625000298, 0.51875001192, 0.20624999702),
-    (0.39803931117, 0.014828637242, 0.53946065903, 0.29767137766),
-    (0.32732862234, 0.085539318621, 0.61017137766, 0.22696068883),
-    (0.41874998808, 0.16875000298, 0.51875001192, 0.26875001192),
-    (0.39803931117, 0.077328637242, 0.53946065903, 0.36017137766),
-    (0.32732862234, 0.14803931117, 0.61017137766, 0.28946068883),
-    (0.41874998808, 0.23125000298, 0.51875001192, 0.33125001192),
-    (0.39803931117, 0.13982863724, 0.53946065903, 0.42267137766),
-    (0.32732862234, 0.21053931117, 0.61017137766, 0.35196068883),
-    (0.41874998808, 0.29374998808, 0.51875001192, 0.39375001192),
-    (0.39803931117, 0.20232863724, 0.53946065903, 0.48517137766),
-    (0.32732862234, 0.27303931117, 0.61017137766, 0.41446068883),
-    (0.41874998808, 0.35624998808, 0.51875001192, 0.45625001192),
-    (0.39803931117, 0.26482862234, 0.53946065903, 0.54767137766),
-    (0.32732862234, 0.33553931117, 0.61017137766, 0.47696068883),
-    (0.41874998808, 0.41874998808, 0.51875001192, 0.51875001192),
-    (0.39803931117, 0.32732862234, 0.53946065903, 0.61017137766),
-    (0.32732862234, 0.39803931117, 0.61017137766, 0.53946065903),
-    (0.41874998808, 0.48124998808, 0.51875001192, 0.58125001192),
-    (0.39803931117, 0.38982862234, 0.53946065903, 0.67267137766),
-    (0.32732862234, 0.46053931117, 0.61017137766, 0.60196065903),
-    (0.41874998808, 0.54374998808, 0.51875001192, 0.64375001192),
-    (0.39803931117, 0.45232862234, 0.53946065903, 0.73517137766),
-    (0.32732862234, 0.52303934097, 0.61017137766, 0.66446065903),
-    (0.41874998808, 0.60624998808, 0.51875001192, 0.70625001192),
-    (0.39803931117, 0.51482862234, 0.53946065903, 0.79767137766),
-    (0.32732862234, 0.58553934097, 0.61017137766, 0.72696065903),
-    (0.41874998808, 0.66874998808, 0.51875001192, 0.76875001192),
-    (0.39803931117, 0.57732862234, 0.53946065903, 0.86017137766),
-    (0.32732862234, 0.64803934097, 0.61017137766, 0.78946065903),
-    (0.41874998808, 0.73124998808, 0.51875001192, 0.83125001192),
-    (0.39803931117, 0.63982862234, 0.53946065903, 0.92267137766),
-    (0.32732862234, 0.71053934097, 0.61017137766, 0.85196065903),
-    (0.41874998808, 0.79374998808, 0.51875001192, 0.89375001192),
-    (0.39803931117, 0.70232862234, 0.53946065903, 0.98517137766),
-    (0.32732862234, 0.77303934097, 0.61017137766, 0.91446065903),
-    (0.41874998808, 0.85624998808, 0.51875001192, 0.95625001192),
-    (0.39803931117, 0.76482862234, 0.53946065903, 1.0476713181),
-    (0.32732862234, 0.83553934097, 0.61017137766, 0.97696065903),
-    (0.41874998808, 0.91874998808, 0.51875001192, 1.0187499523),
-    (0.39803931117, 0.82732862234, 0.53946065903, 1.1101713181),
-    (0.32732862234, 0.89803934097, 0.61017137766, 1.039460659),
-    (0.48124998808, -0.018750000745, 0.58125001192, 0.08124999702),
-    (0.46053931117, -0.11017136276, 0.60196065903, 0.17267136276),
-    (0.38982862234, -0.039460681379, 0.67267137766, 0.10196068138),
-    (0.48124998808, 0.043749999255, 0.58125001192, 0.14374999702),
-    (0.46053931117, -0.047671362758, 0.60196065903, 0.23517136276),
-    (0.38982862234, 0.023039318621, 0.67267137766, 0.16446068883),
-    (0.48124998808, 0.10625000298, 0.58125001192, 0.20624999702),
-    (0.46053931117, 0.014828637242, 0.60196065903, 0.29767137766),
-    (0.38982862234, 0.085539318621, 0.67267137766, 0.22696068883),
-    (0.48124998808, 0.16875000298, 0.58125001192, 0.26875001192),
-    (0.46053931117, 0.077328637242, 0.60196065903, 0.36017137766),
-    (0.38982862234, 0.14803931117, 0.67267137766, 0.28946068883),
-    (0.48124998808, 0.23125000298, 0.58125001192, 0.33125001192),
-    (0.46053931117, 0.13982863724, 0.60196065903, 0.42267137766),
-    (0.38982862234, 0.21053931117, 0.67267137766, 0.35196068883),
-    (0.48124998808, 0.29374998808, 0.58125001192, 0.39375001192),
-    (0.46053931117, 0.20232863724, 0.60196065903, 0.48517137766),
-    (0.38982862234, 0.27303931117, 0.67267137766, 0.41446068883),
-    (0.48124998808, 0.35624998808, 0.58125001192, 0.45625001192),
-    (0.46053931117, 0.26482862234, 0.60196065903, 0.54767137766),
-    (0.38982862234, 0.33553931117, 0.67267137766, 0.47696068883),
-    (0.48124998808, 0.41874998808, 0.58125001192, 0.51875001192),
-    (0.46053931117, 0.32732862234, 0.60196065903, 0.61017137766),
-    (0.38982862234, 0.39803931117, 0.67267137766, 0.53946065903),
-    (0.48124998808, 0.48124998808, 0.58125001192, 0.58125001192),
-    (0.46053931117, 0.38982862234, 0.60196065903, 0.67267137766),
-    (0.38982862234, 0.46053931117, 0.67267137766, 0.60196065903),
-    (0.48124998808, 0.54374998808, 0.58125001192, 0.64375001192),
-    (0.46053931117, 0.45232862234, 0.60196065903, 0.73517137766),
-    (0.38982862234, 0.52303934097, 0.67267137766, 0.66446065903),
-    (0.48124998808, 0.60624998808, 0.58125001192, 0.70625001192),
-    (0.46053931117, 0.51482862234, 0.60196065903, 0.79767137766),
-    (0.38982862234, 0.58553934097, 0.67267137766, 0.72696065903),
-    (0.48124998808, 0.66874998808, 0.58125001192, 0.76875001192),
-    (0.46053931117, 0.57732862234, 0.60196065903, 0.86017137766),
-    (0.38982862234, 0.64803934097, 0.67267137766, 0.78946065903),
-    (0.48124998808, 0.73124998808, 0.58125001192, 0.83125001192),
-    (0.46053931117, 0.63982862234, 0.60196065903, 0.92267137766),
-    (0.38982862234, 0.71053934097, 0.67267137766, 0.85196065903),
-    (0.48124998808, 0.79374998808, 0.58125001192, 0.89375001192),
-    (0.46053931117, 0.70232862234, 0.60196065903, 0.98517137766),
-    (0.38982862234, 0.77303934097, 0.67267137766, 0.91446065903),
-    (0.48124998808, 0.85624998808, 0.58125001192, 0.95625001192),
-    (0.46053931117, 0.76482862234, 0.60196065903, 1.0476713181),
-    (0.38982862234, 0.83553934097, 0.67267137766, 0.97696065903),
-    (0.48124998808, 0.91874998808, 0.58125001192, 1.0187499523),
-    (0.46053931117, 0.82732862234, 0.60196065903, 1.1101713181),
-    (0.38982862234, 0.89803934097, 0.67267137766, 1.039460659),
-    (0.54374998808, -0.018750000745, 0.64375001192, 0.08124999702),
-    (0.52303934097, -0.11017136276, 0.66446065903, 0.17267136276),
-    (0.45232862234, -0.039460681379, 0.73517137766, 0.10196068138),
-    (0.54374998808, 0.043749999255, 0.64375001192, 0.14374999702),
-    (0.52303934097, -0.047671362758, 0.66446065903, 0.23517136276),
-    (0.45232862234, 0.023039318621, 0.73517137766, 0.16446068883),
-    (0.54374998808, 0.10625000298, 0.64375001192, 0.20624999702),
-    (0.52303934097, 0.014828637242, 0.66446065903, 0.29767137766),
-    (0.45232862234, 0.085539318621, 0.73517137766, 0.22696068883),
-    (0.54374998808, 0.16875000298, 0.64375001192, 0.26875001192),
-    (0.52303934097, 0.077328637242, 0.66446065903, 0.36017137766),
-    (0.45232862234, 0.14803931117, 0.73517137766, 0.28946068883),
-    (0.54374998808, 0.23125000298, 0.64375001192, 0.33125001192),
-    (0.52303934097, 0.13982863724, 0.66446065903, 0.42267137766),
-    (0.45232862234, 0.21053931117, 0.73517137766, 0.35196068883),
-    (0.54374998808, 0.29374998808, 0.64375001192, 0.39375001192),
-    (0.52303934097, 0.20232863724, 0.66446065903, 0.48517137766),
-    (0.45232862234, 0.27303931117, 0.73517137766, 0.41446068883),
-    (0.54374998808, 0.35624998808, 0.64375001192, 0.45625001192),
-    (0.52303934097, 0.26482862234, 0.66446065903, 0.54767137766),
-    (0.45232862234, 0.33553931117, 0.73517137766, 0.47696068883),
-    (0.54374998808, 0.41874998808, 0.64375001192, 0.51875001192),
-    (0.52303934097, 0.32732862234, 0.66446065903, 0.61017137766),
-    (0.45232862234, 0.39803931117, 0.73517137766, 0.53946065903),
-    (0.54374998808, 0.48124998808, 0.64375001192, 0.58125001192),
-    (0.52303934097, 0.38982862234, 0.66446065903, 0.67267137766),
-    (0.45232862234, 0.46053931117, 0.73517137766, 0.60196065903),
-    (0.54374998808, 0.54374998808, 0.64375001192, 0.64375001192),
-    (0.52303934097, 0.45232862234, 0.66446065903, 0.73517137766),
-    (0.45232862234, 0.52303934097, 0.73517137766, 0.66446065903),
-    (0.54374998808, 0.60624998808, 0.64375001192, 0.70625001192),
-    (0.52303934097, 0.51482862234, 0.66446065903, 0.79767137766),
-    (0.45232862234, 0.58553934097, 0.73517137766, 0.72696065903),
-    (0.54374998808, 0.66874998808, 0.64375001192, 0.76875001192),
-    (0.52303934097, 0.57732862234, 0.66446065903, 0.86017137766),
-    (0.45232862234, 0.64803934097, 0.73517137766, 0.78946065903),
-    (0.54374998808, 0.73124998808, 0.64375001192, 0.83125001192),
-    (0.52303934097, 0.63982862234, 0.66446065903, 0.92267137766),
-    (0.45232862234, 0.71053934097, 0.73517137766, 0.85196065903),
-    (0.54374998808, 0.79374998808, 0.64375001192, 0.89375001192),
-    (0.52303934097, 0.70232862234, 0.66446065903, 0.98517137766),
-    (0.45232862234, 0.77303934097, 0.73517137766, 0.91446065903),
-    (0.54374998808, 0.85624998808, 0.64375001192, 0.95625001192),
-    (0.52303934097, 0.76482862234, 0.66446065903, 1.0476713181),
-    (0.45232862234, 0.83553934097, 0.73517137766, 0.97696065903),
-    (0.54374998808, 0.91874998808, 0.64375001192, 1.0187499523),
-    (0.52303934097, 0.82732862234, 0.66446065903, 1.1101713181),
-    (0.45232862234, 0.89803934097, 0.73517137766, 1.039460659),
-    (0.60624998808, -0.018750000745, 0.70625001192, 0.08124999702),
-    (0.58553934097, -0.11017136276, 0.72696065903, 0.17267136276),
-    (0.51482862234, -0.039460681379, 0.79767137766, 0.10196068138),
-    (0.60624998808, 0.043749999255, 0.70625001192, 0.14374999702),
-    (0.58553934097, -0.047671362758, 0.72696065903, 0.23517136276),
-    (0.51482862234, 0.023039318621, 0.79767137766, 0.16446068883),
-    (0.60624998808, 0.10625000298, 0.70625001192, 0.20624999702),
-    (0.58553934097, 0.014828637242, 0.72696065903, 0.29767137766),
-    (0.51482862234, 0.085539318621, 0.79767137766, 0.22696068883),
-    (0.60624998808, 0.16875000298, 0.70625001192, 0.26875001192),
-    (0.58553934097, 0.077328637242, 0.72696065903, 0.36017137766),
-    (0.51482862234, 0.14803931117, 0.79767137766, 0.28946068883),
-    (0.60624998808, 0.23125000298, 0.70625001192, 0.33125001192),
-    (0.58553934097, 0.13982863724, 0.72696065903, 0.42267137766),
-    (0.51482862234, 0.21053931117, 0.79767137766, 0.35196068883),
-    (0.60624998808, 0.29374998808, 0.70625001192, 0.39375001192),
-    (0.58553934097, 0.20232863724, 0.72696065903, 0.48517137766),
-    (0.51482862234, 0.27303931117, 0.79767137766, 0.41446068883),
-    (0.60624998808, 0.35624998808, 0.70625001192, 0.45625001192),
-    (0.58553934097, 0.26482862234, 0.72696065903, 0.54767137766),
-    (0.51482862234, 0.33553931117, 0.79767137766, 0.47696068883),
-    (0.60624998808, 0.41874998808, 0.70625001192, 0.51875001192),
-    (0.58553934097, 0.32732862234, 0.72696065903, 0.61017137766),
-    (0.51482862234, 0.39803931117, 0.79767137766, 0.53946065903),
-    (0.60624998808, 0.48124998808, 0.70625001192, 0.58125001192),
-    (0.58553934097, 0.38982862234, 0.72696065903, 0.67267137766),
-    (0.51482862234, 0.46053931117, 0.79767137766, 0.60196065903),
-    (0.60624998808, 0.54374998808, 0.70625001192, 0.64375001192),
-    (0.58553934097, 0.45232862234, 0.72696065903, 0.73517137766),
-    (0.51482862234, 0.52303934097, 0.79767137766, 0.66446065903),
-    (0.60624998808, 0.60624998808, 0.70625001192, 0.70625001192),
-    (0.58553934097, 0.51482862234, 0.72696065903, 0.79767137766),
-    (0.51482862234, 0.58553934097, 0.79767137766, 0.72696065903),
-    (0.60624998808, 0.66874998808, 0.70625001192, 0.76875001192),
-    (0.58553934097, 0.57732862234, 0.72696065903, 0.86017137766),
-    (0.51482862234, 0.64803934097, 0.79767137766, 0.78946065903),
-    (0.60624998808, 0.73124998808, 0.70625001192, 0.83125001192),
-    (0.58553934097, 0.63982862234, 0.72696065903, 0.92267137766),
-    (0.51482862234, 0.71053934097, 0.79767137766, 0.85196065903),
-    (0.60624998808, 0.79374998808, 0.70625001192, 0.89375001192),
-    (0.58553934097, 0.70232862234, 0.72696065903, 0.98517137766),
-    (0.51482862234, 0.77303934097, 0.79767137766, 0.91446065903),
-    (0.60624998808, 0.85624998808, 0.70625001192, 0.95625001192),
-    (0.58553934097, 0.76482862234, 0.72696065903, 1.0476713181),
-    (0.51482862234, 0.83553934097, 0.79767137766, 0.97696065903),
-    (0.60624998808, 0.91874998808, 0.70625001192, 1.0187499523),
-    (0.58553934097, 0.82732862234, 0.72696065903, 1.1101713181),
-    (0.51482862234, 0.89803934097, 0.79767137766, 1.039460659),
-    (0.66874998808, -0.018750000745, 0.76875001192, 0.08124999702),
-    (0.64803934097, -0.11017136276, 0.78946065903, 0.17267136276),
-    (0.57732862234, -0.039460681379, 0.86017137766, 0.10196068138),
-    (0.66874998808, 0.043749999255, 0.76875001192, 0.14374999702),
-    (0.64803934097, -0.047671362758, 0.78946065903, 0.23517136276),
-    (0.57732862234, 0.023039318621, 0.86017137766, 0.16446068883),
-    (0.66874998808, 0.10625000298, 0.76875001192, 0.20624999702),
-    (0.64803934097, 0.014828637242, 0.78946065903, 0.29767137766),
-    (0.57732862234, 0.085539318621, 0.86017137766, 0.22696068883),
-    (0.66874998808, 0.16875000298, 0.76875001192, 0.26875001192),
-    (0.64803934097, 0.077328637242, 0.78946065903, 0.36017137766),
-    (0.57732862234, 0.14803931117, 0.86017137766, 0.28946068883),
-    (0.66874998808, 0.23125000298, 0.76875001192, 0.33125001192),
-    (0.64803934097, 0.13982863724, 0.78946065903, 0.42267137766),
-    (0.57732862234, 0.21053931117, 0.86017137766, 0.35196068883),
-    (0.66874998808, 0.29374998808, 0.76875001192, 0.39375001192),
-    (0.64803934097, 0.20232863724, 0.78946065903, 0.48517137766),
-    (0.57732862234, 0.27303931117, 0.86017137766, 0.41446068883),
-    (0.66874998808, 0.35624998808, 0.76875001192, 0.45625001192),
-    (0.64803934097, 0.26482862234, 0.78946065903, 0.54767137766),
-    (0.57732862234, 0.33553931117, 0.86017137766, 0.47696068883),
-    (0.66874998808, 0.41874998808, 0.76875001192, 0.51875001192),
-    (0.64803934097, 0.32732862234, 0.78946065903, 0.61017137766),
-    (0.57732862234, 0.39803931117, 0.86017137766, 0.53946065903),
-    (0.66874998808, 0.48124998808, 0.76875001192, 0.58125001192),
-    (0.64803934097, 0.38982862234, 0.78946065903, 0.67267137766),
-    (0.57732862234, 0.46053931117, 0.86017137766, 0.60196065903),
-    (0.66874998808, 0.54374998808, 0.76875001192, 0.64375001192),
-    (0.64803934097, 0.45232862234, 0.78946065903, 0.73517137766),
-    (0.57732862234, 0.52303934097, 0.86017137766, 0.66446065903),
-    (0.66874998808, 0.60624998808, 0.76875001192, 0.70625001192),
-    (0.64803934097, 0.51482862234, 0.78946065903, 0.79767137766),
-    (0.57732862234, 0.58553934097, 0.86017137766, 0.72696065903),
-    (0.66874998808, 0.66874998808, 0.76875001192, 0.76875001192),
-    (0.64803934097, 0.57732862234, 0.78946065903, 0.86017137766),
-    (0.57732862234, 0.64803934097, 0.86017137766, 0.78946065903),
-    (0.66874998808, 0.73124998808, 0.76875001192, 0.83125001192),
-    (0.64803934097, 0.63982862234, 0.78946065903, 0.92267137766),
-    (0.57732862234, 0.71053934097, 0.86017137766, 0.85196065903),
-    (0.66874998808, 0.79374998808, 0.76875001192, 0.89375001192),
-    (0.64803934097, 0.70232862234, 0.78946065903, 0.98517137766),
-    (0.57732862234, 0.77303934097, 0.86017137766, 0.91446065903),
-    (0.66874998808, 0.85624998808, 0.76875001192, 0.95625001192),
-    (0.64803934097, 0.76482862234, 0.78946065903, 1.0476713181),
-    (0.57732862234, 0.83553934097, 0.86017137766, 0.97696065903),
-    (0.66874998808, 0.91874998808, 0.76875001192, 1.0187499523),
-    (0.64803934097, 0.82732862234, 0.78946065903, 1.1101713181),
-    (0.57732862234, 0.89803934097, 0.86017137766, 1.039460659),
-    (0.73124998808, -0.018750000745, 0.83125001192, 0.08124999702),
-    (0.71053934097, -0.11017136276, 0.85196065903, 0.17267136276),
-    (0.63982862234, -0.039460681379, 0.92267137766, 0.10196068138),
-    (0.73124998808, 0.043749999255, 0.83125001192, 0.14374999702),
-    (0.71053934097, -0.047671362758, 0.85196065903, 0.23517136276),
-    (0.63982862234, 0.023039318621, 0.92267137766, 0.16446068883),
-    (0.73124998808, 0.10625000298, 0.83125001192, 0.20624999702),
-    (0.71053934097, 0.014828637242, 0.85196065903, 0.29767137766),
-    (0.63982862234, 0.085539318621, 0.92267137766, 0.22696068883),
-    (0.73124998808, 0.16875000298, 0.83125001192, 0.26875001192),
-    (0.71053934097, 0.077328637242, 0.85196065903, 0.36017137766),
-    (0.63982862234, 0.14803931117, 0.92267137766, 0.28946068883),
-    (0.73124998808, 0.23125000298, 0.83125001192, 0.33125001192),
-    (0.71053934097, 0.13982863724, 0.85196065903, 0.42267137766),
-    (0.63982862234, 0.21053931117, 0.92267137766, 0.35196068883),
-    (0.73124998808, 0.29374998808, 0.83125001192, 0.39375001192),
-    (0.71053934097, 0.20232863724, 0.85196065903, 0.48517137766),
-    (0.63982862234, 0.27303931117, 0.92267137766, 0.41446068883),
-    (0.73124998808, 0.35624998808, 0.83125001192, 0.45625001192),
-    (0.71053934097, 0.26482862234, 0.85196065903, 0.54767137766),
-    (0.63982862234, 0.33553931117, 0.92267137766, 0.47696068883),
-    (0.73124998808, 0.41874998808, 0.83125001192, 0.51875001192),
-    (0.71053934097, 0.32732862234, 0.85196065903, 0.61017137766),
-    (0.63982862234, 0.39803931117, 0.92267137766, 0.53946065903),
-    (0.73124998808, 0.48124998808, 0.83125001192, 0.58125001192),
-    (0.71053934097, 0.38982862234, 0.85196065903, 0.67267137766),
-    (0.63982862234, 0.46053931117, 0.92267137766, 0.60196065903),
-    (0.73124998808, 0.54374998808, 0.83125001192, 0.64375001192),
-    (0.71053934097, 0.45232862234, 0.85196065903, 0.73517137766),
-    (0.63982862234, 0.52303934097, 0.92267137766, 0.66446065903),
-    (0.73124998808, 0.60624998808, 0.83125001192, 0.70625001192),
-    (0.71053934097, 0.51482862234, 0.85196065903, 0.79767137766),
-    (0.63982862234, 0.58553934097, 0.92267137766, 0.72696065903),
-    (0.73124998808, 0.66874998808, 0.83125001192, 0.76875001192),
-    (0.71053934097, 0.57732862234, 0.85196065903, 0.86017137766),
-    (0.63982862234, 0.64803934097, 0.92267137766, 0.78946065903),
-    (0.73124998808, 0.73124998808, 0.83125001192, 0.83125001192),
-    (0.71053934097, 0.63982862234, 0.85196065903, 0.92267137766),
-    (0.63982862234, 0.71053934097, 0.92267137766, 0.85196065903),
-    (0.73124998808, 0.79374998808, 0.83125001192, 0.89375001192),
-    (0.71053934097, 0.70232862234, 0.85196065903, 0.98517137766),
-    (0.63982862234, 0.77303934097, 0.92267137766, 0.91446065903),
-    (0.73124998808, 0.85624998808, 0.83125001192, 0.95625001192),
-    (0.71053934097, 0.76482862234, 0.85196065903, 1.0476713181),
-    (0.63982862234, 0.83553934097, 0.92267137766, 0.97696065903),
-    (0.73124998808, 0.91874998808, 0.83125001192, 1.0187499523),
-    (0.71053934097, 0.82732862234, 0.85196065903, 1.1101713181),
-    (0.63982862234, 0.89803934097, 0.92267137766, 1.039460659),
-    (0.79374998808, -0.018750000745, 0.89375001192, 0.08124999702),
-    (0.77303934097, -0.11017136276, 0.91446065903, 0.17267136276),
-    (0.70232862234, -0.039460681379, 0.98517137766, 0.10196068138),
-    (0.79374998808, 0.043749999255, 0.89375001192, 0.14374999702),
-    (0.77303934097, -0.047671362758, 0.91446065903, 0.23517136276),
-    (0.70232862234, 0.023039318621, 0.98517137766, 0.16446068883),
-    (0.79374998808, 0.10625000298, 0.89375001192, 0.20624999702),
-    (0.77303934097, 0.014828637242, 0.91446065903, 0.29767137766),
-    (0.70232862234, 0.085539318621, 0.98517137766, 0.22696068883),
-    (0.79374998808, 0.16875000298, 0.89375001192, 0.26875001192),
-    (0.77303934097, 0.077328637242, 0.91446065903, 0.36017137766),
-    (0.70232862234, 0.14803931117, 0.98517137766, 0.28946068883),
-    (0.79374998808, 0.23125000298, 0.89375001192, 0.33125001192),
-    (0.77303934097, 0.13982863724, 0.91446065903, 0.42267137766),
-    (0.70232862234, 0.21053931117, 0.98517137766, 0.35196068883),
-    (0.79374998808, 0.29374998808, 0.89375001192, 0.39375001192),
-    (0.77303934097, 0.20232863724, 0.91446065903, 0.48517137766),
-    (0.70232862234, 0.27303931117, 0.98517137766, 0.41446068883),
-    (0.79374998808, 0.35624998808, 0.89375001192, 0.45625001192),
-    (0.77303934097, 0.26482862234, 0.91446065903, 0.54767137766),
-    (0.70232862234, 0.33553931117, 0.98517137766, 0.47696068883),
-    (0.79374998808, 0.41874998808, 0.89375001192, 0.51875001192),
-    (0.77303934097, 0.32732862234, 0.91446065903, 0.61017137766),
-    (0.70232862234, 0.39803931117, 0.98517137766, 0.53946065903),
-    (0.79374998808, 0.48124998808, 0.89375001192, 0.58125001192),
-    (0.77303934097, 0.38982862234, 0.91446065903, 0.67267137766),
-    (0.70232862234, 0.46053931117, 0.98517137766, 0.60196065903),
-    (0.79374998808, 0.54374998808, 0.89375001192, 0.64375001192),
-    (0.77303934097, 0.45232862234, 0.91446065903, 0.73517137766),
-    (0.70232862234, 0.52303934097, 0.98517137766, 0.66446065903),
-    (0.79374998808, 0.60624998808, 0.89375001192, 0.70625001192),
-    (0.77303934097, 0.51482862234, 0.91446065903, 0.79767137766),
-    (0.70232862234, 0.58553934097, 0.98517137766, 0.72696065903),
-    (0.79374998808, 0.66874998808, 0.89375001192, 0.76875001192),
-    (0.77303934097, 0.57732862234, 0.91446065903, 0.86017137766),
-    (0.70232862234, 0.64803934097, 0.98517137766, 0.78946065903),
-    (0.79374998808, 0.73124998808, 0.89375001192, 0.83125001192),
-    (0.77303934097, 0.63982862234, 0.91446065903, 0.92267137766),
-    (0.70232862234, 0.71053934097, 0.98517137766, 0.85196065903),
-    (0.79374998808, 0.79374998808, 0.89375001192, 0.89375001192),
-    (0.77303934097, 0.70232862234, 0.91446065903, 0.98517137766),
-    (0.70232862234, 0.77303934097, 0.98517137766, 0.91446065903),
-    (0.79374998808, 0.85624998808, 0.89375001192, 0.95625001192),
-    (0.77303934097, 0.76482862234, 0.91446065903, 1.0476713181),
-    (0.70232862234, 0.83553934097, 0.98517137766, 0.97696065903),
-    (0.79374998808, 0.91874998808, 0.89375001192, 1.0187499523),
-    (0.77303934097, 0.82732862234, 0.91446065903, 1.1101713181),
-    (0.70232862234, 0.89803934097, 0.98517137766, 1.039460659),
-    (0.85624998808, -0.018750000745, 0.95625001192, 0.08124999702),
-    (0.83553934097, -0.11017136276, 0.97696065903, 0.17267136276),
-    (0.76482862234, -0.039460681379, 1.0476713181, 0.10196068138),
-    (0.85624998808, 0.043749999255, 0.95625001192, 0.14374999702),
-    (0.83553934097, -0.047671362758, 0.97696065903, 0.23517136276),
-    (0.76482862234, 0.023039318621, 1.0476713181, 0.16446068883),
-    (0.85624998808, 0.10625000298, 0.95625001192, 0.20624999702),
-    (0.83553934097, 0.014828637242, 0.97696065903, 0.29767137766),
-    (0.76482862234, 0.085539318621, 1.0476713181, 0.22696068883),
-    (0.85624998808, 0.16875000298, 0.95625001192, 0.26875001192),
-    (0.83553934097, 0.077328637242, 0.97696065903, 0.36017137766),
-    (0.76482862234, 0.14803931117, 1.0476713181, 0.28946068883),
-    (0.85624998808, 0.23125000298, 0.95625001192, 0.33125001192),
-    (0.83553934097, 0.13982863724, 0.97696065903, 0.42267137766),
-    (0.76482862234, 0.21053931117, 1.0476713181, 0.35196068883),
-    (0.85624998808, 0.29374998808, 0.95625001192, 0.39375001192),
-    (0.83553934097, 0.20232863724, 0.97696065903, 0.48517137766),
-    (0.76482862234, 0.27303931117, 1.0476713181, 0.41446068883),
-    (0.85624998808, 0.35624998808, 0.95625001192, 0.45625001192),
-    (0.83553934097, 0.26482862234, 0.97696065903, 0.54767137766),
-    (0.76482862234, 0.33553931117, 1.0476713181, 0.47696068883),
-    (0.85624998808, 0.41874998808, 0.95625001192, 0.51875001192),
-    (0.83553934097, 0.32732862234, 0.97696065903, 0.61017137766),
-    (0.76482862234, 0.39803931117, 1.0476713181, 0.53946065903),
-    (0.85624998808, 0.48124998808, 0.95625001192, 0.58125001192),
-    (0.83553934097, 0.38982862234, 0.97696065903, 0.67267137766),
-    (0.76482862234, 0.46053931117, 1.0476713181, 0.60196065903),
-    (0.85624998808, 0.54374998808, 0.95625001192, 0.64375001192),
-    (0.83553934097, 0.45232862234, 0.97696065903, 0.73517137766),
-    (0.76482862234, 0.52303934097, 1.0476713181, 0.66446065903),
-    (0.85624998808, 0.60624998808, 0.95625001192, 0.70625001192),
-    (0.83553934097, 0.51482862234, 0.97696065903, 0.79767137766),
-    (0.76482862234, 0.58553934097, 1.0476713181, 0.72696065903),
-    (0.85624998808, 0.66874998808, 0.95625001192, 0.76875001192),
-    (0.83553934097, 0.57732862234, 0.97696065903, 0.86017137766),
-    (0.76482862234, 0.64803934097, 1.0476713181, 0.78946065903),
-    (0.85624998808, 0.73124998808, 0.95625001192, 0.83125001192),
-    (0.83553934097, 0.63982862234, 0.97696065903, 0.92267137766),
-    (0.76482862234, 0.71053934097, 1.0476713181, 0.85196065903),
-    (0.85624998808, 0.79374998808, 0.95625001192, 0.89375001192),
-    (0.83553934097, 0.70232862234, 0.97696065903, 0.98517137766),
-    (0.76482862234, 0.77303934097, 1.0476713181, 0.91446065903),
-    (0.85624998808, 0.85624998808, 0.95625001192, 0.95625001192),
-    (0.83553934097, 0.76482862234, 0.97696065903, 1.0476713181),
-    (0.76482862234, 0.83553934097, 1.0476713181, 0.97696065903),
-    (0.85624998808, 0.91874998808, 0.95625001192, 1.0187499523),
-    (0.83553934097, 0.82732862234, 0.97696065903, 1.1101713181),
-    (0.76482862234, 0.89803934097, 1.0476713181, 1.039460659),
-    (0.91874998808, -0.018750000745, 1.0187499523, 0.08124999702),
-    (0.89803934097, -0.11017136276, 1.039460659, 0.17267136276),
-    (0.82732862234, -0.039460681379, 1.1101713181, 0.10196068138),
-    (0.91874998808, 0.043749999255, 1.0187499523, 0.14374999702),
-    (0.89803934097, -0.047671362758, 1.039460659, 0.23517136276),
-    (0.82732862234, 0.023039318621, 1.1101713181, 0.16446068883),
-    (0.91874998808, 0.10625000298, 1.0187499523, 0.20624999702),
-    (0.89803934097, 0.014828637242, 1.039460659, 0.29767137766),
-    (0.82732862234, 0.085539318621, 1.1101713181, 0.22696068883),
-    (0.91874998808, 0.16875000298, 1.0187499523, 0.26875001192),
-    (0.89803934097, 0.077328637242, 1.039460659, 0.36017137766),
-    (0.82732862234, 0.14803931117, 1.1101713181, 0.28946068883),
-    (0.91874998808, 0.23125000298, 1.0187499523, 0.33125001192),
-    (0.89803934097, 0.13982863724, 1.039460659, 0.42267137766),
-    (0.82732862234, 0.21053931117, 1.1101713181, 0.35196068883),
-    (0.91874998808, 0.29374998808, 1.0187499523, 0.39375001192),
-    (0.89803934097, 0.20232863724, 1.039460659, 0.48517137766),
-    (0.82732862234, 0.27303931117, 1.1101713181, 0.41446068883),
-    (0.91874998808, 0.35624998808, 1.0187499523, 0.45625001192),
-    (0.89803934097, 0.26482862234, 1.039460659, 0.54767137766),
-    (0.82732862234, 0.33553931117, 1.1101713181, 0.47696068883),
-    (0.91874998808, 0.41874998808, 1.0187499523, 0.51875001192),
-    (0.89803934097, 0.32732862234, 1.039460659, 0.61017137766),
-    (0.82732862234, 0.39803931117, 1.1101713181, 0.53946065903),
-    (0.91874998808, 0.48124998808, 1.0187499523, 0.58125001192),
-    (0.89803934097, 0.38982862234, 1.039460659, 0.67267137766),
-    (0.82732862234, 0.46053931117, 1.1101713181, 0.60196065903),
-    (0.91874998808, 0.54374998808, 1.0187499523, 0.64375001192),
-    (0.89803934097, 0.45232862234, 1.039460659, 0.73517137766),
-    (0.82732862234, 0.52303934097, 1.1101713181, 0.66446065903),
-    (0.91874998808, 0.60624998808, 1.0187499523, 0.70625001192),
-    (0.89803934097, 0.51482862234, 1.039460659, 0.79767137766),
-    (0.82732862234, 0.58553934097, 1.1101713181, 0.72696065903),
-    (0.91874998808, 0.66874998808, 1.0187499523, 0.76875001192),
-    (0.89803934097, 0.57732862234, 1.039460659, 0.86017137766),
-    (0.82732862234, 0.64803934097, 1.1101713181, 0.78946065903),
-    (0.91874998808, 0.73124998808, 1.0187499523, 0.83125001192),
-    (0.89803934097, 0.63982862234, 1.039460659, 0.92267137766),
-    (0.82732862234, 0.71053934097, 1.1101713181, 0.85196065903),
-    (0.91874998808, 0.79374998808, 1.0187499523, 0.89375001192),
-    (0.89803934097, 0.70232862234, 1.039460659, 0.98517137766),
-    (0.82732862234, 0.77303934097, 1.1101713181, 0.91446065903),
-    (0.91874998808, 0.85624998808, 1.0187499523, 0.95625001192),
-    (0.89803934097, 0.76482862234, 1.039460659, 1.0476713181),
-    (0.82732862234, 0.83553934097, 1.1101713181, 0.97696065903),
-    (0.91874998808, 0.91874998808, 1.0187499523, 1.0187499523),
-    (0.89803934097, 0.82732862234, 1.039460659, 1.1101713181),
-    (0.82732862234, 0.89803934097, 1.1101713181, 1.039460659),
-    (-0.13125000894, -0.13124997914, 0.25625002384, 0.25624996424),
-    (-0.074501946568, -0.21150383353, 0.19950194657, 0.33650383353),
-    (-0.21150389314, -0.074501916766, 0.33650389314, 0.19950191677),
-    (-0.049361616373, -0.27308481932, 0.17436161637, 0.39808481932),
-    (-0.27310159802, -0.049356020987, 0.39810159802, 0.17435601354),
-    (-0.17351509631, -0.17351509631, 0.29851508141, 0.29851508141),
-    (-0.13125000894, -0.0062499791384, 0.25625002384, 0.38124996424),
-    (-0.074501946568, -0.086503833532, 0.19950194657, 0.46150383353),
-    (-0.21150389314, 0.050498083234, 0.33650389314, 0.32450193167),
-    (-0.049361616373, -0.14808481932, 0.17436161637, 0.52308481932),
-    (-0.27310159802, 0.075643979013, 0.39810159802, 0.29935601354),
-    (-0.17351509631, -0.048515096307, 0.29851508141, 0.42351508141),
-    (-0.13125000894, 0.11875002086, 0.25625002384, 0.50624996424),
-    (-0.074501946568, 0.038496166468, 0.19950194657, 0.58650386333),
-    (-0.21150389314, 0.17549808323, 0.33650389314, 0.44950193167),
-    (-0.049361616373, -0.023084819317, 0.17436161637, 0.64808481932),
-    (-0.27310159802, 0.20064398646, 0.39810159802, 0.42435601354),
-    (-0.17351509631, 0.076484903693, 0.29851508141, 0.54851508141),
-    (-0.13125000894, 0.24375002086, 0.25625002384, 0.63124996424),
-    (-0.074501946568, 0.16349616647, 0.19950194657, 0.71150386333),
-    (-0.21150389314, 0.30049806833, 0.33650389314, 0.57450193167),
-    (-0.049361616373, 0.10191518068, 0.17436161637, 0.77308481932),
-    (-0.27310159802, 0.32564398646, 0.39810159802, 0.54935604334),
-    (-0.17351509631, 0.20148490369, 0.29851508141, 0.67351508141),
-    (-0.13125000894, 0.36875003576, 0.25625002384, 0.75624996424),
-    (-0.074501946568, 0.28849616647, 0.19950194657, 0.83650386333),
-    (-0.21150389314, 0.42549806833, 0.33650389314, 0.69950193167),
-    (-0.049361616373, 0.22691518068, 0.17436161637, 0.89808481932),
-    (-0.27310159802, 0.45064398646, 0.39810159802, 0.67435604334),
-    (-0.17351509631, 0.32648491859, 0.29851508141, 0.79851508141),
-    (-0.13125000894, 0.49375003576, 0.25625002384, 0.88124996424),
-    (-0.074501946568, 0.41349616647, 0.19950194657, 0.96150386333),
-    (-0.21150389314, 0.55049806833, 0.33650389314, 0.82450193167),
-    (-0.049361616373, 0.35191518068, 0.17436161637, 1.0230848789),
-    (-0.27310159802, 0.57564395666, 0.39810159802, 0.79935604334),
-    (-0.17351509631, 0.45148491859, 0.29851508141, 0.92351508141),
-    (-0.13125000894, 0.61875003576, 0.25625002384, 1.0062500238),
-    (-0.074501946568, 0.53849613667, 0.19950194657, 1.0865038633),
-    (-0.21150389314, 0.67549806833, 0.33650389314, 0.94950193167),
-    (-0.049361616373, 0.47691518068, 0.17436161637, 1.1480848789),
-    (-0.27310159802, 0.70064395666, 0.39810159802, 0.92435604334),
-    (-0.17351509631, 0.57648491859, 0.29851508141, 1.0485150814),
-    (-0.13125000894, 0.74375003576, 0.25625002384, 1.1312500238),
-    (-0.074501946568, 0.66349613667, 0.19950194657, 1.2115038633),
-    (-0.21150389314, 0.80049806833, 0.33650389314, 1.0745018721),
-    (-0.049361616373, 0.60191518068, 0.17436161637, 1.2730848789),
-    (-0.27310159802, 0.82564395666, 0.39810159802, 1.0493559837),
-    (-0.17351509631, 0.70148491859, 0.29851508141, 1.1735150814),
-    (-0.0062500089407, -0.13124997914, 0.38125002384, 0.25624996424),
-    (0.050498053432, -0.21150383353, 0.32450193167, 0.33650383353),
-    (-0.086503893137, -0.074501916766, 0.46150389314, 0.19950191677),
-    (0.075638383627, -0.27308481932, 0.29936161637, 0.39808481932),
-    (-0.14810159802, -0.049356020987, 0.52310156822, 0.17435601354),
-    (-0.048515096307, -0.17351509631, 0.42351508141, 0.29851508141),
-    (-0.0062500089407, -0.0062499791384, 0.38125002384, 0.38124996424),
-    (0.050498053432, -0.086503833532, 0.32450193167, 0.46150383353),
-    (-0.086503893137, 0.050498083234, 0.46150389314, 0.32450193167),
-    (0.075638383627, -0.14808481932, 0.29936161637, 0.52308481932),
-    (-0.14810159802, 0.075643979013, 0.52310156822, 0.29935601354),
-    (-0.048515096307, -0.048515096307, 0.42351508141, 0.42351508141),
-    (-0.0062500089407, 0.11875002086, 0.38125002384, 0.50624996424),
-    (0.050498053432, 0.038496166468, 0.32450193167, 0.58650386333),
-    (-0.086503893137, 0.17549808323, 0.46150389314, 0.44950193167),
-    (0.075638383627, -0.023084819317, 0.29936161637, 0.64808481932),
-    (-0.14810159802, 0.20064398646, 0.52310156822, 0.42435601354),
-    (-0.048515096307, 0.076484903693, 0.42351508141, 0.54851508141),
-    (-0.0062500089407, 0.24375002086, 0.38125002384, 0.63124996424),
-    (0.050498053432, 0.16349616647, 0.32450193167, 0.71150386333),
-    (-0.086503893137, 0.30049806833, 0.46150389314, 0.57450193167),
-    (0.075638383627, 0.10191518068, 0.29936161637, 0.77308481932),
-    (-0.14810159802, 0.32564398646, 0.52310156822, 0.54935604334),
-    (-0.048515096307, 0.20148490369, 0.42351508141, 0.67351508141),
-    (-0.0062500089407, 0.36875003576, 0.38125002384, 0.75624996424),
-    (0.050498053432, 0.28849616647, 0.32450193167, 0.83650386333),
-    (-0.086503893137, 0.42549806833, 0.46150389314, 0.69950193167),
-    (0.075638383627, 0.22691518068, 0.29936161637, 0.89808481932),
-    (-0.14810159802, 0.45064398646, 0.52310156822, 0.67435604334),
-    (-0.048515096307, 0.32648491859, 0.42351508141, 0.79851508141),
-    (-0.0062500089407, 0.49375003576, 0.38125002384, 0.88124996424),
-    (0.050498053432, 0.41349616647, 0.32450193167, 0.96150386333),
-    (-0.086503893137, 0.55049806833, 0.46150389314, 0.82450193167),
-    (0.075638383627, 0.35191518068, 0.29936161637, 1.0230848789),
-    (-0.14810159802, 0.57564395666, 0.52310156822, 0.79935604334),
-    (-0.048515096307, 0.45148491859, 0.42351508141, 0.92351508141),
-    (-0.0062500089407, 0.61875003576, 0.38125002384, 1.0062500238),
-    (0.050498053432, 0.53849613667, 0.32450193167, 1.0865038633),
-    (-0.086503893137, 0.67549806833, 0.46150389314, 0.94950193167),
-    (0.075638383627, 0.47691518068, 0.29936161637, 1.1480848789),
-    (-0.14810159802, 0.70064395666, 0.52310156822, 0.92435604334),
-    (-0.048515096307, 0.57648491859, 0.42351508141, 1.0485150814),
-    (-0.0062500089407, 0.74375003576, 0.38125002384, 1.1312500238),
-    (0.050498053432, 0.66349613667, 0.32450193167, 1.2115038633),
-    (-0.086503893137, 0.80049806833, 0.46150389314, 1.0745018721),
-    (0.075638383627, 0.60191518068, 0.29936161637, 1.2730848789),
-    (-0.14810159802, 0.82564395666, 0.52310156822, 1.0493559837),
-    (-0.048515096307, 0.70148491859, 0.42351508141, 1.1735150814),
-    (0.11874999106, -0.13124997914, 0.50625002384, 0.25624996424),
-    (0.17549805343, -0.21150383353, 0.44950193167, 0.33650383353),
-    (0.038496106863, -0.074501916766, 0.58650386333, 0.19950191677),
-    (0.20063838363, -0.27308481932, 0.42436161637, 0.39808481932),
-    (-0.023101598024, -0.049356020987, 0.64810156822, 0.17435601354),
-    (0.076484903693, -0.17351509631, 0.54851508141, 0.29851508141),
-    (0.11874999106, -0.0062499791384, 0.50625002384, 0.38124996424),
-    (0.17549805343, -0.086503833532, 0.44950193167, 0.46150383353),
-    (0.038496106863, 0.050498083234, 0.58650386333, 0.32450193167),
-    (0.20063838363, -0.14808481932, 0.42436161637, 0.52308481932),
-    (-0.023101598024, 0.075643979013, 0.64810156822, 0.29935601354),
-    (0.076484903693, -0.048515096307, 0.54851508141, 0.42351508141),
-    (0.11874999106, 0.11875002086, 0.50625002384, 0.50624996424),
-    (0.17549805343, 0.038496166468, 0.44950193167, 0.58650386333),
-    (0.038496106863, 0.17549808323, 0.58650386333, 0.44950193167),
-    (0.20063838363, -0.023084819317, 0.42436161637, 0.64808481932),
-    (-0.023101598024, 0.20064398646, 0.64810156822, 0.42435601354),
-    (0.076484903693, 0.076484903693, 0.54851508141, 0.54851508141),
-    (0.11874999106, 0.24375002086, 0.50625002384, 0.63124996424),
-    (0.17549805343, 0.16349616647, 0.44950193167, 0.71150386333),
-    (0.038496106863, 0.30049806833, 0.58650386333, 0.57450193167),
-    (0.20063838363, 0.10191518068, 0.42436161637, 0.77308481932),
-    (-0.023101598024, 0.32564398646, 0.64810156822, 0.54935604334),
-    (0.076484903693, 0.20148490369, 0.54851508141, 0.67351508141),
-    (0.11874999106, 0.36875003576, 0.50625002384, 0.75624996424),
-    (0.17549805343, 0.28849616647, 0.44950193167, 0.83650386333),
-    (0.038496106863, 0.42549806833, 0.58650386333, 0.69950193167),
-    (0.20063838363, 0.22691518068, 0.42436161637, 0.89808481932),
-    (-0.023101598024, 0.45064398646, 0.64810156822, 0.67435604334),
-    (0.076484903693, 0.32648491859, 0.54851508141, 0.79851508141),
-    (0.11874999106, 0.49375003576, 0.50625002384, 0.88124996424),
-    (0.17549805343, 0.41349616647, 0.44950193167, 0.96150386333),
-    (0.038496106863, 0.55049806833, 0.58650386333, 0.82450193167),
-    (0.20063838363, 0.35191518068, 0.42436161637, 1.0230848789),
-    (-0.023101598024, 0.57564395666, 0.64810156822, 0.79935604334),
-    (0.076484903693, 0.45148491859, 0.54851508141, 0.92351508141),
-    (0.11874999106, 0.61875003576, 0.50625002384, 1.0062500238),
-    (0.17549805343, 0.53849613667, 0.44950193167, 1.0865038633),
-    (0.038496106863, 0.67549806833, 0.58650386333, 0.94950193167),
-    (0.20063838363, 0.47691518068, 0.42436161637, 1.1480848789),
-    (-0.023101598024, 0.70064395666, 0.64810156822, 0.92435604334),
-    (0.076484903693, 0.57648491859, 0.54851508141, 1.0485150814),
-    (0.11874999106, 0.74375003576, 0.50625002384, 1.1312500238),
-    (0.17549805343, 0.66349613667, 0.44950193167, 1.2115038633),
-    (0.038496106863, 0.80049806833, 0.58650386333, 1.0745018721),
-    (0.20063838363, 0.60191518068, 0.42436161637, 1.2730848789),
-    (-0.023101598024, 0.82564395666, 0.64810156822, 1.0493559837),
-    (0.076484903693, 0.70148491859, 0.54851508141, 1.1735150814),
-    (0.24374999106, -0.13124997914, 0.63125002384, 0.25624996424),
-    (0.30049806833, -0.21150383353, 0.57450193167, 0.33650383353),
-    (0.16349610686, -0.074501916766, 0.71150386333, 0.19950191677),
-    (0.32563838363, -0.27308481932, 0.54936158657, 0.39808481932),
-    (0.10189840198, -0.049356020987, 0.77310156822, 0.17435601354),
-    (0.20148490369, -0.17351509631, 0.67351508141, 0.29851508141),
-    (0.24374999106, -0.0062499791384, 0.63125002384, 0.38124996424),
-    (0.30049806833, -0.086503833532, 0.57450193167, 0.46150383353),
-    (0.16349610686, 0.050498083234, 0.71150386333, 0.32450193167),
-    (0.32563838363, -0.14808481932, 0.54936158657, 0.52308481932),
-    (0.10189840198, 0.075643979013, 0.77310156822, 0.29935601354),
-    (0.20148490369, -0.048515096307, 0.67351508141, 0.42351508141),
-    (0.24374999106, 0.11875002086, 0.63125002384, 0.50624996424),
-    (0.30049806833, 0.038496166468, 0.57450193167, 0.58650386333),
-    (0.16349610686, 0.17549808323, 0.71150386333, 0.44950193167),
-    (0.32563838363, -0.023084819317, 0.54936158657, 0.64808481932),
-    (0.10189840198, 0.20064398646, 0.77310156822, 0.42435601354),
-    (0.20148490369, 0.076484903693, 0.67351508141, 0.54851508141),
-    (0.24374999106, 0.24375002086, 0.63125002384, 0.63124996424),
-    (0.30049806833, 0.16349616647, 0.57450193167, 0.71150386333),
-    (0.16349610686, 0.30049806833, 0.71150386333, 0.57450193167),
-    (0.32563838363, 0.10191518068, 0.54936158657, 0.77308481932),
-    (0.10189840198, 0.32564398646, 0.77310156822, 0.54935604334),
-    (0.20148490369, 0.20148490369, 0.67351508141, 0.67351508141),
-    (0.24374999106, 0.36875003576, 0.63125002384, 0.75624996424),
-    (0.30049806833, 0.28849616647, 0.57450193167, 0.83650386333),
-    (0.16349610686, 0.42549806833, 0.71150386333, 0.69950193167),
-    (0.32563838363, 0.22691518068, 0.54936158657, 0.89808481932),
-    (0.10189840198, 0.45064398646, 0.77310156822, 0.67435604334),
-    (0.20148490369, 0.32648491859, 0.67351508141, 0.79851508141),
-    (0.24374999106, 0.49375003576, 0.63125002384, 0.88124996424),
-    (0.30049806833, 0.41349616647, 0.57450193167, 0.96150386333),
-    (0.16349610686, 0.55049806833, 0.71150386333, 0.82450193167),
-    (0.32563838363, 0.35191518068, 0.54936158657, 1.0230848789),
-    (0.10189840198, 0.57564395666, 0.77310156822, 0.79935604334),
-    (0.20148490369, 0.45148491859, 0.67351508141, 0.92351508141),
-    (0.24374999106, 0.61875003576, 0.63125002384, 1.0062500238),
-    (0.30049806833, 0.53849613667, 0.57450193167, 1.0865038633),
-    (0.16349610686, 0.67549806833, 0.71150386333, 0.94950193167),
-    (0.32563838363, 0.47691518068, 0.54936158657, 1.1480848789),
-    (0.10189840198, 0.70064395666, 0.77310156822, 0.92435604334),
-    (0.20148490369, 0.57648491859, 0.67351508141, 1.0485150814),
-    (0.24374999106, 0.74375003576, 0.63125002384, 1.1312500238),
-    (0.30049806833, 0.66349613667, 0.57450193167, 1.2115038633),
-    (0.16349610686, 0.80049806833, 0.71150386333, 1.0745018721),
-    (0.32563838363, 0.60191518068, 0.54936158657, 1.2730848789),
-    (0.10189840198, 0.82564395666, 0.77310156822, 1.0493559837),
-    (0.20148490369, 0.70148491859, 0.67351508141, 1.1735150814),
-    (0.36874997616, -0.13124997914, 0.75625002384, 0.25624996424),
-    (0.42549806833, -0.21150383353, 0.69950193167, 0.33650383353),
-    (0.28849610686, -0.074501916766, 0.83650386333, 0.19950191677),
-    (0.45063838363, -0.27308481932, 0.67436158657, 0.39808481932),
-    (0.22689840198, -0.049356020987, 0.89810156822, 0.17435601354),
-    (0.32648491859, -0.17351509631, 0.79851508141, 0.29851508141),
-    (0.36874997616, -0.0062499791384, 0.75625002384, 0.38124996424),
-    (0.42549806833, -0.086503833532, 0.69950193167, 0.46150383353),
-    (0.28849610686, 0.050498083234, 0.83650386333, 0.32450193167),
-    (0.45063838363, -0.14808481932, 0.67436158657, 0.52308481932),
-    (0.22689840198, 0.075643979013, 0.89810156822, 0.29935601354),
-    (0.32648491859, -0.048515096307, 0.79851508141, 0.42351508141),
-    (0.36874997616, 0.11875002086, 0.75625002384, 0.50624996424),
-    (0.42549806833, 0.038496166468, 0.69950193167, 0.58650386333),
-    (0.28849610686, 0.17549808323, 0.83650386333, 0.44950193167),
-    (0.45063838363, -0.023084819317, 0.67436158657, 0.64808481932),
-    (0.22689840198, 0.20064398646, 0.89810156822, 0.42435601354),
-    (0.32648491859, 0.076484903693, 0.79851508141, 0.54851508141),
-    (0.36874997616, 0.24375002086, 0.75625002384, 0.63124996424),
-    (0.42549806833, 0.16349616647, 0.69950193167, 0.71150386333),
-    (0.28849610686, 0.30049806833, 0.83650386333, 0.57450193167),
-    (0.45063838363, 0.10191518068, 0.67436158657, 0.77308481932),
-    (0.22689840198, 0.32564398646, 0.89810156822, 0.54935604334),
-    (0.32648491859, 0.20148490369, 0.79851508141, 0.67351508141),
-    (0.36874997616, 0.36875003576, 0.75625002384, 0.75624996424),
-    (0.42549806833, 0.28849616647, 0.69950193167, 0.83650386333),
-    (0.28849610686, 0.42549806833, 0.83650386333, 0.69950193167),
-    (0.45063838363, 0.22691518068, 0.67436158657, 0.89808481932),
-    (0.22689840198, 0.45064398646, 0.89810156822, 0.67435604334),
-    (0.32648491859, 0.32648491859, 0.79851508141, 0.79851508141),
-    (0.36874997616, 0.49375003576, 0.75625002384, 0.88124996424),
-    (0.42549806833, 0.41349616647, 0.69950193167, 0.96150386333),
-    (0.28849610686, 0.55049806833, 0.83650386333, 0.82450193167),
-    (0.45063838363, 0.35191518068, 0.67436158657, 1.0230848789),
-    (0.22689840198, 0.57564395666, 0.89810156822, 0.79935604334),
-    (0.32648491859, 0.45148491859, 0.79851508141, 0.92351508141),
-    (0.36874997616, 0.61875003576, 0.75625002384, 1.0062500238),
-    (0.42549806833, 0.53849613667, 0.69950193167, 1.0865038633),
-    (0.28849610686, 0.67549806833, 0.83650386333, 0.94950193167),
-    (0.45063838363, 0.47691518068, 0.67436158657, 1.1480848789),
-    (0.22689840198, 0.70064395666, 0.89810156822, 0.92435604334),
-    (0.32648491859, 0.57648491859, 0.79851508141, 1.0485150814),
-    (0.36874997616, 0.74375003576, 0.75625002384, 1.1312500238),
-    (0.42549806833, 0.66349613667, 0.69950193167, 1.2115038633),
-    (0.28849610686, 0.80049806833, 0.83650386333, 1.0745018721),
-    (0.45063838363, 0.60191518068, 0.67436158657, 1.2730848789),
-    (0.22689840198, 0.82564395666, 0.89810156822, 1.0493559837),
-    (0.32648491859, 0.70148491859, 0.79851508141, 1.1735150814),
-    (0.49374997616, -0.13124997914, 0.88125002384, 0.25624996424),
-    (0.55049806833, -0.21150383353, 0.82450193167, 0.33650383353),
-    (0.41349610686, -0.074501916766, 0.96150386333, 0.19950191677),
-    (0.57563841343, -0.27308481932, 0.79936158657, 0.39808481932),
-    (0.35189840198, -0.049356020987, 1.0231015682, 0.17435601354),
-    (0.45148491859, -0.17351509631, 0.92351508141, 0.29851508141),
-    (0.49374997616, -0.0062499791384, 0.88125002384, 0.38124996424),
-    (0.55049806833, -0.086503833532, 0.82450193167, 0.46150383353),
-    (0.41349610686, 0.050498083234, 0.96150386333, 0.32450193167),
-    (0.57563841343, -0.14808481932, 0.79936158657, 0.52308481932),
-    (0.35189840198, 0.075643979013, 1.0231015682, 0.29935601354),
-    (0.45148491859, -0.048515096307, 0.92351508141, 0.42351508141),
-    (0.49374997616, 0.11875002086, 0.88125002384, 0.50624996424),
-    (0.55049806833, 0.038496166468, 0.82450193167, 0.58650386333),
-    (0.41349610686, 0.17549808323, 0.96150386333, 0.44950193167),
-    (0.57563841343, -0.023084819317, 0.79936158657, 0.64808481932),
-    (0.35189840198, 0.20064398646, 1.0231015682, 0.42435601354),
-    (0.45148491859, 0.076484903693, 0.92351508141, 0.54851508141),
-    (0.49374997616, 0.24375002086, 0.88125002384, 0.63124996424),
-    (0.55049806833, 0.16349616647, 0.82450193167, 0.71150386333),
-    (0.41349610686, 0.30049806833, 0.96150386333, 0.57450193167),
-    (0.57563841343, 0.10191518068, 0.79936158657, 0.77308481932),
-    (0.35189840198, 0.32564398646, 1.0231015682, 0.54935604334),
-    (0.45148491859, 0.20148490369, 0.92351508141, 0.67351508141),
-    (0.49374997616, 0.36875003576, 0.88125002384, 0.75624996424),
-    (0.55049806833, 0.28849616647, 0.82450193167, 0.83650386333),
-    (0.41349610686, 0.42549806833, 0.96150386333, 0.69950193167),
-    (0.57563841343, 0.22691518068, 0.79936158657, 0.89808481932),
-    (0.35189840198, 0.45064398646, 1.0231015682, 0.67435604334),
-    (0.45148491859, 0.32648491859, 0.92351508141, 0.79851508141),
-    (0.49374997616, 0.49375003576, 0.88125002384, 0.88124996424),
-    (0.55049806833, 0.41349616647, 0.82450193167, 0.96150386333),
-    (0.41349610686, 0.55049806833, 0.96150386333, 0.82450193167),
-    (0.57563841343, 0.35191518068, 0.79936158657, 1.0230848789),
-    (0.35189840198, 0.57564395666, 1.0231015682, 0.79935604334),
-    (0.45148491859, 0.45148491859, 0.92351508141, 0.92351508141),
-    (0.49374997616, 0.61875003576, 0.88125002384, 1.0062500238),
-    (0.55049806833, 0.53849613667, 0.82450193167, 1.0865038633),
-    (0.41349610686, 0.67549806833, 0.96150386333, 0.94950193167),
-    (0.57563841343, 0.47691518068, 0.79936158657, 1.1480848789),
-    (0.35189840198, 0.70064395666, 1.0231015682, 0.92435604334),
-    (0.45148491859, 0.57648491859, 0.92351508141, 1.0485150814),
-    (0.49374997616, 0.74375003576, 0.88125002384, 1.1312500238),
-    (0.55049806833, 0.66349613667, 0.82450193167, 1.2115038633),
-    (0.41349610686, 0.80049806833, 0.96150386333, 1.0745018721),
-    (0.57563841343, 0.60191518068, 0.79936158657, 1.2730848789),
-    (0.35189840198, 0.82564395666, 1.0231015682, 1.0493559837),
-    (0.45148491859, 0.70148491859, 0.92351508141, 1.1735150814),
-    (0.61874997616, -0.13124997914, 1.0062500238, 0.25624996424),
-    (0.67549806833, -0.21150383353, 0.94950193167, 0.33650383353),
-    (0.53849613667, -0.074501916766, 1.0865038633, 0.19950191677),
-    (0.70063841343, -0.27308481932, 0.92436158657, 0.39808481932),
-    (0.47689840198, -0.049356020987, 1.1481015682, 0.17435601354),
-    (0.57648491859, -0.17351509631, 1.0485150814, 0.29851508141),
-    (0.61874997616, -0.0062499791384, 1.0062500238, 0.38124996424),
-    (0.67549806833, -0.086503833532, 0.94950193167, 0.46150383353),
-    (0.53849613667, 0.050498083234, 1.0865038633, 0.32450193167),
-    (0.70063841343, -0.14808481932, 0.92436158657, 0.52308481932),
-    (0.47689840198, 0.075643979013, 1.1481015682, 0.29935601354),
-    (0.57648491859, -0.048515096307, 1.0485150814, 0.42351508141),
-    (0.61874997616, 0.11875002086, 1.0062500238, 0.50624996424),
-    (0.67549806833, 0.038496166468, 0.94950193167, 0.58650386333),
-    (0.53849613667, 0.17549808323, 1.0865038633, 0.44950193167),
-    (0.70063841343, -0.023084819317, 0.92436158657, 0.64808481932),
-    (0.47689840198, 0.20064398646, 1.1481015682, 0.42435601354),
-    (0.57648491859, 0.076484903693, 1.0485150814, 0.54851508141),
-    (0.61874997616, 0.24375002086, 1.0062500238, 0.63124996424),
-    (0.67549806833, 0.16349616647, 0.94950193167, 0.71150386333),
-    (0.53849613667, 0.30049806833, 1.0865038633, 0.57450193167),
-    (0.70063841343, 0.10191518068, 0.92436158657, 0.77308481932),
-    (0.47689840198, 0.32564398646, 1.1481015682, 0.54935604334),
-    (0.57648491859, 0.20148490369, 1.0485150814, 0.67351508141),
-    (0.61874997616, 0.36875003576, 1.0062500238, 0.75624996424),
-    (0.67549806833, 0.28849616647, 0.94950193167, 0.83650386333),
-    (0.53849613667, 0.42549806833, 1.0865038633, 0.69950193167),
-    (0.70063841343, 0.22691518068, 0.92436158657, 0.89808481932),
-    (0.47689840198, 0.45064398646, 1.1481015682, 0.67435604334),
-    (0.57648491859, 0.32648491859, 1.0485150814, 0.79851508141),
-    (0.61874997616, 0.49375003576, 1.0062500238, 0.88124996424),
-    (0.67549806833, 0.41349616647, 0.94950193167, 0.96150386333),
-    (0.53849613667, 0.55049806833, 1.0865038633, 0.82450193167),
-    (0.70063841343, 0.35191518068, 0.92436158657, 1.0230848789),
-    (0.47689840198, 0.57564395666, 1.1481015682, 0.79935604334),
-    (0.57648491859, 0.45148491859, 1.0485150814, 0.92351508141),
-    (0.61874997616, 0.61875003576, 1.0062500238, 1.0062500238),
-    (0.67549806833, 0.53849613667, 0.94950193167, 1.0865038633),
-    (0.53849613667, 0.67549806833, 1.0865038633, 0.94950193167),
-    (0.70063841343, 0.47691518068, 0.92436158657, 1.1480848789),
-    (0.47689840198, 0.70064395666, 1.1481015682, 0.92435604334),
-    (0.57648491859, 0.57648491859, 1.0485150814, 1.0485150814),
-    (0.61874997616, 0.74375003576, 1.0062500238, 1.1312500238),
-    (0.67549806833, 0.66349613667, 0.94950193167, 1.2115038633),
-    (0.53849613667, 0.80049806833, 1.0865038633, 1.0745018721),
-    (0.70063841343, 0.60191518068, 0.92436158657, 1.2730848789),
-    (0.47689840198, 0.82564395666, 1.1481015682, 1.0493559837),
-    (0.57648491859, 0.70148491859, 1.0485150814, 1.1735150814),
-    (0.74374997616, -0.13124997914, 1.1312500238, 0.25624996424),
-    (0.80049806833, -0.21150383353, 1.0745019913, 0.33650383353),
-    (0.66349613667, -0.074501916766, 1.2115038633, 0.19950191677),
-    (0.82563841343, -0.27308481932, 1.0493615866, 0.39808481932),
-    (0.60189843178, -0.049356020987, 1.2731015682, 0.17435601354),
-    (0.70148491859, -0.17351509631, 1.1735150814, 0.29851508141),
-    (0.74374997616, -0.0062499791384, 1.1312500238, 0.38124996424),
-    (0.80049806833, -0.086503833532, 1.0745019913, 0.46150383353),
-    (0.66349613667, 0.050498083234, 1.2115038633, 0.32450193167),
-    (0.82563841343, -0.14808481932, 1.0493615866, 0.52308481932),
-    (0.60189843178, 0.075643979013, 1.2731015682, 0.29935601354),
-    (0.70148491859, -0.048515096307, 1.1735150814, 0.42351508141),
-    (0.74374997616, 0.11875002086, 1.1312500238, 0.50624996424),
-    (0.80049806833, 0.038496166468, 1.0745019913, 0.58650386333),
-    (0.66349613667, 0.17549808323, 1.2115038633, 0.44950193167),
-    (0.82563841343, -0.023084819317, 1.0493615866, 0.64808481932),
-    (0.60189843178, 0.20064398646, 1.2731015682, 0.42435601354),
-    (0.70148491859, 0.076484903693, 1.1735150814, 0.54851508141),
-    (0.74374997616, 0.24375002086, 1.1312500238, 0.63124996424),
-    (0.80049806833, 0.16349616647, 1.0745019913, 0.71150386333),
-    (0.66349613667, 0.30049806833, 1.2115038633, 0.57450193167),
-    (0.82563841343, 0.10191518068, 1.0493615866, 0.77308481932),
-    (0.60189843178, 0.32564398646, 1.2731015682, 0.54935604334),
-    (0.70148491859, 0.20148490369, 1.1735150814, 0.67351508141),
-    (0.74374997616, 0.36875003576, 1.1312500238, 0.75624996424),
-    (0.80049806833, 0.28849616647, 1.0745019913, 0.83650386333),
-    (0.66349613667, 0.42549806833, 1.2115038633, 0.69950193167),
-    (0.82563841343, 0.22691518068, 1.0493615866, 0.89808481932),
-    (0.60189843178, 0.45064398646, 1.2731015682, 0.67435604334),
-    (0.70148491859, 0.32648491859, 1.1735150814, 0.79851508141),
-    (0.74374997616, 0.49375003576, 1.1312500238, 0.88124996424),
-    (0.80049806833, 0.41349616647, 1.0745019913, 0.96150386333),
-    (0.66349613667, 0.55049806833, 1.2115038633, 0.82450193167),
-    (0.82563841343, 0.35191518068, 1.0493615866, 1.0230848789),
-    (0.60189843178, 0.57564395666, 1.2731015682, 0.79935604334),
-    (0.70148491859, 0.45148491859, 1.1735150814, 0.92351508141),
-    (0.74374997616, 0.61875003576, 1.1312500238, 1.0062500238),
-    (0.80049806833, 0.53849613667, 1.0745019913, 1.0865038633),
-    (0.66349613667, 0.67549806833, 1.2115038633, 0.94950193167),
-    (0.82563841343, 0.47691518068, 1.0493615866, 1.1480848789),
-    (0.60189843178, 0.70064395666, 1.2731015682, 0.92435604334),
-    (0.70148491859, 0.57648491859, 1.1735150814, 1.0485150814),
-    (0.74374997616, 0.74375003576, 1.1312500238, 1.1312500238),
-    (0.80049806833, 0.66349613667, 1.0745019913, 1.2115038633),
-    (0.66349613667, 0.80049806833, 1.2115038633, 1.0745018721),
-    (0.82563841343, 0.60191518068, 1.0493615866, 1.2730848789),
-    (0.60189843178, 0.82564395666, 1.2731015682, 1.0493559837),
-    (0.70148491859, 0.70148491859, 1.1735150814, 1.1735150814),
-    (-0.16250002384, -0.16249996424, 0.41250002384, 0.41249996424),
-    (-0.078293219209, -0.28158634901, 0.32829320431, 0.53158634901),
-    (-0.28158643842, -0.078293174505, 0.53158640862, 0.32829317451),
-    (-0.040988206863, -0.37296459079, 0.29098820686, 0.62296462059),
-    (-0.37298947573, -0.040979906917, 0.62298947573, 0.29097992182),
-    (-0.20607307553, -0.20607307553, 0.45607307553, 0.45607307553),
-    (-0.16250002384, 0.087500035763, 0.41250002384, 0.66249996424),
-    (-0.078293219209, -0.03158634901, 0.32829320431, 0.78158634901),
-    (-0.28158643842, 0.17170682549, 0.53158640862, 0.57829320431),
-    (-0.040988206863, -0.12296459079, 0.29098820686, 0.87296462059),
-    (-0.37298947573, 0.20902009308, 0.62298947573, 0.54097992182),
-    (-0.20607307553, 0.043926924467, 0.45607307553, 0.70607304573),
-    (-0.16250002384, 0.33750003576, 0.41250002384, 0.91249996424),
-    (-0.078293219209, 0.21841365099, 0.32829320431, 1.0315864086),
-    (-0.28158643842, 0.42170682549, 0.53158640862, 0.82829320431),
-    (-0.040988206863, 0.12703540921, 0.29098820686, 1.1229646206),
-    (-0.37298947573, 0.45902007818, 0.62298947573, 0.79097992182),
-    (-0.20607307553, 0.29392692447, 0.45607307553, 0.95607304573),
-    (-0.16250002384, 0.58750003576, 0.41250002384, 1.1624999046),
-    (-0.078293219209, 0.46841365099, 0.32829320431, 1.2815864086),
-    (-0.28158643842, 0.67170679569, 0.53158640862, 1.0782932043),
-    (-0.040988206863, 0.37703540921, 0.29098820686, 1.3729646206),
-    (-0.37298947573, 0.70902007818, 0.62298947573, 1.0409798622),
-    (-0.20607307553, 0.54392695427, 0.45607307553, 1.2060730457),
-    (0.087499976158, -0.16249996424, 0.66250002384, 0.41249996424),
-    (0.17170678079, -0.28158634901, 0.57829320431, 0.53158634901),
-    (-0.031586438417, -0.078293174505, 0.78158640862, 0.32829317451),
-    (0.20901179314, -0.37296459079, 0.54098820686, 0.62296462059),
-    (-0.12298947573, -0.040979906917, 0.87298947573, 0.29097992182),
-    (0.043926924467, -0.20607307553, 0.70607304573, 0.45607307553),
-    (0.087499976158, 0.087500035763, 0.66250002384, 0.66249996424),
-    (0.17170678079, -0.03158634901, 0.57829320431, 0.78158634901),
-    (-0.031586438417, 0.17170682549, 0.78158640862, 0.57829320431),
-    (0.20901179314, -0.12296459079, 0.54098820686, 0.87296462059),
-    (-0.12298947573, 0.20902009308, 0.87298947573, 0.54097992182),
-    (0.043926924467, 0.043926924467, 0.70607304573, 0.70607304573),
-    (0.087499976158, 0.33750003576, 0.66250002384, 0.91249996424),
-    (0.17170678079, 0.21841365099, 0.57829320431, 1.0315864086),
-    (-0.031586438417, 0.42170682549, 0.78158640862, 0.82829320431),
-    (0.20901179314, 0.12703540921, 0.54098820686, 1.1229646206),
-    (-0.12298947573, 0.45902007818, 0.87298947573, 0.79097992182),
-    (0.043926924467, 0.29392692447, 0.70607304573, 0.95607304573),
-    (0.087499976158, 0.58750003576, 0.66250002384, 1.1624999046),
-    (0.17170678079, 0.46841365099, 0.57829320431, 1.2815864086),
-    (-0.031586438417, 0.67170679569, 0.78158640862, 1.0782932043),
-    (0.20901179314, 0.37703540921, 0.54098820686, 1.3729646206),
-    (-0.12298947573, 0.70902007818, 0.87298947573, 1.0409798622),
-    (0.043926924467, 0.54392695427, 0.70607304573, 1.2060730457),
-    (0.33749997616, -0.16249996424, 0.91250002384, 0.41249996424),
-    (0.42170679569, -0.28158634901, 0.82829320431, 0.53158634901),
-    (0.21841356158, -0.078293174505, 1.0315864086, 0.32829317451),
-    (0.45901179314, -0.37296459079, 0.79098820686, 0.62296462059),
-    (0.12701052427, -0.040979906917, 1.1229894161, 0.29097992182),
-    (0.29392692447, -0.20607307553, 0.95607304573, 0.45607307553),
-    (0.33749997616, 0.087500035763, 0.91250002384, 0.66249996424),
-    (0.42170679569, -0.03158634901, 0.82829320431, 0.78158634901),
-    (0.21841356158, 0.17170682549, 1.0315864086, 0.57829320431),
-    (0.45901179314, -0.12296459079, 0.79098820686, 0.87296462059),
-    (0.12701052427, 0.20902009308, 1.1229894161, 0.54097992182),
-    (0.29392692447, 0.043926924467, 0.95607304573, 0.70607304573),
-    (0.33749997616, 0.33750003576, 0.91250002384, 0.91249996424),
-    (0.42170679569, 0.21841365099, 0.82829320431, 1.0315864086),
-    (0.21841356158, 0.42170682549, 1.0315864086, 0.82829320431),
-    (0.45901179314, 0.12703540921, 0.79098820686, 1.1229646206),
-    (0.12701052427, 0.45902007818, 1.1229894161, 0.79097992182),
-    (0.29392692447, 0.29392692447, 0.95607304573, 0.95607304573),
-    (0.33749997616, 0.58750003576, 0.91250002384, 1.1624999046),
-    (0.42170679569, 0.46841365099, 0.82829320431, 1.2815864086),
-    (0.21841356158, 0.67170679569, 1.0315864086, 1.0782932043),
-    (0.45901179314, 0.37703540921, 0.79098820686, 1.3729646206),
-    (0.12701052427, 0.70902007818, 1.1229894161, 1.0409798622),
-    (0.29392692447, 0.54392695427, 0.95607304573, 1.2060730457),
-    (0.58749997616, -0.16249996424, 1.1625000238, 0.41249996424),
-    (0.67170679569, -0.28158634901, 1.0782932043, 0.53158634901),
-    (0.46841356158, -0.078293174505, 1.2815864086, 0.32829317451),
-    (0.70901179314, -0.37296459079, 1.0409882069, 0.62296462059),
-    (0.37701052427, -0.040979906917, 1.3729894161, 0.29097992182),
-    (0.54392695427, -0.20607307553, 1.2060730457, 0.45607307553),
-    (0.58749997616, 0.087500035763, 1.1625000238, 0.66249996424),
-    (0.67170679569, -0.03158634901, 1.0782932043, 0.78158634901),
-    (0.46841356158, 0.17170682549, 1.2815864086, 0.57829320431),
-    (0.70901179314, -0.12296459079, 1.0409882069, 0.87296462059),
-    (0.37701052427, 0.20902009308, 1.3729894161, 0.54097992182),
-    (0.54392695427, 0.043926924467, 1.2060730457, 0.70607304573),
-    (0.58749997616, 0.33750003576, 1.1625000238, 0.91249996424),
-    (0.67170679569, 0.21841365099, 1.0782932043, 1.0315864086),
-    (0.46841356158, 0.42170682549, 1.2815864086, 0.82829320431),
-    (0.70901179314, 0.12703540921, 1.0409882069, 1.1229646206),
-    (0.37701052427, 0.45902007818, 1.3729894161, 0.79097992182),
-    (0.54392695427, 0.29392692447, 1.2060730457, 0.95607304573),
-    (0.58749997616, 0.58750003576, 1.1625000238, 1.1624999046),
-    (0.67170679569, 0.46841365099, 1.0782932043, 1.2815864086),
-    (0.46841356158, 0.67170679569, 1.2815864086, 1.0782932043),
-    (0.70901179314, 0.37703540921, 1.0409882069, 1.3729646206),
-    (0.37701052427, 0.70902007818, 1.3729894161, 1.0409798622),
-    (0.54392695427, 0.54392695427, 1.2060730457, 1.2060730457),
-    (-0.13125002384, -0.13124996424, 0.63125002384, 0.63124996424),
-    (-0.019584476948, -0.28916883469, 0.51958447695, 0.78916883469),
-    (-0.2891689539, -0.019584417343, 0.7891689539, 0.51958441734),
-    (0.029885202646, -0.41034436226, 0.47011479735, 0.91034436226),
-    (-0.41037738323, 0.029896214604, 0.91037738323, 0.4701038003),
-    (-0.17555111647, -0.17555111647, 0.67555111647, 0.67555111647),
-    (-0.13125002384, 0.36875003576, 0.63125002384, 1.1312499046),
-    (-0.019584476948, 0.21083116531, 0.51958447695, 1.2891688347),
-    (-0.2891689539, 0.48041558266, 0.7891689539, 1.0195844173),
-    (0.029885202646, 0.089655637741, 0.47011479735, 1.4103443623),
-    (-0.41037738323, 0.5298961997, 0.91037738323, 0.9701038003),
-    (-0.17555111647, 0.32444888353, 0.67555111647, 1.1755511761),
-    (0.36874997616, -0.13124996424, 1.1312500238, 0.63124996424),
-    (0.48041552305, -0.28916883469, 1.0195844173, 0.78916883469),
-    (0.2108310461, -0.019584417343, 1.2891689539, 0.51958441734),
-    (0.52988517284, -0.41034436226, 0.97011482716, 0.91034436226),
-    (0.089622616768, 0.029896214604, 1.4103773832, 0.4701038003),
-    (0.32444888353, -0.17555111647, 1.1755511761, 0.67555111647),
-    (0.36874997616, 0.36875003576, 1.1312500238, 1.1312499046),
-    (0.48041552305, 0.21083116531, 1.0195844173, 1.2891688347),
-    (0.2108310461, 0.48041558266, 1.2891689539, 1.0195844173),
-    (0.52988517284, 0.089655637741, 0.97011482716, 1.4103443623),
-    (0.089622616768, 0.5298961997, 1.4103773832, 0.9701038003),
-    (0.32444888353, 0.32444888353, 1.1755511761, 1.1755511761),
-    (0.024999976158, 0.025000035763, 0.97500002384, 0.97499996424),
-    (0.16412425041, -0.17175137997, 0.83587574959, 1.17175138),
-    (-0.17175149918, 0.16412431002, 1.1717514992, 0.83587568998),
-    (0.22575861216, -0.32272410393, 0.77424138784, 1.3227241039),
-    (-0.32276523113, 0.22577232122, 1.3227652311, 0.77422767878),
-    (0.012660294771, 0.012660294771, 0.98733973503, 0.98733973503),
-)
+Anchors are stored in object_detection_anchors.bin in center form, as 4
+consecutive columns of NUM_ANCHORS little-endian float64 values: y centers,
+x centers, heights and widths. The file is only read on first use.
+"""
+
+import array
+import os
+import sys
+
+NUM_ANCHORS = 1278
+
+_ANCHORS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'object_detection_anchors.bin')
+_anchor_centers = None
+
+
+def _load_anchor_centers(path):
+    values = array.array('d')
+    with open(path, 'rb') as f:
+        values.frombytes(f.read())
+    if sys.byteorder != 'little':
+        values.byteswap()
+    assert len(values) == 4 * NUM_ANCHORS
+    view = memoryview(values)
+    return tuple(view[i * NUM_ANCHORS:(i + 1) * NUM_ANCHORS] for i in range(4))
+
+
+def anchor_centers():
+    """Returns anchors in center form.
+
+    Returns:
+      A tuple of 4 sequences of NUM_ANCHORS floats: anchor y centers,
+      x centers, heights and widths.
+    """
+    global _anchor_centers
+    if _anchor_centers is None:
+        _anchor_centers = _load_anchor_centers(_ANCHORS_FILE)
+    return _anchor_centers
@@ -1,9 +1,88 @@
-"""Utility to load compute graphs from diffrent sources."""
+"""Utility to load compute graphs and label tables from diffrent sources."""
 
+import functools
+import heapq
+import itertools
+import operator
 import os
+import threading
+
+_graph_cache = {}  # Path -> (mtime, size, compute graph).
+_graph_cache_lock = threading.Lock()
 
 
 def load_compute_graph(name):
-    path = os.environ.get('VISION_BONNET_MODELS_PATH', '/opt/aiy/models')
-    with open(os.path.join(path, name), 'rb') as f:
-        return f.read()
+    """Returns compute graph file contents.
+
+    Contents are cached by path and reread only if the file's modification
+    time or size changed, so creating model descriptors repeatedly doesn't
+    read multi-megabyte files every time.
+    """
+    path = os.path.join(
+        os.environ.get('VISION_BONNET_MODELS_PATH', '/opt/aiy/models'), name)
+    stat = os.stat(path)
+    with _graph_cache_lock:
+        cached = _graph_cache.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        with open(path, 'rb') as f:
+            graph = f.read()
+        _graph_cache[path] = (stat.st_mtime_ns, stat.st_size, graph)
+        return graph
+
+
+class LabelTable(object):
+    """Maps class index to class label, e.g. 'lynx/catamount'.
+
+    Labels are stored in a UTF-8 text file next to this module, one line per
+    class index, alternative names of the same class joined by '/'. The file
+    is read on first lookup and labels are kept as ready-to-use strings, so
+    lookups don't allocate.
+    """
+
+    def __init__(self, name):
+        self._path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  name)
+        self._labels = None
+
+    @property
+    def labels(self):
+        """Tuple of all labels ordered by class index."""
+        if self._labels is None:
+            with open(self._path, encoding='utf-8') as f:
+                self._labels = tuple(line.rstrip('\n') for line in f)
+        return self._labels
+
+    def __getitem__(self, index):
+        return self.labels[index]
+
+    def __len__(self):
+        return len(self.labels)
+
+
+def get_top_classes(probs, labels, max_num_objects=None,
+                    object_prob_threshold=0.0):
+    """Returns classes with highest probabilities.
+
+    Only probabilities above threshold are considered, and only the top
+    max_num_objects of them are selected instead of sorting all of them.
+
+    Args:
+      probs: sequence of floats, probability of each class index.
+      labels: LabelTable or sequence of strings, label of each class index.
+      max_num_objects: int; max number of classes to return.
+      object_prob_threshold: float; min probability of each returned class.
+
+    Returns:
+      A list of (label: string, probability: float) pairs ordered by
+      probability from highest to lowest.
+    """
+    is_above_threshold = functools.partial(operator.lt, object_prob_threshold)
+    indices = itertools.compress(range(len(probs)),
+                                 map(is_above_threshold, probs))
+    if max_num_objects is None:
+        indices = sorted(indices, key=probs.__getitem__, reverse=True)
+    else:
+        indices = heapq.nlargest(max_num_objects, indices,
+                                 key=probs.__getitem__)
+    return [(labels[index], probs[index]) for index in indices]
@@ -0,0 +1,142 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Record and replay of camera inference sessions.
+
+Recordings are append-only files of InferenceResult messages (frame index,
+timestamp and output tensors included), each one prefixed by its size as
+4 bytes big-endian unsigned int. Record a session:
+
+    with CameraInference(face_detection.model()) as inference:
+        for result in recording.record(inference.run(), 'faces.rec'):
+            ...
+
+Replay it with unmodified code, without camera or VisionBonnet, by setting
+VISION_BONNET_REPLAY=faces.rec. Results are returned at the recorded pace,
+VISION_BONNET_REPLAY_SPEED=4 plays them 4 times faster, 0 as fast as
+possible.
+"""
+
+import contextlib
+import struct
+import time
+
+from aiy.vision.proto import protocol_pb2
+
+
+class ResultWriter(object):
+    """Appends InferenceResults to a recording file."""
+
+    def __init__(self, path):
+        self._file = open(path, 'ab')
+
+    def write(self, result):
+        data = result.SerializeToString()
+        self._file.write(struct.pack('!I', len(data)))
+        self._file.write(data)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+
+def read_results(path):
+    """Yields InferenceResults from a recording file."""
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(4)
+            if len(header) < 4:
+                break
+            size = struct.unpack('!I', header)[0]
+            data = f.read(size)
+            if len(data) < size:
+                break  # Truncated last record, e.g. recording interrupted.
+            result = protocol_pb2.InferenceResult()
+            result.ParseFromString(data)
+            yield result
+
+
+def record(results, path):
+    """Appends every result to recording file and yields it unchanged."""
+    with ResultWriter(path) as writer:
+        for result in results:
+            writer.write(result)
+            yield result
+
+
+class ReplayTransport(object):
+    """Transport answering InferenceEngine requests from a recording.
+
+    Camera inference returns recorded results in order, paced by their
+    recorded timestamps. Model loading, camera start/stop and state requests
+    always succeed, image inference is not supported.
+    """
+
+    def __init__(self, path, speed=1.0):
+        """Opens recording.
+
+        Args:
+          path: string, recording file.
+          speed: float, replay speed relative to recorded pace, 0 means as
+            fast as possible.
+        """
+        self._results = read_results(path)
+        self._speed = speed
+        self._start = None  # (host time, recorded timestamp) of first result.
+
+    def _next_result(self, response):
+        result = next(self._results, None)
+        if result is None:
+            response.status.code = protocol_pb2.Response.Status.ERROR
+            response.status.message = 'End of recording.'
+            return
+
+        timestamp = result.frame.timestamp_us / 1000000.0
+        if self._start is None:
+            self._start = (time.monotonic(), timestamp)
+        elif self._speed:
+            start_time, start_timestamp = self._start
+            delay = (start_time + (timestamp - start_timestamp) / self._speed -
+                     time.monotonic())
+            if delay > 0:
+                time.sleep(delay)
+        response.inference_result.CopyFrom(result)
+
+    def send(self, request):
+        message = protocol_pb2.Request()
+        message.ParseFromString(bytes(request))
+        response = protocol_pb2.Response()
+        name = message.WhichOneof('request')
+        if name == 'camera_inference':
+            self._next_result(response)
+        elif name == 'get_camera_state':
+            response.camera_state.running = True
+        elif name == 'get_firmware_info':
+            response.firmware_info.major_version = 1
+            response.firmware_info.minor_version = 0
+        elif name == 'image_inference':
+            response.status.code = protocol_pb2.Response.Status.ERROR
+            response.status.message = 'Image inference is not replayed.'
+        return response.SerializeToString()
+
+    @contextlib.contextmanager
+    def lease(self, request):
+        yield self.send(request)
+
+    def close(self):
+        self._results.close()
@@ -0,0 +1,158 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tracks detected faces and objects across frames.
+
+get_faces and get_objects return independent lists for every frame. Tracker
+matches them to the previous frame's tracks by bounding box overlap (IoU)
+and gives each tracked face or object a stable id, e.g. to react to every
+new face only once:
+
+    tracker = Tracker()
+    for result in inference.run():
+        faces = face_detection.get_faces(result)
+        for face, track in zip(faces, tracker.update(faces)):
+            if track.hits == 1:
+                print('New face #%d' % track.id)
+"""
+
+import bisect
+import itertools
+
+
+def _corners(box):
+    x, y, width, height = box
+    return (x, y, x + width, y + height, width * height)
+
+
+class Track(object):
+    """Face or object tracked across frames."""
+
+    def __init__(self, track_id, item):
+        self.id = track_id
+        self.item = item  # Latest matched Face or Object.
+        self.bounding_box = tuple(item.bounding_box)  # Smoothed.
+        self.hits = 1  # Number of frames the track was matched in.
+        self.misses = 0  # Number of frames since the track was last matched.
+
+    def _update(self, item, smoothing):
+        self.item = item
+        self.bounding_box = tuple(
+            old + smoothing * (new - old)
+            for old, new in zip(self.bounding_box, item.bounding_box))
+        self.hits += 1
+        self.misses = 0
+
+    def __str__(self):
+        return 'id=%d, hits=%d, misses=%d, bbox=%s' % (
+            self.id, self.hits, self.misses, str(self.bounding_box))
+
+
+class Tracker(object):
+    """Greedy IoU tracker of Face or Object results.
+
+    Every frame, pairs of (track, detection) are matched in order of
+    decreasing overlap, like in non maximum suppression. Objects are only
+    matched to tracks of the same kind. Unmatched detections start new tracks,
+    tracks unmatched for more than max_misses frames expire.
+    """
+
+    def __init__(self, iou_threshold=0.3, max_misses=5, smoothing=0.5):
+        """Creates a new tracker.
+
+        Args:
+          iou_threshold: float, min overlap of a detection with a track to
+            match it.
+          max_misses: int, number of consecutive frames a track survives
+            without matching detections.
+          smoothing: float in (0, 1], weight of the new bounding box in the
+            smoothed track bounding box, 1 means no smoothing.
+        """
+        self._iou_threshold = iou_threshold
+        self._max_misses = max_misses
+        self._smoothing = smoothing
+        self._tracks = []
+        self._ids = itertools.count()
+
+    @property
+    def tracks(self):
+        """All live tracks, including ones not matched in the last frame."""
+        return list(self._tracks)
+
+    def update(self, items):
+        """Matches detections of a new frame to tracks.
+
+        Args:
+          items: list of Face or Object.
+
+        Returns:
+          List of Track, one for each item in the same order.
+        """
+        # Detections of every kind as (xmins, boxes sorted by xmin, max width),
+        # so a track is compared only to detections of its kind overlapping it
+        # horizontally, like in object_detection._non_maximum_suppression.
+        boxes_by_kind = {}
+        for i, item in enumerate(items):
+            boxes_by_kind.setdefault(getattr(item, 'kind', None), []).append(
+                _corners(item.bounding_box) + (i,))
+        kinds = {}
+        for kind, boxes in boxes_by_kind.items():
+            boxes.sort()
+            kinds[kind] = ([box[0] for box in boxes], boxes,
+                           max(box[2] - box[0] for box in boxes))
+
+        threshold = self._iou_threshold
+        pairs = []
+        for t, track in enumerate(self._tracks):
+            candidates = kinds.get(getattr(track.item, 'kind', None))
+            if candidates is None:
+                continue
+            xmins, boxes, max_width = candidates
+            xmin1, ymin1, xmax1, ymax1, area1 = _corners(track.bounding_box)
+            begin = bisect.bisect_left(xmins, xmin1 - max_width)
+            end = bisect.bisect_left(xmins, xmax1)
+            for xmin2, ymin2, xmax2, ymax2, area2, i in boxes[begin:end]:
+                width = min(xmax1, xmax2) - max(xmin1, xmin2)
+                if width <= 0:
+                    continue
+                height = min(ymax1, ymax2) - max(ymin1, ymin2)
+                if height <= 0:
+                    continue
+                intersection = width * height
+                iou = intersection / (area1 + area2 - intersection)
+                if iou >= threshold:
+                    pairs.append((iou, t, i))
+        pairs.sort(reverse=True)
+
+        matched = [None] * len(items)
+        matched_tracks = set()
+        for _, t, i in pairs:
+            if matched[i] is None and t not in matched_tracks:
+                track = self._tracks[t]
+                track._update(items[i], self._smoothing)
+                matched[i] = track
+                matched_tracks.add(t)
+
+        tracks = []
+        for t, track in enumerate(self._tracks):
+            if t not in matched_tracks:
+                track.misses += 1
+                if track.misses > self._max_misses:
+                    continue
+            tracks.append(track)
+        for i, item in enumerate(items):
+            if matched[i] is None:
+                matched[i] = Track(next(self._ids), item)
+                tracks.append(matched[i])
+        self._tracks = tracks
+        return matched
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Batch image inference demo.
+
+ - Loads the model once and runs it on every image in the given files or
+   directories. Images are resized to model input size on the host.
+ - Prints results for every image and overall throughput in images/sec.
+
+Example:
+batch_inference.py --model face_detection --input ~/Pictures
+"""
+import argparse
+import os
+import time
+from PIL import Image
+
+from aiy.vision.inference import ImageInference
+from aiy.vision.models import face_detection
+from aiy.vision.models import image_classification
+from aiy.vision.models import object_detection
+
+
+def _get_classes(result):
+    return image_classification.get_classes(result, max_num_objects=3,
+                                            object_prob_threshold=0.1)
+
+
+MODELS = {
+    'face_detection': (face_detection.model, face_detection.get_faces),
+    'image_classification': (image_classification.model, _get_classes),
+    'object_detection': (object_detection.model, object_detection.get_objects),
+}
+
+
+def _image_paths(inputs):
+    for path in inputs:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def _images(paths, input_shape, scales):
+    # Runs on the background thread preparing requests, so image decoding
+    # overlaps with inference of the previous image.
+    _, height, width, _ = input_shape
+    for path in paths:
+        image = Image.open(path)
+        original_width, original_height = image.size
+        if width and height:
+            # JPEG images are decoded at a smaller scale if still larger than
+            # model input size, much faster than decoding in full size.
+            image.draft('RGB', (width, height))
+        # Results are in coordinates of the decoded image.
+        scales.append((original_width / image.width,
+                       original_height / image.height))
+        yield image.convert('RGB')
+
+
+def _scale(item, scale):
+    # Maps bounding box of a face or object to original image coordinates.
+    bounding_box = getattr(item, 'bounding_box', None)
+    if bounding_box is not None:
+        x, y, width, height = bounding_box
+        sx, sy = scale
+        box = (x * sx, y * sy, width * sx, height * sy)
+        if isinstance(x, int):
+            box = tuple(int(round(v)) for v in box)
+        item.bounding_box = box
+    return item
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--model',
+        '-m',
+        dest='model',
+        choices=sorted(MODELS),
+        default='face_detection',
+        help='Model to run.')
+    parser.add_argument(
+        '--input',
+        '-i',
+        dest='input',
+        nargs='+',
+        required=True,
+        help='Image files or directories of image files.')
+    args = parser.parse_args()
+
+    model, decode = MODELS[args.model]
+    paths = list(_image_paths(args.input))
+    descriptor = model()
+    with ImageInference(descriptor) as inference:
+        start = time.monotonic()
+        scales = []
+        images = _images(paths, descriptor.input_shape, scales)
+        results = inference.run_batch(images, resize=True)
+        for i, (path, result) in enumerate(zip(paths, results)):
+            # Image i was decoded before its result came back.
+            items = (_scale(x, scales[i]) for x in decode(result))
+            print('%s: %s' % (path, ', '.join(str(x) for x in items)))
+        duration = time.monotonic() - start
+
+    print('%d images in %.1f s, %.1f images/s' %
+          (len(paths), duration, len(paths) / duration if duration else 0.0))
+
+
+if __name__ == '__main__':
+    main()
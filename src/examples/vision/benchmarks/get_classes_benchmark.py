@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Classification post-processing benchmark.
+
+Measures per-frame cost of get_classes on synthetic model outputs, i.e. the
+host-side work done for every result in loops like
+image_classification_camera.py. Doesn't need VisionBonnet hardware.
+
+Example:
+get_classes_benchmark.py --num_frames 1000 --num_objects 3
+"""
+import argparse
+import random
+import time
+
+from aiy.vision.models import dish_classifier
+from aiy.vision.models import image_classification
+from aiy.vision.proto import protocol_pb2
+
+
+def make_result(model_name, tensor_name, depth):
+    """Returns InferenceResult with random softmax-like probabilities."""
+    weights = [random.random() ** 8 for _ in range(depth)]
+    total = sum(weights)
+
+    result = protocol_pb2.InferenceResult()
+    result.model_name = model_name
+    tensor = result.tensors[tensor_name]
+    tensor.shape.batch = 1
+    tensor.shape.height = 1
+    tensor.shape.width = 1
+    tensor.shape.depth = depth
+    tensor.data.extend(weight / total for weight in weights)
+    return result
+
+
+def benchmark(name, get_classes, result, num_frames, **kwargs):
+    get_classes(result, **kwargs)  # Warm up, e.g. load labels.
+    # A new result for every frame, as in a camera loop, so tensor data cached
+    # by get_tensor for one result isn't reused by the next frames.
+    results = []
+    for _ in range(num_frames):
+        results.append(protocol_pb2.InferenceResult())
+        results[-1].CopyFrom(result)
+    start = time.monotonic()
+    for frame_result in results:
+        get_classes(frame_result, **kwargs)
+    duration = time.monotonic() - start
+    print('%-40s %8.3f ms/frame' % (name, 1000.0 * duration / num_frames))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--num_frames',
+        '-n',
+        type=int,
+        dest='num_frames',
+        default=1000,
+        help='Number of frames to process.')
+    parser.add_argument(
+        '--num_objects',
+        '-c',
+        type=int,
+        dest='num_objects',
+        default=3,
+        help='Number of classes to return per frame.')
+    parser.add_argument(
+        '--threshold',
+        '-t',
+        type=float,
+        dest='threshold',
+        default=0.0,
+        help='Min probability of returned classes.')
+    args = parser.parse_args()
+
+    cases = (
+        ('image_classification', image_classification.get_classes,
+         make_result(image_classification.MOBILENET,
+                     'MobilenetV1/Predictions/Softmax', 1001)),
+        ('dish_classifier', dish_classifier.get_classes,
+         make_result('dish_classifier', 'MobilenetV1/Predictions/Softmax', 2024)),
+    )
+    for name, get_classes, result in cases:
+        benchmark('%s (all classes)' % name, get_classes, result, args.num_frames,
+                  object_prob_threshold=args.threshold)
+        benchmark('%s (top %d)' % (name, args.num_objects), get_classes, result,
+                  args.num_frames, max_num_objects=args.num_objects,
+                  object_prob_threshold=args.threshold)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Camera inference benchmark against the local VisionBonnet emulator.
+
+Runs CameraInference with each model against an in-process emulator and
+reports frame rate, request latency and decode time per frame. Doesn't need
+VisionBonnet hardware or model files, but must run on a non-ARM host, as ARM
+hosts always talk to VisionBonnet over SPI.
+
+Example:
+inference_benchmark.py --num_frames 100 --fps 60 --latency_ms 10
+"""
+import argparse
+import os
+import time
+
+from aiy.vision.emulator import BonnetEmulator
+from aiy.vision.inference import CameraInference
+from aiy.vision.inference import ModelDescriptor
+from aiy.vision.models import face_detection
+from aiy.vision.models import image_classification
+from aiy.vision.models import object_detection
+
+# Compute graphs are not needed by the emulator, only model names matter.
+MODELS = (
+    (ModelDescriptor('FaceDetection', (1, 0, 0, 3), (0, 0), None),
+     face_detection.get_faces),
+    (ModelDescriptor('object_detection', (1, 256, 256, 3), (128.0, 128.0), None),
+     object_detection.get_objects),
+    (ModelDescriptor(image_classification.MOBILENET, (1, 160, 160, 3),
+                     (128.0, 128.0), None),
+     image_classification.get_classes),
+)
+
+
+def benchmark(descriptor, decode, num_frames, queue_size):
+    request_time = 0.0
+    decode_time = 0.0
+    with CameraInference(descriptor) as inference:
+        start = time.monotonic()
+        results = inference.run(queue_size)
+        for _ in range(num_frames):
+            request_start = time.monotonic()
+            result = next(results)
+            decode_start = time.monotonic()
+            decode(result)
+            decode_end = time.monotonic()
+            request_time += decode_start - request_start
+            decode_time += decode_end - decode_start
+        duration = time.monotonic() - start
+        results.close()
+
+    print('%-32s %6.1f fps, wait %7.3f ms/frame, decode %7.3f ms/frame' %
+          (descriptor.name, num_frames / duration,
+           1000.0 * request_time / num_frames,
+           1000.0 * decode_time / num_frames))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--num_frames',
+        '-n',
+        type=int,
+        dest='num_frames',
+        default=100,
+        help='Number of frames to run per model.')
+    parser.add_argument(
+        '--fps',
+        type=float,
+        dest='fps',
+        default=30.0,
+        help='Emulated camera frame rate.')
+    parser.add_argument(
+        '--latency_ms',
+        type=float,
+        dest='latency_ms',
+        default=0.0,
+        help='Emulated latency of every request, in ms.')
+    parser.add_argument(
+        '--queue_size',
+        type=int,
+        dest='queue_size',
+        default=None,
+        help='Run pipelined with this queue size, see CameraInference.run.')
+    args = parser.parse_args()
+
+    with BonnetEmulator(port=0, fps=args.fps,
+                        latency_ms=args.latency_ms) as emulator:
+        emulator.start()
+        host, port = emulator.address
+        os.environ['VISION_BONNET_HOST'] = host
+        os.environ['VISION_BONNET_PORT'] = str(port)
+        for descriptor, decode in MODELS:
+            benchmark(descriptor, decode, args.num_frames, args.queue_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Socket transport benchmark.
+
+Runs round trips of the socket transport against a local loopback server
+standing in for VisionBonnet: the server answers every framed request with a
+framed response of fixed size. Reports round trips per second and throughput
+for several response sizes. Doesn't need VisionBonnet hardware.
+
+Example:
+socket_transport_benchmark.py --num_requests 200
+"""
+import argparse
+import socket
+import struct
+import threading
+import time
+
+from aiy._drivers._transport import _SocketTransport
+
+
+def _recvall(conn, size):
+    buf = bytearray(size)
+    view = memoryview(buf)
+    while view:
+        received = conn.recv_into(view)
+        if not received:
+            return None
+        view = view[received:]
+    return buf
+
+
+def serve(server, response_size):
+    """Answers each request with response_size bytes until disconnected."""
+    conn, _ = server.accept()
+    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    response = struct.pack('!I', response_size) + bytes(response_size)
+    with conn:
+        while True:
+            header = _recvall(conn, 4)
+            if header is None:
+                break
+            _recvall(conn, struct.unpack('!I', header)[0])
+            conn.sendall(response)
+
+
+def benchmark(request_size, response_size, num_requests):
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    thread = threading.Thread(target=serve, args=(server, response_size))
+    thread.start()
+
+    transport = _SocketTransport('127.0.0.1', server.getsockname()[1])
+    request = bytes(request_size)
+    start = time.monotonic()
+    for _ in range(num_requests):
+        with transport.lease(request) as response:
+            assert len(response) == response_size
+    duration = time.monotonic() - start
+    transport.close()
+    thread.join()
+    server.close()
+
+    megabytes = (request_size + response_size) * num_requests / 1e6
+    print('request %9d B, response %9d B: %8.1f requests/s, %8.1f MB/s' %
+          (request_size, response_size, num_requests / duration,
+           megabytes / duration))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--num_requests',
+        '-n',
+        type=int,
+        dest='num_requests',
+        default=200,
+        help='Number of round trips per response size.')
+    args = parser.parse_args()
+
+    # Camera inference (small request, small to medium response) and image
+    # inference (large request, medium response) like traffic.
+    for request_size, response_size in ((16, 1024), (16, 41 * 1024),
+                                        (16, 1024 * 1024),
+                                        (1640 * 1232 * 3, 41 * 1024)):
+        benchmark(request_size, response_size, args.num_requests)
+
+
+if __name__ == '__main__':
+    main()
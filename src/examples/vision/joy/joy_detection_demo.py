@@ -14,7 +14,6 @@
 # limitations under the License.
 """Joy detection demo."""
 import argparse
-import collections
 import io
 import logging
 import math
@@ -26,6 +25,7 @@ import time
 
 from aiy._drivers._hat import get_aiy_device_name
 from aiy.toneplayer import TonePlayer
+from aiy.vision.filters import MovingAverage
 from aiy.vision.inference import CameraInference
 from aiy.vision.leds import Leds
 from aiy.vision.leds import PrivacyLed
@@ -97,16 +97,6 @@ class AtomicValue(object):
             self._value = value
 
 
-class MovingAverage(object):
-
-    def __init__(self, size):
-        self._window = collections.deque(maxlen=size)
-
-    def next(self, value):
-        self._window.append(value)
-        return sum(self._window) / len(self._window)
-
-
 class Service(object):
 
     def __init__(self):
@@ -276,7 +266,7 @@ class JoyDetector(object):
                         faces = face_detection.get_faces(result)
                         photographer.update_faces(faces)
 
-                        joy_score = joy_score_moving_average.next(average_joy_score(faces))
+                        joy_score = joy_score_moving_average.update(average_joy_score(faces))
                         animator.update_joy_score(joy_score)
 
                         if joy_score > JOY_SCORE_PEAK > prev_joy_score:
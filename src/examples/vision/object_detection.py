@@ -28,27 +28,32 @@ from aiy.vision.inference import ImageInference
 from aiy.vision.models import object_detection
 
 
-def _crop_center(image):
-    width, height = image.size
-    size = min(width, height)
-    x, y = (width - size) / 2, (height - size) / 2
-    return image.crop((x, y, x + size, y + size)), (x, y)
-
-
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--input', '-i', dest='input', required=True)
     parser.add_argument('--output', '-o', dest='output')
+    parser.add_argument(
+        '--tile_size',
+        type=int,
+        dest='tile_size',
+        help='Detect in overlapping tiles of this size to find small objects '
+        'in large images, instead of in the center crop.')
     args = parser.parse_args()
 
     with ImageInference(object_detection.model()) as inference:
         image = Image.open(
             io.BytesIO(sys.stdin.buffer.read())
             if args.input == '-' else args.input)
-        image_center, offset = _crop_center(image)
+        if args.tile_size:
+            objs = object_detection.get_objects_tiled(
+                inference, image.convert('RGB'), args.tile_size)
+        else:
+            # Center crop is resized to model input size before sending it,
+            # bounding boxes are still in image coordinates.
+            result = inference.run(image, resize=True)
+            objs = object_detection.get_objects(result, 0.3)
         draw = ImageDraw.Draw(image)
-        result = inference.run(image_center)
-        for i, obj in enumerate(object_detection.get_objects(result, 0.3, offset)):
+        for i, obj in enumerate(objs):
             print('Object #%d: %s' % (i, str(obj)))
             x, y, width, height = obj.bounding_box
             draw.rectangle((x, y, x + width, y + height), outline='red')
@@ -6,6 +6,9 @@ setup(
     author='Peter Malkin',
     author_email='petermalkin@google.com',
     packages=find_packages(),
+    package_data={
+        'aiy.vision.models': ['*.bin', '*.txt'],
+    },
     url="https://aiyprojects.withgoogle.com/",
     license='LICENSE.txt',
     description="AIY Python API",
@@ -29,6 +32,10 @@ setup(
     python_requires='~=3.5',
     scripts=[
         "examples/vision/annotator.py",
+        "examples/vision/benchmarks/get_classes_benchmark.py",
+        "examples/vision/benchmarks/inference_benchmark.py",
+        "examples/vision/benchmarks/socket_transport_benchmark.py",
+        "examples/vision/batch_inference.py",
         "examples/vision/buzzer/buzzer_demo.py",
         "examples/vision/buzzer/buzzer_tracker_demo.py",
         "examples/vision/dish_classifier.py",